@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+#
+#       benchmarks.bench_lists.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the single pass list scanner against the individual predicates.
+
+Every test data string and every docstring in the repository is checked for
+lists in each docstring style, first by trying each list predicate in turn the
+way is_type_of_list() used to, then with the single pass scanner.
+
+Run from the repository root with:
+
+    python benchmarks/bench_lists.py [--repeat N]
+"""
+
+# Standard Library Imports
+import argparse
+import ast
+import contextlib
+import glob
+import sys
+import timeit
+
+if sys.version_info >= (3, 11):
+    # Standard Library Imports
+    import tomllib
+else:
+    # Third Party Imports
+    import tomli as tomllib
+
+# docformatter Package Imports
+from docformatter.patterns import (
+    is_alembic_header,
+    is_bullet_list,
+    is_enumerated_list,
+    is_epytext_field_list,
+    is_field_list,
+    is_google_field_list,
+    is_heuristic_list,
+    is_inline_math,
+    is_literal_block,
+    is_numpy_field_list,
+    is_numpy_section_header,
+    is_option_list,
+    is_rest_section_header,
+    is_sphinx_field_list,
+    is_type_of_list,
+    is_user_defined_field_list,
+)
+
+STYLES = ("sphinx", "epytext", "numpy", "google")
+"""The docstring styles to check each text in."""
+
+
+def get_docstrings():
+    """Return every test data string and docstring in the repository."""
+    _docstrings = []
+    for _filename in sorted(glob.glob("tests/_data/string_files/*.toml")):
+        with open(_filename, "rb") as _file:
+            _data = tomllib.load(_file)
+
+        for _test in _data.values():
+            _docstrings.extend(
+                _value for _value in _test.values() if isinstance(_value, str)
+            )
+
+    for _filename in sorted(glob.glob("**/*.py", recursive=True)):
+        with open(_filename, encoding="utf-8") as _file:
+            _tree = ast.parse(_file.read())
+
+        for _node in ast.walk(_tree):
+            with contextlib.suppress(TypeError):
+                _docstring = ast.get_docstring(_node, clean=False)
+                if _docstring:
+                    _docstrings.append(_docstring)
+
+    return _docstrings
+
+
+def is_type_of_list_by_predicates(text, strict, style):
+    """Return True if any list predicate matches, trying each in turn."""
+    split_lines = text.rstrip().splitlines()
+
+    if is_heuristic_list(text, strict):
+        return True
+
+    if is_field_list(text, style):
+        return False
+
+    if len(split_lines) < 2:
+        windows = ["\n".join(split_lines)] if split_lines else []
+    else:
+        windows = [
+            "\n".join(split_lines[i : i + 2]) for i in range(len(split_lines) - 1)
+        ]
+    for window in windows:
+        if is_rest_section_header(window) or is_numpy_section_header(window):
+            return True
+
+    return any(
+        (
+            is_bullet_list(line)
+            or is_enumerated_list(line)
+            or is_option_list(line)
+            or is_epytext_field_list(line)
+            or is_sphinx_field_list(line)
+            or is_numpy_field_list(line)
+            or is_google_field_list(line)
+            or is_user_defined_field_list(line)
+            or is_literal_block(line)
+            or is_inline_math(line)
+            or is_alembic_header(line)
+        )
+        for line in split_lines
+    )
+
+
+def main():
+    """Print the time per docstring for each way of finding lists."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    docstrings = get_docstrings()
+    print(f"{len(docstrings)} docstrings, best of {args.repeat} runs\n")
+    print(f"{'style':<10} {'predicates':>12} {'scanner':>12} {'speed up':>10}")
+
+    for style in STYLES:
+        assert [
+            is_type_of_list_by_predicates(text, True, style) for text in docstrings
+        ] == [is_type_of_list(text, True, style) for text in docstrings]
+
+        _times = [
+            min(
+                timeit.repeat(
+                    lambda: [
+                        function(text, True, style)  # noqa: B023
+                        for text in docstrings
+                    ],
+                    repeat=args.repeat,
+                    number=3,
+                )
+            )
+            for function in (is_type_of_list_by_predicates, is_type_of_list)
+        ]
+        _per_docstring = 1e6 / (3 * len(docstrings))
+        print(
+            f"{style:<10} {_times[0] * _per_docstring:>9.1f} us "
+            f"{_times[1] * _per_docstring:>9.1f} us "
+            f"{_times[0] / _times[1]:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+#
+#       benchmarks.bench_patterns.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Microbenchmark the compiled pattern registry against module level re calls.
+
+Every line of every docstring in the test data is matched against each of the
+line patterns, first by passing the pattern string to re.match() as the
+patterns package used to, then with the bound match method of the pattern from
+the registry.
+
+Run from the repository root with:
+
+    python benchmarks/bench_patterns.py [--repeat N]
+"""
+
+# Standard Library Imports
+import argparse
+import glob
+import re
+import sys
+import timeit
+
+if sys.version_info >= (3, 11):
+    # Standard Library Imports
+    import tomllib
+else:
+    # Third Party Imports
+    import tomli as tomllib
+
+# docformatter Package Imports
+from docformatter import constants
+from docformatter.patterns import get_compiled_pattern
+
+LINE_REGEXES = {
+    "alembic": constants.ALEMBIC_REGEX,
+    "bullet": constants.BULLET_REGEX,
+    "enum": constants.ENUM_REGEX,
+    "epytext": constants.EPYTEXT_REGEX,
+    "google": constants.GOOGLE_REGEX,
+    "literal": constants.LITERAL_REGEX,
+    "numpy": constants.NUMPY_REGEX,
+    "option": constants.OPTION_REGEX,
+    "sphinx": constants.SPHINX_REGEX,
+    "url": constants.URL_REGEX,
+}
+"""The line patterns to benchmark."""
+
+
+def get_docstring_lines():
+    """Return every line of the test data strings."""
+    _lines = []
+    for _filename in sorted(glob.glob("tests/_data/string_files/*.toml")):
+        with open(_filename, "rb") as _file:
+            _data = tomllib.load(_file)
+
+        for _test in _data.values():
+            for _value in _test.values():
+                if isinstance(_value, str):
+                    _lines.extend(_value.splitlines())
+
+    return _lines
+
+
+def main():
+    """Print the time per line for each pattern and each way of matching."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = get_docstring_lines()
+    print(f"{len(lines)} lines, best of {args.repeat} runs\n")
+    print(f"{'pattern':<10} {'re.match':>12} {'registry':>12} {'speed up':>10}")
+
+    for name, regex in LINE_REGEXES.items():
+        match = get_compiled_pattern(regex).match
+        _module_time = min(
+            timeit.repeat(
+                lambda: [re.match(regex, line) for line in lines],  # noqa: B023
+                repeat=args.repeat,
+                number=10,
+            )
+        )
+        _registry_time = min(
+            timeit.repeat(
+                lambda: [match(line) for line in lines],  # noqa: B023
+                repeat=args.repeat,
+                number=10,
+            )
+        )
+        _per_line = 1e9 / (10 * len(lines))
+        print(
+            f"{name:<10} {_module_time * _per_line:>9.0f} ns "
+            f"{_registry_time * _per_line:>9.0f} ns "
+            f"{_module_time / _registry_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
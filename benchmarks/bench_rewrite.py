@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+#       benchmarks.bench_rewrite.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the token and span rewrite engines.
+
+Every Python file in the repository is formatted with each --rewrite-engine,
+with the formatted docstrings remembered between runs so only the time spent
+rewriting the source code is compared.  The files the two engines format
+differently are counted.
+
+Run from the repository root with:
+
+    python benchmarks/bench_rewrite.py [--repeat N]
+"""
+
+# Standard Library Imports
+import argparse
+import dataclasses
+import glob
+import io
+import timeit
+
+# docformatter Package Imports
+import docformatter.format as _format
+from docformatter.configuration import FormatOptions
+
+ENGINES = ("tokens", "spans")
+"""The rewrite engines to compare."""
+
+
+def get_sources():
+    """Return the text of every Python file in the repository."""
+    _sources = []
+    for _filename in sorted(glob.glob("**/*.py", recursive=True)):
+        with open(_filename, encoding="utf-8") as _file:
+            _sources.append(_file.read())
+
+    return _sources
+
+
+def main():
+    """Print the time per file for each rewrite engine."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sources = get_sources()
+    formatters = {
+        _engine: _format.Formatter(
+            argparse.Namespace(
+                **dataclasses.asdict(FormatOptions()), rewrite_engine=_engine
+            ),
+            stderror=io.StringIO(),
+            stdin=io.StringIO(),
+            stdout=io.StringIO(),
+        )
+        for _engine in ENGINES
+    }
+
+    def _do_format(formatter):
+        return [formatter.format_source(_source).formatted for _source in sources]
+
+    results = {_engine: _do_format(formatters[_engine]) for _engine in ENGINES}
+    _differences = sum(
+        _tokens != _spans for _tokens, _spans in zip(*results.values())
+    )
+    print(
+        f"{len(sources)} files, {_differences} formatted differently, "
+        f"best of {args.repeat} runs\n"
+    )
+
+    _per_file = 1e3 / len(sources)
+    for _engine, _formatter in formatters.items():
+        _time = min(
+            timeit.repeat(
+                lambda: _do_format(_formatter),  # noqa: B023
+                repeat=args.repeat,
+                number=1,
+            )
+        )
+        print(f"{_engine:<32} {_time * _per_file:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
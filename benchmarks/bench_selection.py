@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+#
+#       benchmarks.bench_selection.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark formatting runs that only select some of the docstrings.
+
+Every Python file in the repository is formatted in full, with --range, and
+with --docstring-length.  The time the newline classification of every
+docstring block would add to a run, which is now only done for the blocks
+selected for formatting, is shown for comparison.
+
+Run from the repository root with:
+
+    python benchmarks/bench_selection.py [--repeat N]
+"""
+
+# Standard Library Imports
+import argparse
+import dataclasses
+import glob
+import io
+import timeit
+import tokenize
+
+# docformatter Package Imports
+import docformatter.classify as _classify
+import docformatter.format as _format
+from docformatter.configuration import FormatOptions
+
+RUNS = {
+    "full": FormatOptions(),
+    "--range 1 10": FormatOptions(line_range=(1, 10)),
+    "--docstring-length 50 100": FormatOptions(length_range=(50, 100)),
+}
+"""The options for each formatting run."""
+
+
+def get_sources():
+    """Return the text of every Python file in the repository."""
+    _sources = []
+    for _filename in sorted(glob.glob("**/*.py", recursive=True)):
+        with open(_filename, encoding="utf-8") as _file:
+            _sources.append(_file.read())
+
+    return _sources
+
+
+def do_classify_every_block(blocks):
+    """Compute the newlines after every docstring block."""
+    for _tokens, _index in blocks:
+        _format._get_newlines_by_type(_tokens, _index)
+
+
+def main():
+    """Print the time per file for each formatting run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sources = get_sources()
+    formatter = _format.Formatter(
+        argparse.Namespace(**dataclasses.asdict(FormatOptions())),
+        stderror=io.StringIO(),
+        stdin=io.StringIO(),
+        stdout=io.StringIO(),
+    )
+
+    def _do_format(options):
+        # Formatted docstrings are forgotten so every run does the same work.
+        formatter.memo.clear()
+        for _source in sources:
+            formatter.format_source(_source, options)
+
+    blocks = []
+    for _source in sources:
+        _tokens = list(tokenize.generate_tokens(io.StringIO(_source).readline))
+        blocks.extend(
+            (_tokens, _block[1])
+            for _block in _classify.do_find_docstring_blocks(_tokens)
+        )
+
+    print(
+        f"{len(sources)} files, {len(blocks)} docstrings, "
+        f"best of {args.repeat} runs\n"
+    )
+
+    _per_file = 1e3 / len(sources)
+    for _name, _options in RUNS.items():
+        _time = min(
+            timeit.repeat(
+                lambda: _do_format(_options),  # noqa: B023
+                repeat=args.repeat,
+                number=1,
+            )
+        )
+        print(f"{_name:<32} {_time * _per_file:>8.2f} ms")
+
+    _time = min(
+        timeit.repeat(
+            lambda: do_classify_every_block(blocks), repeat=args.repeat, number=1
+        )
+    )
+    print(f"{'classify every block':<32} {_time * _per_file:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
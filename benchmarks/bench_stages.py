@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+#
+#       benchmarks.bench_stages.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark each stage of formatting a module and track it against a baseline.
+
+A synthetic module is generated in each docstring style by corpus.py and every
+stage of formatting it is timed on its own: tokenizing, finding the docstring
+blocks, formatting the docstrings, rewriting the tokens, untokenizing,
+splicing the edits of the span engine, and generating the diff.  Throughput is
+reported in thousands of source lines per second.
+
+Run from the repository root with:
+
+    python benchmarks/bench_stages.py run [--classes N] [--repeat N]
+        [--save FILE]
+    python benchmarks/bench_stages.py compare [--baseline FILE]
+        [--threshold FRACTION] [--repeat N]
+
+run prints the throughput of each stage and, with --save, stores it as a
+baseline.  compare runs the benchmark on the same corpus as the baseline and
+exits with 1 when the throughput of any stage dropped by more than the
+threshold.  Baselines depend on the machine and Python version, so save a new
+one before comparing on a different machine.
+"""
+
+# Standard Library Imports
+import argparse
+import dataclasses
+import difflib
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+import tokenize
+
+# docformatter Package Imports
+import docformatter.classify as _classify
+import docformatter.format as _format
+import docformatter.strings as _strings
+from docformatter.configuration import FormatOptions
+
+# Local Imports
+import corpus
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "stages.json")
+"""The baseline compared with by default."""
+
+STAGES = (
+    "tokenize",
+    "find blocks",
+    "format docstrings",
+    "rewrite tokens",
+    "untokenize",
+    "splice edits",
+    "diff",
+)
+"""The stages of formatting that are timed."""
+
+
+def get_formatter():
+    """Return a Formatter with the default options."""
+    return _format.Formatter(
+        argparse.Namespace(**dataclasses.asdict(FormatOptions())),
+        stderror=io.StringIO(),
+        stdin=io.StringIO(),
+        stdout=io.StringIO(),
+    )
+
+
+def do_time_stages(source, repeat):
+    """Return the best time in seconds of each stage of formatting the source.
+
+    Each stage is given the output of the stages before it, so the time of one
+    stage doesn't include the others.  Rewriting the tokens and splicing the
+    edits reuse the formatted docstrings.
+    """
+    formatter = get_formatter()
+
+    def _do_tokenize():
+        return list(
+            tokenize.generate_tokens(io.StringIO(source, newline="").readline)
+        )
+
+    tokens = _do_tokenize()
+
+    def _do_find_blocks():
+        return _classify.do_find_docstring_blocks(_classify.TokenStream(tokens))
+
+    blocks = _do_find_blocks()
+    stream = _classify.TokenStream(tokens)
+    docstrings = [
+        (
+            " " * tokens[_block[1]].start[1] if _block[2] != "module" else "",
+            tokens[_block[1]].string,
+        )
+        for _block in blocks
+    ]
+
+    def _do_format_docstrings():
+        for _indentation, _docstring in docstrings:
+            formatter._do_format_docstring(_indentation, _docstring)
+
+    def _do_rewrite_tokens():
+        return formatter._do_rewrite_docstring_blocks(stream)
+
+    new_tokens = _do_rewrite_tokens()
+
+    def _do_untokenize():
+        return tokenize.untokenize(new_tokens)
+
+    def _do_splice_edits():
+        return _strings.do_splice_edits(
+            source, formatter._get_docstring_edits(source, stream)
+        )
+
+    formatted = _do_untokenize()
+
+    def _do_diff():
+        return list(
+            difflib.unified_diff(
+                source.splitlines(),
+                formatted.splitlines(),
+                "before/module.py",
+                "after/module.py",
+                lineterm="",
+            )
+        )
+
+    _stages = dict(
+        zip(
+            STAGES,
+            (
+                _do_tokenize,
+                _do_find_blocks,
+                _do_format_docstrings,
+                _do_rewrite_tokens,
+                _do_untokenize,
+                _do_splice_edits,
+                _do_diff,
+            ),
+        )
+    )
+
+    return {
+        _name: min(timeit.repeat(_stage, repeat=repeat, number=1))
+        for _name, _stage in _stages.items()
+    }
+
+
+def do_run(corpus_options, repeat):
+    """Return the throughput of each stage over a module in every style.
+
+    Parameters
+    ----------
+    corpus_options : dict
+        The arguments of corpus.make_module().
+    repeat : int
+        The number of times each stage is timed.  The best time is used.
+
+    Returns
+    -------
+    dict
+        The corpus options, the number of lines, and the throughput of each
+        stage in thousands of lines per second.
+    """
+    _lines = 0
+    _times = dict.fromkeys(STAGES, 0.0)
+    for _style in corpus.STYLES:
+        _source = corpus.make_module(style=_style, **corpus_options)
+        _lines += _source.count("\n")
+        for _name, _time in do_time_stages(_source, repeat).items():
+            _times[_name] += _time
+
+    return {
+        "corpus": corpus_options,
+        "lines": _lines,
+        "python": platform.python_version(),
+        "throughput": {
+            _name: round(_lines / _time / 1e3, 1) for _name, _time in _times.items()
+        },
+    }
+
+
+def do_print_results(results, baseline=None):
+    """Print the throughput of each stage and its change from the baseline."""
+    print(
+        f"{results['lines']} lines in {len(corpus.STYLES)} modules, "
+        f"Python {results['python']}\n"
+    )
+    print(f"{'stage':<20} {'klines/s':>10}", end="")
+    print(f" {'baseline':>10} {'change':>8}" if baseline else "")
+    for _name, _throughput in results["throughput"].items():
+        print(f"{_name:<20} {_throughput:>10.1f}", end="")
+        if baseline:
+            _baseline = baseline["throughput"][_name]
+            print(f" {_baseline:>10.1f} {_throughput / _baseline - 1:>+8.1%}", end="")
+        print()
+
+
+def main():
+    """Run the benchmark or compare it with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="print the throughput of each stage")
+    run.add_argument("--classes", type=int, default=20)
+    run.add_argument("--methods", type=int, default=5)
+    run.add_argument("--attributes", type=int, default=3)
+    run.add_argument("--save", metavar="FILE", help="store the results as a baseline")
+
+    compare = commands.add_parser(
+        "compare", help="fail if any stage is slower than the baseline"
+    )
+    compare.add_argument("--baseline", metavar="FILE", default=BASELINE)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the largest allowed drop in throughput (default: 0.2)",
+    )
+
+    for _command in (run, compare):
+        _command.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = do_run(
+            {
+                "classes": args.classes,
+                "methods": args.methods,
+                "attributes": args.attributes,
+            },
+            args.repeat,
+        )
+        do_print_results(results)
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as _file:
+                json.dump(results, _file, indent=4)
+                _file.write("\n")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as _file:
+        baseline = json.load(_file)
+
+    results = do_run(baseline["corpus"], args.repeat)
+    do_print_results(results, baseline)
+
+    _slower = [
+        _name
+        for _name, _throughput in results["throughput"].items()
+        if _throughput < baseline["throughput"][_name] * (1 - args.threshold)
+    ]
+    if _slower:
+        print(
+            f"\nthroughput dropped by more than {args.threshold:.0%}: "
+            f"{', '.join(_slower)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+#
+#       benchmarks.corpus.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Generate synthetic Python modules for benchmarking docformatter.
+
+Each module has classes with attributes and methods, all with docstrings in
+one of the supported styles.  The docstrings need formatting: summaries are
+lower case without a period, descriptions are too long, and they contain URLs,
+field lists, and bullet and enumerated lists.  The same arguments always
+generate the same module.
+
+Write a module to standard out with:
+
+    python benchmarks/corpus.py [--classes N] [--methods N] [--attributes N]
+        [--style STYLE]
+"""
+
+# Standard Library Imports
+import argparse
+import random
+from typing import List
+
+STYLES = ("sphinx", "epytext", "numpy", "google")
+"""The docstring styles modules can be generated in."""
+
+WORDS = (
+    "the value of each item is read from the cache before the request is sent "
+    "and written back once the response arrives so later calls are cheaper "
+    "when a parser finds an error it stops and reports the line number with "
+    "a message describing what was expected instead of the token found"
+).split()
+"""The words descriptions are made of."""
+
+URLS = (
+    "https://docs.python.org/3/library/tokenize.html",
+    "https://peps.python.org/pep-0257/",
+    "https://www.sphinx-doc.org/en/master/usage/restructuredtext/basics.html",
+)
+"""The URLs descriptions link to."""
+
+
+def _get_sentence(rng: random.Random, length: int) -> str:
+    """Return a sentence of random words without a period."""
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _get_description(rng: random.Random) -> List[str]:
+    """Return the description lines of a docstring."""
+    _lines = [
+        _get_sentence(rng, rng.randint(20, 40)).capitalize() + ".",
+        "",
+        f"See {rng.choice(URLS)} for details.",
+    ]
+    if rng.random() < 0.5:
+        _lines.extend(
+            ["", *(f"- {_get_sentence(rng, rng.randint(4, 16))}" for _ in range(3))]
+        )
+    else:
+        _lines.extend(
+            [
+                "",
+                *(
+                    f"{_number}. {_get_sentence(rng, rng.randint(4, 16))}"
+                    for _number in range(1, 4)
+                ),
+            ]
+        )
+
+    return _lines
+
+
+def _get_fields(style: str, parameters: List[str]) -> List[str]:
+    """Return the field list describing the parameters in a docstring style."""
+    if style == "sphinx":
+        return [
+            *(f":param {_name}: the {_name} to use." for _name in parameters),
+            *(f":type {_name}: int" for _name in parameters),
+            ":return: the result.",
+            ":rtype: int",
+            ":raises ValueError: if the result is negative.",
+        ]
+
+    if style == "epytext":
+        return [
+            *(f"@param {_name}: the {_name} to use." for _name in parameters),
+            *(f"@type {_name}: int" for _name in parameters),
+            "@return: the result.",
+            "@rtype: int",
+            "@raise ValueError: if the result is negative.",
+        ]
+
+    if style == "numpy":
+        _lines = ["Parameters", "----------"]
+        for _name in parameters:
+            _lines.extend([f"{_name} : int", f"    The {_name} to use."])
+        return [
+            *_lines,
+            "",
+            "Returns",
+            "-------",
+            "int",
+            "    The result.",
+            "",
+            "Raises",
+            "------",
+            "ValueError",
+            "    If the result is negative.",
+        ]
+
+    return [
+        "Args:",
+        *(f"    {_name} (int): the {_name} to use." for _name in parameters),
+        "",
+        "Returns:",
+        "    int: the result.",
+        "",
+        "Raises:",
+        "    ValueError: if the result is negative.",
+    ]
+
+
+def _get_docstring(
+    rng: random.Random,
+    indentation: str,
+    style: str,
+    parameters: List[str],
+) -> str:
+    """Return an unformatted docstring indented for its definition."""
+    _lines = [
+        f'"""   {_get_sentence(rng, rng.randint(4, 10))}',
+        "",
+        *_get_description(rng),
+    ]
+    if parameters:
+        _lines.extend(["", *_get_fields(style, parameters)])
+    _lines.append('"""')
+
+    return "\n".join(
+        f"{indentation}{_line}" if _line else "" for _line in _lines
+    )
+
+
+def make_module(
+    classes: int = 10,
+    methods: int = 5,
+    attributes: int = 3,
+    style: str = "sphinx",
+    seed: int = 0,
+) -> str:
+    """Return the text of a synthetic module.
+
+    Parameters
+    ----------
+    classes : int
+        The number of classes in the module.
+    methods : int
+        The number of methods in each class.
+    attributes : int
+        The number of documented attributes in each class.
+    style : str
+        The docstring style of the field lists, one of STYLES.
+    seed : int
+        The seed for the random words, so the same module can be generated
+        again.
+
+    Returns
+    -------
+    str
+        The text of the module.
+    """
+    if style not in STYLES:
+        raise ValueError(f"unknown docstring style {style!r}")
+
+    _rng = random.Random(f"{style}-{seed}")
+    _lines = [_get_docstring(_rng, "", style, []), "import os", ""]
+
+    for _class in range(classes):
+        _lines.extend(["", f"class Generated{_class}:"])
+        _lines.append(_get_docstring(_rng, "    ", style, []))
+        for _attribute in range(attributes):
+            _lines.append(f"    attribute_{_attribute} = {_attribute}")
+            _lines.append(
+                f'    """   {_get_sentence(_rng, _rng.randint(4, 12))}   """'
+            )
+        for _method in range(methods):
+            _parameters = [f"arg_{_number}" for _number in range(_rng.randint(1, 3))]
+            _lines.extend(
+                ["", f"    def method_{_method}(self, {', '.join(_parameters)}):"]
+            )
+            _lines.append(_get_docstring(_rng, "        ", style, _parameters))
+            _lines.append(f"        return {' + '.join(_parameters)}")
+        _lines.append("")
+
+    return "\n".join(_lines) + "\n"
+
+
+def main():
+    """Write a synthetic module to standard out."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=10)
+    parser.add_argument("--methods", type=int, default=5)
+    parser.add_argument("--attributes", type=int, default=3)
+    parser.add_argument("--style", choices=STYLES, default="sphinx")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        make_module(
+            args.classes, args.methods, args.attributes, args.style, args.seed
+        ),
+        end="",
+    )
+
+
+if __name__ == "__main__":
+    main()
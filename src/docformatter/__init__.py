@@ -30,14 +30,19 @@ __all__ = ["__version__"]
 
 # docformatter Local Imports
 from .__pkginfo__ import __version__
+from .cache import Cache  # noqa F401
 from .classify import *  # noqa F403
+from .format import FormatOutcome  # noqa F401
 from .format import FormatResult  # noqa F403
 from .format import Formatter  # noqa F401
 from .patterns import *  # noqa F403
+from .profiler import Profiler  # noqa F401
+from .report import Reporter  # noqa F401
 from .strings import *  # noqa F403
 from .util import *  # noqa F403
 from .wrappers import *  # noqa F403
 
 # Have isort skip these they require the functions above.
 from .configuration import Configurater  # isort: skip # noqa F401
+from .configuration import FormatOptions  # isort: skip # noqa F401
 from .encode import Encoder  # isort: skip # noqa F401
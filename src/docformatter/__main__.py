@@ -28,6 +28,7 @@
 
 # Standard Library Imports
 import contextlib
+import io
 import signal
 import sys
 
@@ -39,15 +40,23 @@ import docformatter.format as _format
 def _help():
     """Print docformatter's help."""
     print("""\
-usage: docformatter [-h] [-i | -c] [-d] [-r] [-e [EXCLUDE ...]]
+usage: docformatter [-h] [-i | -c] [-d] [-r] [-e [EXCLUDE ...]] [-j N] [-v]
                     [-n [NON-CAP ...]] [-s [style]] [--rest-section-adorns REGEX]
                     [--black] [--wrap-summaries length]
                     [--wrap-descriptions length] [--force-wrap]
                     [--tab-width width] [--blank] [--pre-summary-newline]
                     [--pre-summary-space] [--make-summary-multi-line]
                     [--close-quotes-on-newline] [--range line line]
+                    [--range-file FILE] [--since REF] [--staged]
                     [--docstring-length length length] [--non-strict]
+                    [--rewrite-engine {tokens,spans}]
+                    [--diff-mode {full,docstrings}]
+                    [--format {text,json,sarif,github}]
+                    [--profile] [--profile-format {table,json}]
+                    [--cache-dir DIR] [--no-cache]
                     [--config CONFIG] [--version] files [files ...]
+       docformatter --daemon [--socket PATH]
+       docformatter --client [--socket PATH] [options] files [files ...]
 
 positional arguments:
   files                 files to format or '-' for standard in
@@ -62,6 +71,11 @@ options:
   -e [EXCLUDE ...], --exclude [EXCLUDE ...]
                         in recursive mode, exclude directories and files by
                         names
+  -j N, --jobs N        number of parallel processes to use when formatting
+                        files; set to 0 to use all available CPUs (default: 1)
+  -v, --verbose         report how the encoding of the formatted files was
+                        detected and how often formatted docstrings were
+                        reused (default: 0)
   -n [NON-CAP ...], --non-cap [NON-CAP ...]
                         list of words not to capitalize when they appear as the
                         first word in the summary
@@ -98,19 +112,99 @@ options:
                         one-line docstring wraps to two or more lines
                         (default: False)
   --range line line     apply docformatter to docstrings between these lines;
-                        line numbers are indexed at 1 (default: None)
+                        line numbers are indexed at 1; repeat to give more
+                        ranges (default: None)
+  --range-file FILE     apply docformatter to docstrings on the lines of each
+                        file listed in FILE as path:start-end (default: None)
+  --since REF           apply docformatter to docstrings on lines changed since
+                        this git reference (default: None)
+  --staged              apply docformatter to docstrings on lines staged for
+                        commit; with --since, compare the staged lines with that
+                        reference (default: False)
   --docstring-length length length
                         apply docformatter to docstrings of given length range
                         (default: None)
   --non-strict          don't strictly follow reST syntax to identify lists
                         (see issue #67) (default: False)
+  --rewrite-engine {tokens,spans}
+                        rebuild the source code from its tokens, or only
+                        replace the text of the docstrings and blank lines
+                        that change (default: tokens)
+  --diff-mode {full,docstrings}
+                        match every line of a file when showing its diff, or
+                        only the lines of the docstrings edited by the spans
+                        rewrite engine (default: full)
+  --format {text,json,sarif,github}
+                        report each file as text, as a line of JSON, as a
+                        SARIF result, or as a GitHub Actions annotation
+                        (default: text)
+  --profile             report the time spent in each stage of formatting and
+                        the slowest files and docstrings on standard error
+                        (default: False)
+  --profile-format {table,json}
+                        print the --profile report as a table or as JSON
+                        (default: table)
+  --cache-dir DIR       skip files recorded in this directory as already
+                        formatted with the same options (default: None)
+  --no-cache            don't read or write the --cache-dir cache
+                        (default: False)
   --config CONFIG       path to file containing docformatter options
   --version             show program's version number and exit
+
+daemon:
+  --daemon              keep running and format files for --client invocations
+                        over a Unix domain socket
+  --client              have a running --daemon format the files, or format them
+                        in this process if no daemon is running
+  --socket PATH         the socket the daemon listens on (default:
+                        $DOCFORMATTER_SOCKET or docformatter.sock in
+                        $XDG_RUNTIME_DIR or a docformatter-UID directory in
+                        the temporary directory)
 """)
 
 
 def _main(argv, standard_out, standard_error, standard_in):
     """Run internal main entry point."""
+    if "--daemon" in argv or "--client" in argv:
+        # The daemon and client are only imported when they are used.
+        # docformatter Package Imports
+        import docformatter.daemon as _daemon
+
+        _socket_path = _daemon.get_socket_path(argv)
+        if "--daemon" in argv:
+            return _daemon.Daemon(_socket_path).do_serve(standard_error)
+
+        # Standard input is read once, so it can still be formatted in this
+        # process if the daemon fails.
+        if "-" in argv[1:]:
+            standard_in = io.StringIO(standard_in.read())
+
+        # Format in this process when no daemon is running, when the socket
+        # can't be trusted, or when the daemon doesn't reply.
+        try:
+            _connection = _daemon.do_connect(_socket_path)
+        except PermissionError as exception:
+            print(
+                f"docformatter: not using the daemon: {exception}",
+                file=standard_error,
+            )
+        except OSError:
+            pass
+        else:
+            try:
+                return _daemon.do_run_client(
+                    _connection, argv, standard_out, standard_error, standard_in
+                )
+            except OSError as exception:
+                print(
+                    f"docformatter: not using the daemon: {exception}",
+                    file=standard_error,
+                )
+                if "-" in argv[1:]:
+                    standard_in.seek(0)
+
+        argv = _daemon.get_forwarded_argv(argv)
+
     configurator = _configuration.Configurater(argv)
 
     if "--help" in configurator.args_lst or "-h" in configurator.args_lst:
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+#
+#       docformatter.aio.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's asyncio API for editors and servers.
+
+This module is not imported by the docformatter package because importing
+asyncio slows down start up.
+"""
+
+# Standard Library Imports
+import argparse
+import asyncio
+import concurrent.futures
+import dataclasses
+import io
+from typing import Dict, Hashable, Iterable, List, Tuple, Union
+
+# docformatter Package Imports
+import docformatter.configuration as _configuration
+import docformatter.format as _format
+
+_formatters: Dict[_configuration.FormatOptions, _format.Formatter] = {}
+"""The Formatter for each set of options, one per process."""
+
+
+def _get_formatter(options: _configuration.FormatOptions) -> _format.Formatter:
+    """Return the Formatter of this process for the formatting options.
+
+    Parameters
+    ----------
+    options : FormatOptions
+        The formatting options.
+
+    Returns
+    -------
+    formatter : Formatter
+        The Formatter, which can be used from many threads at once.
+    """
+    _formatter = _formatters.get(options)
+    if _formatter is None:
+        _formatter = _formatters.setdefault(
+            options,
+            _format.Formatter(
+                argparse.Namespace(**dataclasses.asdict(options)),
+                stderror=io.StringIO(),
+                stdin=io.StringIO(),
+                stdout=io.StringIO(),
+            ),
+        )
+
+    return _formatter
+
+
+def _do_format_buffer(
+    source: Union[str, bytes],
+    encoding: Union[str, None],
+    options: _configuration.FormatOptions,
+) -> Union[str, bytes]:
+    """Format a buffer in an executor thread or process.
+
+    Parameters
+    ----------
+    source : str | bytes
+        The text of the buffer.
+    encoding : str
+        The encoding of the buffer when it is bytes.
+    options : FormatOptions
+        The formatting options.
+
+    Returns
+    -------
+    str | bytes
+        The text of the buffer with its docstrings formatted.
+    """
+    return _get_formatter(options).format_buffer(source, encoding, options)
+
+
+class AsyncFormatter:
+    """Format editor buffers concurrently without blocking the event loop.
+
+    Each buffer is identified by a key, such as its URI, and a version that
+    changes whenever the buffer is edited.  Requests for the version of a buffer
+    that is already being formatted share the result.  A request for a new
+    version cancels the request for the old one.
+    """
+
+    def __init__(
+        self,
+        options: _configuration.FormatOptions,
+        executor: Union[concurrent.futures.Executor, None] = None,
+    ) -> None:
+        """Initialize an AsyncFormatter instance.
+
+        Parameters
+        ----------
+        options : FormatOptions
+            The formatting options.
+        executor : concurrent.futures.Executor
+            The executor the formatting is done in.  Defaults to the default
+            executor of the event loop.  Process pools work too because each
+            process keeps its own Formatter.
+        """
+        self.options = options
+        self.executor = executor
+
+        self.running: Dict[Hashable, Tuple[Hashable, asyncio.Future]] = {}
+        """The version being formatted and its result for each buffer."""
+
+    async def format_source(
+        self,
+        key: Hashable,
+        version: Hashable,
+        source: Union[str, bytes],
+        encoding: Union[str, None] = None,
+    ) -> Union[str, bytes]:
+        """Return the buffer with its docstrings formatted.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying the buffer.
+        version : Hashable
+            The version of the buffer.
+        source : str | bytes
+            The text of the buffer.  Bytes are decoded and the formatted text
+            is encoded again, the same as standard in.
+        encoding : str
+            The encoding of the buffer when it is bytes.  Defaults to the
+            system encoding.
+
+        Returns
+        -------
+        str | bytes
+            The text of the buffer with its docstrings formatted.
+
+        Raises
+        ------
+        asyncio.CancelledError
+            If a newer version of the buffer was requested before this one was
+            formatted.
+        """
+        _running = self.running.get(key)
+        if _running is not None:
+            _version, _future = _running
+            if _version == version:
+                return await asyncio.shield(_future)
+
+            # The executor can't stop formatting that already started, so the
+            # old result is discarded instead.
+            _future.cancel()
+
+        _future = asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            _do_format_buffer,
+            source,
+            encoding,
+            self.options,
+        )
+        self.running[key] = (version, _future)
+
+        try:
+            return await asyncio.shield(_future)
+        finally:
+            if self.running.get(key, (None, None))[1] is _future:
+                del self.running[key]
+
+    async def format_sources(
+        self,
+        sources: Iterable[Tuple[Hashable, Hashable, Union[str, bytes]]],
+    ) -> List[Union[str, bytes, None]]:
+        """Return the buffers with their docstrings formatted.
+
+        Parameters
+        ----------
+        sources : iterable
+            The key, version, and text of each buffer.
+
+        Returns
+        -------
+        list
+            The formatted text of each buffer, or None if a newer version of
+            the buffer was requested before it was formatted.
+        """
+        _results = await asyncio.gather(
+            *(
+                self.format_source(_key, _version, _source)
+                for _key, _version, _source in sources
+            ),
+            return_exceptions=True,
+        )
+
+        _formatted: List[Union[str, bytes, None]] = []
+        for _result in _results:
+            if isinstance(_result, asyncio.CancelledError):
+                _formatted.append(None)
+            elif isinstance(_result, BaseException):
+                raise _result
+            else:
+                _formatted.append(_result)
+
+        return _formatted
+
+
+async def format_sources(
+    sources: Iterable[Tuple[Hashable, Hashable, Union[str, bytes]]],
+    options: _configuration.FormatOptions,
+    executor: Union[concurrent.futures.Executor, None] = None,
+) -> List[Union[str, bytes, None]]:
+    """Return the buffers with their docstrings formatted.
+
+    Use an AsyncFormatter instead to coalesce and cancel requests across calls.
+
+    Parameters
+    ----------
+    sources : iterable
+        The key, version, and text of each buffer.
+    options : FormatOptions
+        The formatting options.
+    executor : concurrent.futures.Executor
+        The executor the formatting is done in.  Defaults to the default
+        executor of the event loop.
+
+    Returns
+    -------
+    list
+        The formatted text of each buffer, or None if a later entry was a newer
+        version of the same buffer.
+    """
+    return await AsyncFormatter(options, executor).format_sources(sources)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+#
+#       docformatter.cache.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's Cache class."""
+
+# Standard Library Imports
+import argparse
+import contextlib
+import json
+import os
+import time
+from typing import Dict, List, Union
+
+# docformatter Package Imports
+from docformatter import __pkginfo__
+
+
+class Cache:
+    """Record files that are already correctly formatted."""
+
+    MAX_ENTRIES = 100000
+    """Maximum number of files recorded in a cache file."""
+
+    MAX_FILES = 8
+    """Maximum number of cache files kept in the cache directory."""
+
+    IGNORED_ARGS = (
+        "cache_dir",
+        "check",
+        "config",
+        "diff",
+        "diff_mode",
+        "exclude",
+        "files",
+        "in_place",
+        "jobs",
+        "no_cache",
+        "profile",
+        "profile_format",
+        "range_file",
+        "recursive",
+        "report_format",
+        "since",
+        "staged",
+        "verbose",
+    )
+    """Arguments that do not change how a file is formatted."""
+
+    def __init__(self, cache_dir: str, args: argparse.Namespace) -> None:
+        """Initialize a Cache instance.
+
+        Parameters
+        ----------
+        cache_dir : str
+            The directory to store the cache files in.
+        args : argparse.Namespace
+            The command line arguments and configuration file options in effect.
+        """
+        self.cache_dir = cache_dir
+        self.fingerprint = self.get_fingerprint(args)
+        self.filename = os.path.join(cache_dir, f"cache.{self.fingerprint}.json")
+
+        self.entries: Dict[str, List[Union[str, float]]] = {}
+        self.updates: Dict[str, List[Union[str, float]]] = {}
+
+        self.do_read()
+
+    @classmethod
+    def get_fingerprint(cls, args: argparse.Namespace) -> str:
+        """Return the fingerprint of the effective formatting options.
+
+        The docformatter version is part of the fingerprint so upgrading
+        docformatter invalidates every cached result.
+
+        Parameters
+        ----------
+        args : argparse.Namespace
+            The command line arguments and configuration file options in effect.
+
+        Returns
+        -------
+        fingerprint : str
+            The hexadecimal digest of the version and formatting options.
+        """
+        _options = {
+            key: value
+            for key, value in sorted(vars(args).items())
+            if key not in cls.IGNORED_ARGS
+        }
+        _options["version"] = __pkginfo__.__version__
+
+        # Standard Library Imports
+        import hashlib
+
+        return hashlib.sha256(
+            json.dumps(_options, sort_keys=True, default=str).encode()
+        ).hexdigest()[:32]
+
+    @staticmethod
+    def get_digest(source: bytes) -> str:
+        """Return the digest of the file contents.
+
+        Parameters
+        ----------
+        source : bytes
+            The raw contents of the file.
+
+        Returns
+        -------
+        digest : str
+            The hexadecimal SHA-256 digest of the contents.
+        """
+        # Standard Library Imports
+        import hashlib
+
+        return hashlib.sha256(source).hexdigest()
+
+    def is_clean(self, filename: str, digest: str) -> bool:
+        """Determine if the file is recorded as correctly formatted.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file.
+        digest : str
+            The digest of the current file contents.
+
+        Returns
+        -------
+        bool
+            True if the file contents are unchanged since they were last found to
+            be correctly formatted, False otherwise.
+        """
+        _key = os.path.abspath(filename)
+        _entry = self.updates.get(_key) or self.entries.get(_key)
+
+        if _entry is None or _entry[0] != digest:
+            return False
+
+        self.updates[_key] = [digest, time.time()]
+        return True
+
+    def do_mark_clean(self, filename: str, digest: str) -> None:
+        """Record the file as correctly formatted.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file.
+        digest : str
+            The digest of the file contents.
+        """
+        self.updates[os.path.abspath(filename)] = [digest, time.time()]
+
+    def do_update(self, updates: Dict[str, List[Union[str, float]]]) -> None:
+        """Merge entries recorded by another Cache instance.
+
+        Parameters
+        ----------
+        updates : dict
+            The entries recorded by the other instance, typically a worker
+            process.
+        """
+        self.updates.update(updates)
+
+    def do_read(self) -> None:
+        """Load the cache file for the effective options, if one exists."""
+        try:
+            with open(self.filename, encoding="utf-8") as cache_file:
+                _contents = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+
+        if (
+            isinstance(_contents, dict)
+            and _contents.get("version") == __pkginfo__.__version__
+            and isinstance(_contents.get("entries"), dict)
+        ):
+            self.entries = _contents["entries"]
+
+    def do_write(self) -> None:
+        """Save the cache file, evicting the least recently used entries.
+
+        Failing to write the cache is never an error; the next run simply
+        formats the files again.
+        """
+        if not self.updates:
+            return
+
+        self.entries.update(self.updates)
+        self.updates = {}
+
+        if len(self.entries) > self.MAX_ENTRIES:
+            _keep = sorted(
+                self.entries.items(),
+                key=lambda entry: entry[1][1],
+                reverse=True,
+            )[: self.MAX_ENTRIES]
+            self.entries = dict(_keep)
+
+        # Standard Library Imports
+        import tempfile
+
+        with contextlib.suppress(OSError):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.cache_dir,
+                prefix=".cache.",
+                suffix=".tmp",
+                delete=False,
+            ) as cache_file:
+                try:
+                    json.dump(
+                        {"version": __pkginfo__.__version__, "entries": self.entries},
+                        cache_file,
+                    )
+                    cache_file.close()
+                    os.replace(cache_file.name, self.filename)
+                except BaseException:
+                    # Don't leave a partial cache file behind.
+                    with contextlib.suppress(OSError):
+                        os.unlink(cache_file.name)
+                    raise
+
+            self._do_evict_files()
+
+    def _do_evict_files(self) -> None:
+        """Remove the least recently written cache files beyond MAX_FILES."""
+        _cache_files = sorted(
+            (
+                os.path.join(self.cache_dir, _name)
+                for _name in os.listdir(self.cache_dir)
+                if _name.startswith("cache.") and _name.endswith(".json")
+            ),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+
+        for _cache_file in _cache_files[self.MAX_FILES :]:
+            with contextlib.suppress(OSError):
+                os.remove(_cache_file)
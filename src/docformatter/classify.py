@@ -27,139 +27,310 @@
 """This module provides docformatter's classification functions."""
 
 # Standard Library Imports
-import re
 import sys
 import tokenize
 from tokenize import TokenInfo
 from typing import Union
 
 # docformatter Package Imports
-from docformatter.constants import MAX_PYTHON_VERSION
+from docformatter.constants import MAX_PYTHON_VERSION, QUOTE_TYPES
+from docformatter.patterns import get_compiled_pattern
 
 PY312 = (sys.version_info[0], sys.version_info[1]) > MAX_PYTHON_VERSION
 
+_NESTED_DEFINITION_MATCH = get_compiled_pattern(r"^ {4,}(async|class|def) ").match
 
-def do_find_docstring_blocks(tokens: list[TokenInfo]) -> list[tuple[int, int, str]]:
-    """Identify all docstring blocks and their anchor points.
+_MODULE_START_TYPES = (
+    tokenize.ENCODING,
+    tokenize.COMMENT,
+    tokenize.NEWLINE,
+    tokenize.NL,
+)
+"""The token types that can come before a module docstring."""
+
+_END_OF_FILE_TYPES = (
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.DEDENT,
+    tokenize.ENDMARKER,
+)
+"""The token types that can come after a docstring at the end of the file."""
+
+
+class TokenStream(list):
+    """A list of tokens that answers the docstring classifiers without rescanning.
+
+    The positions the classifiers need are found in one pass over the tokens the
+    first time a classifier asks for them.  The tokens must not be changed after
+    that.
+    """
+
+    def __init__(self, tokens=()) -> None:
+        """Initialize a TokenStream instance.
+
+        Parameters
+        ----------
+        tokens : iterable
+            The tokenized Python source code.
+        """
+        super().__init__(tokens)
+
+        self._first_code_index = 0
+        self._first_assignment_index = 0
+        self._last_significant_index = 0
+        self._definitions: list[str] = []
+        self._scopes: list[str] = []
+        self._is_indexed = False
+
+    def _do_index(self) -> None:
+        """Find the positions used by the classifiers in one pass."""
+        _num_tokens = len(self)
+        self._first_code_index = _num_tokens
+        self._first_assignment_index = _num_tokens
+        self._last_significant_index = -1
+        self._definitions = [""] * _num_tokens
+        self._scopes = [""] * _num_tokens
+
+        # The most recent of "class" or "def" (including async).
+        _definition = ""
+        # The most recent of "class", "def" (including async), or "=".
+        _scope = ""
+
+        for i, (_type, _string, _start, _end, _line) in enumerate(self):
+            self._definitions[i] = _definition
+            self._scopes[i] = _scope
+
+            if _type == tokenize.NAME:
+                if _string == "class":
+                    _definition = _scope = "class"
+                elif _string in ("def", "async"):
+                    _definition = _scope = "def"
+            elif _type == tokenize.OP and _string == "=":
+                _scope = "="
+                if (
+                    self._first_assignment_index == _num_tokens
+                    and '"""' not in _line
+                ):
+                    self._first_assignment_index = i
+
+            if (
+                self._first_code_index == _num_tokens
+                and _type not in _MODULE_START_TYPES
+            ):
+                self._first_code_index = i
+            if _type not in _END_OF_FILE_TYPES:
+                self._last_significant_index = i
+
+        self._is_indexed = True
+
+    @property
+    def first_code_index(self) -> int:
+        """Return the index of the first token that can't precede a docstring."""
+        if not self._is_indexed:
+            self._do_index()
+        return self._first_code_index
+
+    @property
+    def first_assignment_index(self) -> int:
+        """Return the index of the first = outside a line with triple quotes."""
+        if not self._is_indexed:
+            self._do_index()
+        return self._first_assignment_index
+
+    @property
+    def last_significant_index(self) -> int:
+        """Return the index of the last token that can't follow a docstring."""
+        if not self._is_indexed:
+            self._do_index()
+        return self._last_significant_index
+
+    def get_enclosing_definition(self, index: int) -> str:
+        """Return the last of class or def (including async) before a token.
+
+        Parameters
+        ----------
+        index : int
+            The index of the token.
+
+        Returns
+        -------
+        str
+            One of "class", "def", or "" if neither comes before the token.
+        """
+        if not self._is_indexed:
+            self._do_index()
+        return self._definitions[index]
+
+    def get_enclosing_scope(self, index: int) -> str:
+        """Return the last of class, def (including async), or = before a token.
+
+        Parameters
+        ----------
+        index : int
+            The index of the token.
+
+        Returns
+        -------
+        str
+            One of "class", "def", "=", or "" if none come before the token.
+        """
+        if not self._is_indexed:
+            self._do_index()
+        return self._scopes[index]
+
+
+def _get_token_stream(tokens: list[tokenize.TokenInfo]) -> TokenStream:
+    """Return the tokens as a TokenStream, wrapping a plain list of tokens.
+
+    A plain list is indexed again on each call, so callers classifying many
+    tokens of the same list should pass a TokenStream instead.
+    """
+    if isinstance(tokens, TokenStream):
+        return tokens
+
+    return TokenStream(tokens)
+
+
+def _get_docstring_type(
+    index: int,
+    is_module_start: bool,
+    seen_assignment: bool,
+    class_scope: str,
+    def_scope: str,
+) -> str:
+    """Return the type of the docstring at a string token.
 
     Parameters
     ----------
-    tokens (list[TokenInfo]):
-        A list of tokenized Python source code.
+    index : int
+        The index of the string token.
+    is_module_start : bool
+        Whether only encoding, comment, and newline tokens come before it.
+    seen_assignment : bool
+        Whether an assignment outside a line with triple quotes comes before it.
+    class_scope : str
+        The last of "class", "def" (including async), or "=" before it.
+    def_scope : str
+        The last of "class" or "def" (including async) before it.
 
     Returns
     -------
-    list[tuple[int, int, str]]:
-        A list of tuples representing each docstring block.  Each tuple contains:
-            - anchor_index (int): Index of the anchor (class, def, async def, or
-              assignment).
-            - string_index (int): Index of the docstring token.
-            - docstring_type (str): One of "module", "class", "function", or
-              "attribute".
+    str
+        One of "module", "attribute", "class", "function", or "" if the string
+        is not a docstring.
     """
-    docstring_blocks = []
+    if is_module_start:
+        return "module"
+    if index >= 2 and seen_assignment:  # noqa: PLR2004
+        return "attribute"
+    if class_scope == "class":
+        return "class"
+    if def_scope == "def":
+        return "function"
 
-    for i, token in enumerate(tokens):
-        if (
-            token.type != tokenize.STRING
-            or not (
-                token.string.startswith('"""')
-                or token.string.startswith('r"""')
-                or token.string.startswith('R"""')
-                or token.string.startswith('u"""')
-                or token.string.startswith('U"""')
-                or token.string.startswith("'''")
-                or token.string.startswith("r'''")
-                or token.string.startswith("R'''")
-                or token.string.startswith("u'''")
-                or token.string.startswith("U'''")
-            )
-            or " = " in token.line
-        ):
-            continue
-
-        if is_module_docstring(tokens, i):
-            docstring_blocks.append((0, i, "module"))
-            continue
-
-        if is_attribute_docstring(tokens, i):
-            anchor_idx = _do_find_anchor_index(tokens, i, target="attribute")
-            if anchor_idx is not None:
-                docstring_blocks.append((anchor_idx, i, "attribute"))
-            continue
-
-        if is_class_docstring(tokens, i):
-            anchor_idx = _do_find_anchor_index(tokens, i, target="class")
-            if anchor_idx is not None:
-                docstring_blocks.append((anchor_idx, i, "class"))
-            continue
-
-        if is_function_or_method_docstring(tokens, i):
-            anchor_idx = _do_find_anchor_index(tokens, i, target="def")
-            if anchor_idx is not None:
-                docstring_blocks.append((anchor_idx, i, "function"))
-            continue
-
-    # If adjacent docstrings have the same anchor index, remove the second one as
-    # there can only be one docstring per anchor.
+    return ""
+
+
+def _do_remove_repeated_anchors(docstring_blocks: list[tuple[int, int, str]]) -> None:
+    """Remove the second of adjacent docstring blocks with the same anchor.
+
+    There can only be one docstring per anchor.
+    """
     i = 1
     while i < len(docstring_blocks):
         if docstring_blocks[i][0] == docstring_blocks[i - 1][0]:
             docstring_blocks.pop(i)
         i += 1
 
-    return docstring_blocks
-
 
-def _do_find_anchor_index(
-    tokens: list[TokenInfo],
-    docstring_index: int,
-    target: str,
-) -> Union[int, None]:
-    """Walk backward from a docstring to find the matching anchor.
+def do_find_docstring_blocks(tokens: list[TokenInfo]) -> list[tuple[int, int, str]]:
+    """Identify all docstring blocks and their anchor points.
 
-    The matching anchor would be one of `class`, `def`, `async def`, or an assignment.
+    The tokens are classified in a single forward pass.  The state kept while
+    walking the tokens answers the same questions as the backward scans done by
+    is_module_docstring(), is_attribute_docstring(), is_class_docstring(), and
+    is_function_or_method_docstring() without rescanning the token list for each
+    docstring.
 
     Parameters
     ----------
     tokens (list[TokenInfo]):
         A list of tokenized Python source code.
-    docstring_index (int):
-        Index of the STRING token representing the docstring.
-    target (str):
-        One of "class", "def", or "attribute" indicating what to search for.
 
     Returns
     -------
-    int | None:
-        Index of the anchor token if found, otherwise None.
+    list[tuple[int, int, str]]:
+        A list of tuples representing each docstring block.  Each tuple contains:
+            - anchor_index (int): Index of the anchor (class, def, async def, or
+              assignment).
+            - string_index (int): Index of the docstring token.
+            - docstring_type (str): One of "module", "class", "function", or
+              "attribute".
     """
-    i = docstring_index - 1
-    saw_decorator = False
-
-    while i >= 0:
-        tok = tokens[i]
-
-        if tok.type == tokenize.OP and tok.string == "@":
-            saw_decorator = True
-
-        if target == "class" and tok.type == tokenize.NAME and tok.string == "class":
-            return i
+    docstring_blocks = []
 
-        if target == "def" and tok.type == tokenize.NAME and tok.string == "def":
-            # Handle @decorator above def
-            if saw_decorator:
-                while i > 0 and tokens[i - 1].type != tokenize.NEWLINE:
-                    i -= 1
-            return i
+    # Only encoding, comment, and newline tokens have been seen so far.
+    _is_module_start = True
+    # An assignment has been seen outside a line containing triple quotes.
+    _seen_assignment = False
+    # The most recent of "class", "def" (including async), or "=".
+    _class_scope = ""
+    # The most recent of "class" or "def" (including async).
+    _def_scope = ""
+
+    # The index of the anchor of each type of docstring found so far.
+    _anchors: dict[str, Union[int, None]] = {
+        "module": 0,
+        "attribute": None,
+        "class": None,
+        "function": None,
+    }
+    _last_def_line_idx = 0
+    _line_start_idx = 0
+
+    for i, (_type, _string, _start, _end, _line) in enumerate(tokens):
+        if _type == tokenize.NAME:
+            _anchors["attribute"] = i
+            if _string == "class":
+                _anchors["class"] = i
+                _class_scope = _def_scope = "class"
+            elif _string in ("def", "async"):
+                _class_scope = _def_scope = "def"
+                if _string == "def":
+                    _anchors["function"] = i
+                    _last_def_line_idx = _line_start_idx
+        elif _type == tokenize.OP:
+            if _string == "=":
+                _class_scope = "="
+                if '"""' not in _line:
+                    _seen_assignment = True
+            elif _string == "@" and _anchors["function"] is not None:
+                # Anchor decorated functions at the start of the def line.
+                _anchors["function"] = _last_def_line_idx
+        elif _type == tokenize.NEWLINE:
+            _line_start_idx = i + 1
+        elif (
+            _type == tokenize.STRING
+            and _string.startswith(QUOTE_TYPES)
+            and " = " not in _line
+        ):
+            _docstring_type = _get_docstring_type(
+                i, _is_module_start, _seen_assignment, _class_scope, _def_scope
+            )
+            _anchor_idx = _anchors.get(_docstring_type)
+            if _anchor_idx is not None:
+                docstring_blocks.append((_anchor_idx, i, _docstring_type))
 
-        if target == "attribute":
-            if tok.type == tokenize.NAME:
-                return i
+        _is_module_start = _is_module_start and _type in (
+            tokenize.ENCODING,
+            tokenize.COMMENT,
+            tokenize.NEWLINE,
+            tokenize.NL,
+        )
 
-        i -= 1
+    _do_remove_repeated_anchors(docstring_blocks)
 
-    return None
+    return docstring_blocks
 
 
 def is_attribute_docstring(
@@ -182,24 +353,8 @@ def is_attribute_docstring(
     if index < 2:  # noqa: PLR2004
         return False
 
-    # Step 1: Find the previous NEWLINE before the docstring
-    k = index - 1
-    while k > 0 and tokens[k].type != tokenize.NEWLINE:
-        k -= 1
-
-    # Step 2: Check for '=' or ':' on the line *before* the docstring
-    seen_equal_or_colon = False
-    for tok in tokens[0:index]:
-        if tok.type == tokenize.OP and tok.string == "=" and '"""' not in tok.line:
-            seen_equal_or_colon = True
-            break
-        else:
-            seen_equal_or_colon = False
-
-    if not seen_equal_or_colon:
-        return False
-
-    return True
+    # Check for an '=' on a line without triple quotes before the docstring.
+    return _get_token_stream(tokens).first_assignment_index < index
 
 
 def is_class_docstring(
@@ -207,18 +362,9 @@ def is_class_docstring(
     index: int,
 ) -> bool:
     """Determine if docstring is a class docstring."""
-    # Walk backward to find the most recent `class` keyword before the string,
-    # without crossing over a `def`, `async`, or another block
-    for i in range(index - 1, -1, -1):
-        tok = tokens[i]
-        if tok.type == tokenize.NAME and tok.string == "class":
-            return True
-        if tok.type == tokenize.NAME and tok.string in ("def", "async"):
-            return False  # Hit enclosing function or method first.
-        if tok.type == tokenize.OP and tok.string == "=":
-            return False  # Hit assignment, not a class docstring.
-
-    return False
+    # The most recent `class` keyword before the string must come after any
+    # `def`, `async`, or assignment.
+    return _get_token_stream(tokens).get_enclosing_scope(index) == "class"
 
 
 def is_closing_quotes(
@@ -334,14 +480,8 @@ def is_function_or_method_docstring(
     index: int,
 ) -> bool:
     """Determine if docstring is a function or method docstring."""
-    for i in range(index - 1, -1, -1):
-        tok = tokens[i]
-        if tok.type == tokenize.NAME and tok.string in ("def", "async"):
-            return True
-        if tok.type == tokenize.NAME and tok.string == "class":
-            return False  # hit enclosing class first
-
-    return False
+    # The most recent `def` or `async` keyword must come after any `class`.
+    return _get_token_stream(tokens).get_enclosing_definition(index) == "def"
 
 
 def is_inline_comment(token: tokenize.TokenInfo) -> bool:
@@ -392,15 +532,7 @@ def is_module_docstring(
 ) -> bool:
     """Determine if docstring is a module docstring."""
     # No code tokens before the string
-    for k in range(index):
-        if tokens[k][0] not in (
-            tokenize.ENCODING,
-            tokenize.COMMENT,
-            tokenize.NEWLINE,
-            tokenize.NL,
-        ):
-            return False
-    return True
+    return _get_token_stream(tokens).first_code_index >= index
 
 
 def is_nested_definition_line(token: tokenize.TokenInfo) -> bool:
@@ -416,7 +548,7 @@ def is_nested_definition_line(token: tokenize.TokenInfo) -> bool:
     bool
         True if the token is a nested definition line, False otherwise.
     """
-    return re.match(r"^ {4,}(async|class|def) ", token.line) is not None
+    return _NESTED_DEFINITION_MATCH(token.line) is not None
 
 
 def is_newline_continuation(
@@ -483,14 +615,4 @@ def is_string_variable(
 
 def is_docstring_at_end_of_file(tokens: list[tokenize.TokenInfo], index: int) -> bool:
     """Determine if the docstring is at the end of the file."""
-    for i in range(index + 1, len(tokens)):
-        tok = tokens[i]
-        if tok.type not in (
-            tokenize.NL,
-            tokenize.NEWLINE,
-            tokenize.DEDENT,
-            tokenize.ENDMARKER,
-        ):
-            return False
-
-    return True
+    return _get_token_stream(tokens).last_significant_index <= index
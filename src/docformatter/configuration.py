@@ -24,32 +24,83 @@
 # ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""This module provides docformatter's Configurater class."""
+"""This module provides docformatter's Configurater and FormatOptions classes."""
 
 # Standard Library Imports
 import argparse
-import contextlib
+import dataclasses
 import os
 import sys
 from configparser import ConfigParser
-from typing import Dict, Sequence, Union
-
-with contextlib.suppress(ImportError):
-    if sys.version_info >= (3, 11):
-        # Standard Library Imports
-        import tomllib
-    else:
-        # Third Party Imports
-        import tomli as tomllib
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 # docformatter Package Imports
 from docformatter import __pkginfo__
 
 
+def _get_optional_tuple(value: Optional[Sequence]) -> Optional[tuple]:
+    """Return the sequence as a tuple so it can be hashed, keeping None."""
+    return None if value is None else tuple(value)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FormatOptions:
+    """The options that determine how each docstring is formatted.
+
+    The options are derived once from the parsed arguments and never change, so
+    they can key caches and be shared with worker processes safely.
+    """
+
+    black: bool = False
+    close_quotes_on_newline: bool = False
+    force_wrap: bool = False
+    length_range: Optional[Tuple[int, int]] = None
+    line_range: Optional[Tuple[int, ...]] = None
+    """The first and last row of each --range, one range after the other."""
+    make_summary_multi_line: bool = False
+    non_cap: Optional[Tuple[str, ...]] = None
+    non_strict: bool = False
+    post_description_blank: bool = False
+    pre_summary_newline: bool = False
+    pre_summary_space: bool = False
+    rest_section_adorns: str = r"[!\"#$%&'()*+,-./:;<=>?@[\]^_`{|}~]{4,}"
+    style: str = "sphinx"
+    tab_width: int = 1
+    wrap_descriptions: int = 72
+    wrap_summaries: int = 79
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "FormatOptions":
+        """Return the formatting options in the parsed arguments.
+
+        Options missing from the arguments keep their default value.
+
+        Parameters
+        ----------
+        args : argparse.Namespace
+            The command line arguments and configuration file options in effect.
+
+        Returns
+        -------
+        options : FormatOptions
+            The formatting options.
+        """
+        _options = {
+            _field.name: getattr(args, _field.name)
+            for _field in dataclasses.fields(cls)
+            if hasattr(args, _field.name)
+        }
+        for _name in ("length_range", "line_range", "non_cap"):
+            if _name in _options:
+                _options[_name] = _get_optional_tuple(_options[_name])
+
+        return cls(**_options)
+
+
 class Configurater:
     """Read and store all the docformatter configuration information."""
 
-    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser: argparse.ArgumentParser
     """Parser object."""
 
     flargs: Dict[str, Union[bool, float, int, str]] = {}
@@ -132,6 +183,7 @@ class Configurater:
             default=self.flargs.get("exclude", None),
             help="in recursive mode, exclude directories and files by names",
         )
+        self._do_add_run_arguments()
         self.parser.add_argument(
             "-n",
             "--non-cap",
@@ -256,16 +308,7 @@ class Configurater:
             "one-line docstring wraps to two or more lines "
             "(default: False)",
         )
-        self.parser.add_argument(
-            "--range",
-            metavar="line",
-            dest="line_range",
-            default=self.flargs.get("range", None),
-            type=int,
-            nargs=2,
-            help="apply docformatter to docstrings between these "
-            "lines; line numbers are indexed at 1 (default: None)",
-        )
+        self._do_add_line_range_arguments()
         self.parser.add_argument(
             "--docstring-length",
             metavar="length",
@@ -283,6 +326,9 @@ class Configurater:
             help="don't strictly follow reST syntax to identify lists (see "
             "issue #67) (default: False)",
         )
+        self._do_add_engine_arguments()
+        self._do_add_report_arguments()
+        self._do_add_cache_arguments()
         self.parser.add_argument(
             "--config",
             default=self.config_file,
@@ -302,14 +348,10 @@ class Configurater:
         if self.args_lst is not None:
             self.args = self.parser.parse_args(self.args_lst[1:])
 
-        if self.args.line_range:
-            if self.args.line_range[0] <= 0:
-                self.parser.error("--range must be positive numbers")
-            if self.args.line_range[0] > self.args.line_range[1]:
-                self.parser.error(
-                    "First value of --range should be less than or equal "
-                    "to the second"
-                )
+        self._do_check_line_ranges()
+
+        if self.args.jobs < 0:
+            self.parser.error("--jobs must be zero or a positive number")
 
         if self.args.length_range:
             if self.args.length_range[0] <= 0:
@@ -320,6 +362,164 @@ class Configurater:
                     "than or equal to the second"
                 )
 
+    def _do_add_line_range_arguments(self) -> None:
+        """Add the arguments selecting the lines to format docstrings on."""
+        self.parser.add_argument(
+            "--range",
+            metavar="line",
+            dest="line_range",
+            action="extend",
+            default=None,
+            type=int,
+            nargs=2,
+            help="apply docformatter to docstrings between these "
+            "lines; line numbers are indexed at 1; repeat to give more "
+            "ranges (default: None)",
+        )
+        self.parser.add_argument(
+            "--range-file",
+            metavar="FILE",
+            dest="range_file",
+            default=self.flargs.get("range-file", None),
+            help="apply docformatter to docstrings on the lines of each file "
+            "listed in FILE as path:start-end (default: None)",
+        )
+        self.parser.add_argument(
+            "--since",
+            metavar="REF",
+            default=self.flargs.get("since", None),
+            help="apply docformatter to docstrings on lines changed since this "
+            "git reference (default: None)",
+        )
+        self.parser.add_argument(
+            "--staged",
+            action="store_true",
+            default=str(self.flargs.get("staged", "false")).lower() == "true",
+            help="apply docformatter to docstrings on lines staged for commit; "
+            "with --since, compare the staged lines with that reference "
+            "(default: False)",
+        )
+
+    def _do_check_line_ranges(self) -> None:
+        """Use the configured ranges if none are given and check the ranges."""
+        # The ranges on the command line replace those in the configuration
+        # file, instead of being added to them.
+        if self.args.line_range is None and "range" in self.flargs:
+            _value = self.flargs["range"]
+            # A list is kept as it is read from pyproject.toml, anything else
+            # is read as text.
+            _lines = (
+                _value
+                if isinstance(_value, list)
+                else str(_value).replace(",", " ").split()
+            )
+            try:
+                self.args.line_range = [int(_line) for _line in _lines]
+            except (TypeError, ValueError):
+                self.parser.error("--range must be pairs of line numbers")
+
+        if self.args.line_range:
+            if len(self.args.line_range) % 2:
+                self.parser.error("--range must be pairs of line numbers")
+            for _first, _last in zip(
+                self.args.line_range[0::2], self.args.line_range[1::2]
+            ):
+                if _first <= 0:
+                    self.parser.error("--range must be positive numbers")
+                if _first > _last:
+                    self.parser.error(
+                        "First value of --range should be less than or equal "
+                        "to the second"
+                    )
+
+        if self.args.range_file and (self.args.since or self.args.staged):
+            self.parser.error(
+                "--range-file cannot be used with --since or --staged"
+            )
+
+    def _do_add_run_arguments(self) -> None:
+        """Add the arguments for how files are processed."""
+        self.parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            metavar="N",
+            default=int(self.flargs.get("jobs", 1)),
+            help="number of parallel processes to use when formatting files; "
+            "set to 0 to use all available CPUs (default: 1)",
+        )
+        self.parser.add_argument(
+            "-v",
+            "--verbose",
+            action="count",
+            default=int(self.flargs.get("verbose", 0)),
+            help="report how the encoding of the formatted files was detected "
+            "and how often formatted docstrings were reused (default: 0)",
+        )
+
+    def _do_add_engine_arguments(self) -> None:
+        """Add the arguments for how formatted files are rebuilt and diffed."""
+        self.parser.add_argument(
+            "--rewrite-engine",
+            choices=["tokens", "spans"],
+            dest="rewrite_engine",
+            default=self.flargs.get("rewrite-engine", "tokens"),
+            help="rebuild the source code from its tokens, or only replace the "
+            "text of the docstrings and blank lines that change (default: tokens)",
+        )
+        self.parser.add_argument(
+            "--diff-mode",
+            choices=["full", "docstrings"],
+            dest="diff_mode",
+            default=self.flargs.get("diff-mode", "full"),
+            help="match every line of a file when showing its diff, or only the "
+            "lines of the docstrings edited by the spans rewrite engine "
+            "(default: full)",
+        )
+
+    def _do_add_report_arguments(self) -> None:
+        """Add the arguments for how the results are reported."""
+        self.parser.add_argument(
+            "--format",
+            choices=["text", "json", "sarif", "github"],
+            dest="report_format",
+            default=self.flargs.get("format", "text"),
+            help="report each file as text, as a line of JSON, as a SARIF "
+            "result, or as a GitHub Actions annotation (default: text)",
+        )
+        self.parser.add_argument(
+            "--profile",
+            action="store_true",
+            default=str(self.flargs.get("profile", "false")).lower() == "true",
+            help="report the time spent in each stage of formatting and the "
+            "slowest files and docstrings on standard error (default: False)",
+        )
+        self.parser.add_argument(
+            "--profile-format",
+            choices=["table", "json"],
+            dest="profile_format",
+            default=self.flargs.get("profile-format", "table"),
+            help="print the --profile report as a table or as JSON "
+            "(default: table)",
+        )
+
+    def _do_add_cache_arguments(self) -> None:
+        """Add the arguments for the cache of formatted files."""
+        self.parser.add_argument(
+            "--cache-dir",
+            metavar="DIR",
+            dest="cache_dir",
+            default=self.flargs.get("cache-dir", None),
+            help="skip files recorded in this directory as already formatted "
+            "with the same options (default: None)",
+        )
+        self.parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            default=str(self.flargs.get("no-cache", "false")).lower() == "true",
+            help="don't read or write the --cache-dir cache (default: False)",
+        )
+
     def _do_read_configuration_file(self) -> None:
         """Read docformatter options from a configuration file."""
         argfile = os.path.basename(self.config_file)
@@ -340,6 +540,14 @@ class Configurater:
 
     def _do_read_toml_configuration(self) -> None:
         """Load configuration information from a *.toml file."""
+        # The TOML parser is only imported when a pyproject.toml is read.
+        if sys.version_info >= (3, 11):
+            # Standard Library Imports
+            import tomllib
+        else:
+            # Third Party Imports
+            import tomli as tomllib
+
         with open(self.config_file, "rb") as f:
             config = tomllib.load(f)
 
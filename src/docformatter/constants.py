@@ -60,6 +60,9 @@ EPYTEXT_REGEX = r"@[a-zA-Z0-9_\-\s]+:"
 GOOGLE_REGEX = r"^ *[a-zA-Z0-9_\- ]*:$"
 """Regular expression to use for finding Google-style field lists."""
 
+INLINE_MATH_REGEX = r" *\w *:[a-zA-Z0-9_\- ]*:"
+"""Regular expression to use for finding inline math expressions."""
+
 LITERAL_REGEX = r"[\S ]*::"
 """Regular expression to use for finding literal blocks."""
 
@@ -208,6 +211,13 @@ like simple text. This will ignore URLs like ``http://`` or
 (``|') matches a double back-tick or single quote.
 """
 
+USER_DEFINED_REGEX = (
+    r"[\S ]+ - \S+|"
+    r"\s*\S+\s+--\s+|"
+    r"^ *@[a-zA-Z0-9_\- ]*(?:(?!:).)*$"
+)
+"""Regular expression to use for finding user-defined field lists."""
+
 # Keep these constants as constants.
 MAX_PYTHON_VERSION = (3, 11)
 
@@ -0,0 +1,598 @@
+#!/usr/bin/env python
+#
+#       docformatter.daemon.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's Daemon class and client functions.
+
+The daemon listens on a Unix domain socket.  Each request is a JSON object with
+the command line arguments, working directory, and standard input of a client.
+The response is a JSON object with the exit code and anything written to
+standard out and standard error.
+"""
+
+# Standard Library Imports
+import collections
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+from typing import Any, Dict, List, Sequence, TextIO, Tuple, Union
+
+# docformatter Package Imports
+import docformatter.configuration as _configuration
+import docformatter.format as _format
+
+DAEMON_ARGS = ("--client", "--daemon")
+"""Arguments that select the daemon or client mode."""
+
+
+def get_socket_path(argv: Sequence[str]) -> str:
+    """Return the path of the socket the daemon listens on.
+
+    The path is the value of --socket, the DOCFORMATTER_SOCKET environment
+    variable, or a file in the user's runtime directory.  Without an
+    XDG_RUNTIME_DIR, a directory in the temporary directory named for the user
+    is used.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments.
+
+    Returns
+    -------
+    socket_path : str
+        The path to the Unix domain socket.
+    """
+    with contextlib.suppress(ValueError, IndexError):
+        return argv[list(argv).index("--socket") + 1]
+
+    with contextlib.suppress(KeyError):
+        return os.environ["DOCFORMATTER_SOCKET"]
+
+    _runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "")
+    if not os.path.isdir(_runtime_dir):
+        _user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+        _runtime_dir = os.path.join(tempfile.gettempdir(), f"docformatter-{_user}")
+
+    return os.path.join(_runtime_dir, "docformatter.sock")
+
+
+def _do_check_directory(directory: str) -> None:
+    """Refuse a directory where another user could replace the socket.
+
+    The directory must belong to the user or root, and only the user may add
+    or remove files in it, unless its sticky bit is set.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the Unix domain socket.
+
+    Raises
+    ------
+    PermissionError
+        If another user can replace files in the directory.
+    """
+    # Without user IDs, there are no other users to check for.
+    if not hasattr(os, "getuid"):
+        return
+
+    _stat = os.stat(directory)
+    if _stat.st_uid not in (os.getuid(), 0) or (
+        _stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        and not _stat.st_mode & stat.S_ISVTX
+    ):
+        raise PermissionError(f"{directory} can be changed by other users")
+
+
+def _do_check_socket(socket_path: str) -> None:
+    """Refuse a socket that another user created or could replace.
+
+    Another user listening on the socket could read the files sent by the
+    client and answer with anything to write to them.
+
+    Parameters
+    ----------
+    socket_path : str
+        The path to the Unix domain socket.
+
+    Raises
+    ------
+    PermissionError
+        If the socket or its directory belongs to another user.
+    """
+    if not hasattr(os, "getuid"):
+        return
+
+    _do_check_directory(os.path.dirname(os.path.abspath(socket_path)))
+    if os.stat(socket_path).st_uid != os.getuid():
+        raise PermissionError(f"{socket_path} belongs to another user")
+
+
+def get_forwarded_argv(argv: Sequence[str]) -> List[str]:
+    """Return the command line arguments without the daemon and client arguments.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments.
+
+    Returns
+    -------
+    argv : list
+        The command line arguments for formatting.
+    """
+    _argv: List[str] = []
+    _skip_next = False
+    for _arg in argv:
+        if _skip_next:
+            _skip_next = False
+        elif _arg == "--socket":
+            _skip_next = True
+        elif _arg not in DAEMON_ARGS:
+            _argv.append(_arg)
+
+    return _argv
+
+
+def do_connect(socket_path: str) -> socket.socket:
+    """Return a connection to the daemon.
+
+    Parameters
+    ----------
+    socket_path : str
+        The path to the Unix domain socket.
+
+    Returns
+    -------
+    connection : socket.socket
+        The connected socket.
+
+    Raises
+    ------
+    OSError
+        If Unix domain sockets are not supported or no daemon is listening.
+    PermissionError
+        If the socket belongs to another user.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform")
+
+    _do_check_socket(socket_path)
+
+    _connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        _connection.connect(socket_path)
+    except OSError:
+        _connection.close()
+        raise
+
+    return _connection
+
+
+def do_run_client(
+    connection: socket.socket,
+    argv: Sequence[str],
+    standard_out: TextIO,
+    standard_error: TextIO,
+    standard_in: TextIO,
+) -> int:
+    """Have the daemon format files as if docformatter was run with argv.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connection to the daemon returned by do_connect().
+    argv : list
+        The command line arguments.
+    standard_out : TextIO
+        The standard output device.
+    standard_error : TextIO
+        The standard error device.
+    standard_in : TextIO
+        The standard input device, only read when formatting standard in.
+
+    Returns
+    -------
+    code : int
+        One of the FormatResult return codes.
+
+    Raises
+    ------
+    OSError
+        If the connection fails or the daemon's reply is missing or incomplete.
+        Nothing has been written to standard out or standard error then.
+    """
+    _argv = get_forwarded_argv(argv)
+
+    with connection:
+        _request = {
+            "argv": _argv,
+            "cwd": os.getcwd(),
+            "stdin": standard_in.read() if "-" in _argv[1:] else "",
+        }
+        connection.sendall(json.dumps(_request).encode("utf-8"))
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("rb") as _response_file:
+            _reply = _response_file.read()
+
+    if not _reply:
+        raise ConnectionError("the daemon closed the connection without replying")
+
+    try:
+        _response = json.loads(_reply.decode("utf-8"))
+        _stdout, _stderr, _code = (
+            _response["stdout"],
+            _response["stderr"],
+            _response["code"],
+        )
+    except (KeyError, TypeError, ValueError) as exception:
+        raise ConnectionError(f"bad reply from the daemon: {exception}") from None
+
+    standard_out.write(_stdout)
+    standard_error.write(_stderr)
+
+    return _code
+
+
+def _do_raise_interrupt(signum: int, frame: Any) -> None:
+    """Stop the daemon when it is terminated, the same as when interrupted."""
+    raise KeyboardInterrupt
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer a single client request."""
+
+    server: "_Server"
+
+    timeout = 10
+    """Seconds to wait for a client to send its request."""
+
+    def handle(self) -> None:
+        """Read the request, format, and write the response."""
+        try:
+            _request = self.rfile.read()
+        except OSError:
+            # The client stopped sending, so it won't read a response either.
+            return
+
+        # Nothing is sent when checking whether a daemon is running.
+        if not _request:
+            return
+
+        try:
+            _request = json.loads(_request.decode("utf-8"))
+            _response = self.server.docformatter_daemon.do_handle_request(_request)
+        except (KeyError, TypeError, ValueError) as exception:
+            _response = {
+                "code": _format.FormatResult.error,
+                "stdout": "",
+                "stderr": f"docformatter daemon: bad request: {exception}\n",
+            }
+
+        with contextlib.suppress(OSError):
+            self.wfile.write(json.dumps(_response).encode("utf-8"))
+
+
+class _Server(socketserver.UnixStreamServer):
+    """Serve the requests one at a time."""
+
+    docformatter_daemon: "Daemon"
+
+
+class Daemon:
+    """Format files for clients, keeping caches warm between requests.
+
+    Requests are answered one at a time because each one changes to the working
+    directory of its client.
+    """
+
+    MAX_CONFIGURATIONS = 64
+    """Maximum number of parsed configurations kept between requests."""
+
+    def __init__(self, socket_path: str) -> None:
+        """Initialize a Daemon instance.
+
+        Parameters
+        ----------
+        socket_path : str
+            The path of the Unix domain socket to listen on.
+        """
+        self.socket_path = socket_path
+        self.server: Union[_Server, None] = None
+
+        self.configurations: Dict[
+            Tuple[str, Tuple[str, ...]],
+            Tuple[
+                Tuple[Tuple[str, Union[int, None]], ...], _configuration.Configurater
+            ],
+        ] = {}
+        """Parsed configurations by working directory and arguments."""
+
+        self.memo: collections.OrderedDict[
+            Tuple[_configuration.FormatOptions, str, str], str
+        ] = collections.OrderedDict()
+        """Formatted docstrings shared by the Formatter of every request."""
+
+    def do_start(self) -> None:
+        """Start listening on the socket.
+
+        Raises
+        ------
+        OSError
+            If Unix domain sockets are not supported or another daemon is
+            already listening on the socket.
+        PermissionError
+            If other users can replace files in the directory of the socket.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not supported on this platform")
+
+        # The directory is created for the user alone.  One where other users
+        # could replace the socket is refused.
+        _directory = os.path.dirname(os.path.abspath(self.socket_path))
+        if not os.path.isdir(_directory):
+            os.makedirs(_directory, mode=0o700)
+        _do_check_directory(_directory)
+
+        # A socket left behind by a daemon that was killed is removed, but never
+        # the socket of a daemon that is still running or some other file.
+        try:
+            do_connect(self.socket_path).close()
+        except OSError:
+            with contextlib.suppress(FileNotFoundError):
+                if not stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                    raise FileExistsError(f"{self.socket_path} is not a socket")
+                os.remove(self.socket_path)
+        else:
+            raise FileExistsError(
+                f"a docformatter daemon is already listening on {self.socket_path}"
+            )
+
+        # The socket is created without permissions for anyone else, instead of
+        # having them taken away after it is listening.
+        _umask = os.umask(0o077)
+        try:
+            self.server = _Server(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(_umask)
+        self.server.docformatter_daemon = self
+
+    def do_serve(self, standard_error: TextIO) -> int:
+        """Answer requests until interrupted.
+
+        Parameters
+        ----------
+        standard_error : TextIO
+            The standard error device.
+
+        Returns
+        -------
+        code : int
+            One of the FormatResult return codes.
+        """
+        try:
+            self.do_start()
+        except OSError as exception:
+            # noinspection PyTypeChecker
+            print(f"docformatter daemon: {exception}", file=standard_error)
+            return _format.FormatResult.error
+
+        assert self.server is not None
+
+        # Only the main thread can handle signals.
+        with contextlib.suppress(ValueError):
+            signal.signal(signal.SIGTERM, _do_raise_interrupt)
+
+        # noinspection PyTypeChecker
+        print(
+            f"docformatter daemon listening on {self.socket_path}",
+            file=standard_error,
+        )
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.do_stop()
+
+        return _format.FormatResult.ok
+
+    def do_stop(self) -> None:
+        """Stop listening and remove the socket."""
+        if self.server is not None:
+            self.server.server_close()
+            self.server = None
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.socket_path)
+
+    def do_handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Format files as requested by a client.
+
+        Parameters
+        ----------
+        request : dict
+            The command line arguments, working directory, and standard input
+            of the client.
+
+        Returns
+        -------
+        response : dict
+            The exit code and anything written to standard out and standard
+            error.
+
+        Raises
+        ------
+        KeyError, TypeError
+            If the request is missing a field or has one of the wrong type.
+        """
+        _stdout = io.StringIO()
+        _stderr = io.StringIO()
+        _code: Union[int, None] = _format.FormatResult.error
+
+        # A malformed request is rejected before anything is changed.
+        _argv, _stdin = list(request["argv"]), io.StringIO(request["stdin"])
+        _request_cwd = request["cwd"]
+
+        _cwd = os.getcwd()
+        try:
+            os.chdir(_request_cwd)
+
+            # Argument errors are printed by argparse before it exits.
+            with contextlib.redirect_stdout(_stdout), contextlib.redirect_stderr(
+                _stderr
+            ):
+                _code = self._do_format(_argv, _stdout, _stderr, _stdin)
+        except SystemExit as exception:
+            _code = exception.code if isinstance(exception.code, int) else 2
+        except OSError as exception:
+            # noinspection PyTypeChecker
+            print(exception, file=_stderr)
+        except Exception as exception:
+            # Any other error is answered too, so the client isn't left without
+            # a reply and the daemon keeps running.
+            # noinspection PyTypeChecker
+            print(
+                f"docformatter daemon: {type(exception).__name__}: {exception}",
+                file=_stderr,
+            )
+        finally:
+            os.chdir(_cwd)
+
+        return {
+            "code": _code or 0,
+            "stdout": _stdout.getvalue(),
+            "stderr": _stderr.getvalue(),
+        }
+
+    def _do_format(
+        self,
+        argv: List[str],
+        standard_out: TextIO,
+        standard_error: TextIO,
+        standard_in: TextIO,
+    ) -> Union[int, None]:
+        """Format the files or standard input given in argv.
+
+        Parameters
+        ----------
+        argv : list
+            The command line arguments of the client.
+        standard_out : TextIO
+            The standard output device.
+        standard_error : TextIO
+            The standard error device.
+        standard_in : TextIO
+            The standard input device.
+
+        Returns
+        -------
+        code : int | None
+            One of the FormatResult return codes.
+        """
+        _configurator = self._get_configurater(argv)
+
+        _formatter = _format.Formatter(
+            _configurator.args,
+            stderror=standard_error,
+            stdin=standard_in,
+            stdout=standard_out,
+        )
+        _formatter.memo = self.memo
+
+        if "-" in _configurator.args.files:
+            _formatter.do_format_standard_in(_configurator.parser)
+            return None
+
+        return _formatter.do_format_files()
+
+    def _get_configurater(self, argv: List[str]) -> _configuration.Configurater:
+        """Return the parsed configuration for the arguments in the working directory.
+
+        The parsed configuration is reused until a configuration file it could
+        have been read from changes.
+
+        Parameters
+        ----------
+        argv : list
+            The command line arguments of the client.
+
+        Returns
+        -------
+        configurator : Configurater
+            The parsed configuration.
+        """
+        _key = (os.getcwd(), tuple(argv))
+        _signature = self._get_configuration_signature(argv)
+
+        _cached = self.configurations.get(_key)
+        if _cached is not None and _cached[0] == _signature:
+            return _cached[1]
+
+        _configurator = _configuration.Configurater(argv)
+        _configurator.do_parse_arguments()
+
+        if len(self.configurations) >= self.MAX_CONFIGURATIONS:
+            self.configurations.clear()
+        self.configurations[_key] = (_signature, _configurator)
+
+        return _configurator
+
+    @staticmethod
+    def _get_configuration_signature(
+        argv: List[str],
+    ) -> Tuple[Tuple[str, Union[int, None]], ...]:
+        """Return the modification time of each configuration file that could be read.
+
+        Parameters
+        ----------
+        argv : list
+            The command line arguments of the client.
+
+        Returns
+        -------
+        signature : tuple
+            The path and modification time of each configuration file, None if
+            the file does not exist.
+        """
+        _paths = list(_configuration.Configurater.configuration_file_lst)
+        with contextlib.suppress(ValueError, IndexError):
+            _paths.append(argv[argv.index("--config") + 1])
+
+        _signature: List[Tuple[str, Union[int, None]]] = []
+        for _path in _paths:
+            try:
+                _signature.append((_path, os.stat(_path).st_mtime_ns))
+            except OSError:
+                _signature.append((_path, None))
+
+        return tuple(_signature)
@@ -0,0 +1,446 @@
+#!/usr/bin/env python
+#
+#       docformatter.diff.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's unified diff functions."""
+
+# Standard Library Imports
+import bisect
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+Opcode = Tuple[str, int, int, int, int]
+"""A difflib opcode: the tag and the ranges of lines before and after."""
+
+Match = Tuple[int, int, int]
+"""A matching block: the first line before and after, and the number of lines."""
+
+Region = Tuple[int, int, int, int]
+"""The first and last line, indexed at 0 and exclusive, of a changed region
+before and after formatting."""
+
+
+def _get_range(start: int, stop: int) -> str:
+    """Return the range of lines in a hunk header, as difflib writes it."""
+    _length = stop - start
+    if _length == 1:
+        return str(start + 1)
+    if not _length:
+        return f"{start},0"
+
+    return f"{start + 1},{_length}"
+
+
+def _get_grouped_opcodes(
+    opcodes: List[Opcode], context: int
+) -> Iterator[List[Opcode]]:
+    """Group the opcodes into hunks with context lines, as difflib groups them.
+
+    This is SequenceMatcher.get_grouped_opcodes() for opcodes that weren't
+    found by a SequenceMatcher.
+    """
+    _codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if _codes[0][0] == "equal":
+        _tag, _i1, _i2, _j1, _j2 = _codes[0]
+        _codes[0] = (_tag, max(_i1, _i2 - context), _i2, max(_j1, _j2 - context), _j2)
+    if _codes[-1][0] == "equal":
+        _tag, _i1, _i2, _j1, _j2 = _codes[-1]
+        _codes[-1] = (_tag, _i1, min(_i2, _i1 + context), _j1, min(_j2, _j1 + context))
+
+    _group: List[Opcode] = []
+    for _tag, _i1, _i2, _j1, _j2 in _codes:
+        # A long run of equal lines ends one hunk and starts the next.
+        if _tag == "equal" and _i2 - _i1 > 2 * context:
+            _group.append(
+                (_tag, _i1, min(_i2, _i1 + context), _j1, min(_j2, _j1 + context))
+            )
+            yield _group
+            _group = []
+            _i1, _j1 = max(_i1, _i2 - context), max(_j1, _j2 - context)
+        _group.append((_tag, _i1, _i2, _j1, _j2))
+
+    if _group and not (len(_group) == 1 and _group[0][0] == "equal"):
+        yield _group
+
+
+class _LineIndex:
+    """The lines before and after formatting, and where each line is after.
+
+    The positions are found the way SequenceMatcher finds them for sequences
+    without junk, so lines are matched as they would be in the whole file.
+    """
+
+    __slots__ = ("after", "before", "positions")
+
+    POPULAR_MIN_LINES = 200
+    """Number of lines after formatting from which popular lines are ignored."""
+
+    def __init__(self, before: Sequence[str], after: Sequence[str]) -> None:
+        """Initialize a _LineIndex instance.
+
+        Parameters
+        ----------
+        before : list
+            The lines before formatting, without line endings.
+        after : list
+            The lines after formatting, without line endings.
+        """
+        self.before = before
+        self.after = after
+
+        self.positions: Dict[str, List[int]] = {}
+        for _j, _line in enumerate(after):
+            self.positions.setdefault(_line, []).append(_j)
+
+        # Lines making up more than 1% of a long file are popular and can't
+        # start a match.
+        if len(after) >= self.POPULAR_MIN_LINES:
+            _most = len(after) // 100 + 1
+            for _line in [
+                _line
+                for _line, _positions in self.positions.items()
+                if len(_positions) > _most
+            ]:
+                del self.positions[_line]
+
+
+def _find_longest_match(
+    index: _LineIndex, alo: int, ahi: int, blo: int, bhi: int
+) -> Match:
+    """Return the longest matching block in before[alo:ahi] and after[blo:bhi].
+
+    This is SequenceMatcher.find_longest_match() for sequences without junk,
+    except the positions of each line after formatting are searched by
+    bisection instead of one at a time.  A small range of a large file is
+    searched without visiting every position of its lines.
+    """
+    _a, _b, _b2j = index.before, index.after, index.positions
+    _besti, _bestj, _bestsize = alo, blo, 0
+
+    # The length of the match ending at each position in b with the previous
+    # line of a.
+    _j2len: Dict[int, int] = {}
+    for _i in range(alo, ahi):
+        _new_j2len = {}
+        _positions = _b2j.get(_a[_i], [])
+        for _j in _positions[
+            bisect.bisect_left(_positions, blo) : bisect.bisect_left(_positions, bhi)
+        ]:
+            _k = _new_j2len[_j] = _j2len.get(_j - 1, 0) + 1
+            if _k > _bestsize:
+                _besti, _bestj, _bestsize = _i - _k + 1, _j - _k + 1, _k
+        _j2len = _new_j2len
+
+    # Popular lines can't start a match but they extend one.
+    while _besti > alo and _bestj > blo and _a[_besti - 1] == _b[_bestj - 1]:
+        _besti, _bestj, _bestsize = _besti - 1, _bestj - 1, _bestsize + 1
+    while (
+        _besti + _bestsize < ahi
+        and _bestj + _bestsize < bhi
+        and _a[_besti + _bestsize] == _b[_bestj + _bestsize]
+    ):
+        _bestsize += 1
+
+    return _besti, _bestj, _bestsize
+
+
+def _get_matching_blocks(
+    index: _LineIndex, alo: int, ahi: int, blo: int, bhi: int
+) -> List[Match]:
+    """Return the matching blocks in before[alo:ahi] and after[blo:bhi].
+
+    The blocks are found the way SequenceMatcher.get_matching_blocks() finds
+    them: the longest block first, then the blocks before and after it.
+    """
+    _blocks = []
+    _queue = [(alo, ahi, blo, bhi)]
+    while _queue:
+        _alo, _ahi, _blo, _bhi = _queue.pop()
+        _i, _j, _k = _match = _find_longest_match(index, _alo, _ahi, _blo, _bhi)
+        if _k:
+            _blocks.append(_match)
+            if _alo < _i and _blo < _j:
+                _queue.append((_alo, _i, _blo, _j))
+            if _i + _k < _ahi and _j + _k < _bhi:
+                _queue.append((_i + _k, _ahi, _j + _k, _bhi))
+
+    return sorted(_blocks)
+
+
+def _get_matches(
+    blocks: Iterable[Match], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """Return the matched lines of the blocks in a[alo:ahi] or b[blo:bhi]."""
+    return [
+        (_bi + _idx, _bj + _idx)
+        for _bi, _bj, _bk in blocks
+        for _idx in range(
+            max(0, min(alo - _bi, blo - _bj)), min(_bk, max(ahi - _bi, bhi - _bj))
+        )
+        if alo <= _bi + _idx < ahi or blo <= _bj + _idx < bhi
+    ]
+
+
+def _get_merged_regions(index: _LineIndex, regions: Iterable[Region]) -> List[Region]:
+    """Return the changed regions, joining those that must be matched together.
+
+    Unchanged lines that can't start a match may be matched with the lines of
+    either region around them, so those regions are matched together.
+    Regions without changes are unchanged lines too.  The same goes for the
+    unchanged lines at the start and end of the file.
+    """
+    _before, _after = index.before, index.after
+
+    def _is_unmatched(start: int, end: int) -> bool:
+        return not any(_line in index.positions for _line in _before[start:end])
+
+    _regions: List[Region] = []
+    for _i1, _i2, _j1, _j2 in regions:
+        if _before[_i1:_i2] == _after[_j1:_j2]:
+            continue
+        if not _regions and _is_unmatched(0, _i1):
+            _i1, _j1 = 0, 0
+        if _regions and _is_unmatched(_regions[-1][1], _i1):
+            _regions[-1] = (_regions[-1][0], _i2, _regions[-1][2], _j2)
+        else:
+            _regions.append((_i1, _i2, _j1, _j2))
+    if _regions and _is_unmatched(_regions[-1][1], len(_before)):
+        _regions[-1] = (_regions[-1][0], len(_before), _regions[-1][2], len(_after))
+
+    return _regions
+
+
+def _get_window(index: _LineIndex, regions: List[Region], idx: int) -> Region:
+    """Return the lines a region is matched in.
+
+    A region is matched together with the unchanged lines on either side of
+    it, extended while the lines around them are unchanged too.
+    """
+    _before, _after = index.before, index.after
+
+    _alo, _blo = 0, 0
+    if idx > 0:
+        _alo, _blo = regions[idx - 1][1], regions[idx - 1][3]
+        while _alo > 0 and _blo > 0 and _before[_alo - 1] == _after[_blo - 1]:
+            _alo, _blo = _alo - 1, _blo - 1
+
+    _ahi, _bhi = len(_before), len(_after)
+    if idx + 1 < len(regions):
+        _ahi, _bhi = regions[idx + 1][0], regions[idx + 1][2]
+        while (
+            _ahi < len(_before)
+            and _bhi < len(_after)
+            and _before[_ahi] == _after[_bhi]
+        ):
+            _ahi, _bhi = _ahi + 1, _bhi + 1
+
+    return _alo, _ahi, _blo, _bhi
+
+
+def _get_window_blocks(
+    index: _LineIndex, regions: List[Region]
+) -> Union[List[List[Match]], None]:
+    """Return the matching blocks in the window of each region.
+
+    Neighbouring windows share the unchanged lines between their regions.  If
+    they match a shared line differently, the tie-break of the whole file can
+    differ from both, so None is returned as only matching every line gives
+    the same diff.
+    """
+    _windows: List[Tuple[Region, List[Match]]] = []
+    for _idx in range(len(regions)):
+        _window = _get_window(index, regions, _idx)
+        _blocks = _get_matching_blocks(index, *_window)
+
+        if _windows:
+            (_, _prev_ahi, _, _prev_bhi), _prev_blocks = _windows[-1]
+            _shared = (_window[0], _prev_ahi, _window[2], _prev_bhi)
+            if _get_matches(_prev_blocks, *_shared) != _get_matches(
+                _blocks, *_shared
+            ):
+                return None
+        _windows.append((_window, _blocks))
+
+    return [_blocks for _, _blocks in _windows]
+
+
+def _get_joined_blocks(
+    index: _LineIndex, regions: List[Region], window_blocks: List[List[Match]]
+) -> Union[List[Match], None]:
+    """Return the matching blocks of the whole file from those of each window.
+
+    The matches of a region's lines may slide into the unchanged lines next to
+    it, so the matches of neighbouring regions are joined in the middle of the
+    unchanged lines between them.  Returns None when the matches of
+    neighbouring regions cross each other.
+    """
+    _cuts = [0]
+    for _idx in range(1, len(regions)):
+        _cuts.append((regions[_idx - 1][1] + regions[_idx][0]) // 2)
+    _cuts.append(len(index.before))
+
+    _blocks: List[Match] = []
+    for _idx, _window_blocks in enumerate(window_blocks):
+        for _bi, _bj, _bk in _window_blocks:
+            _lo = max(0, _cuts[_idx] - _bi)
+            _hi = min(_bk, _cuts[_idx + 1] - _bi)
+            if _lo >= _hi:
+                continue
+
+            if _blocks and (
+                _bi + _lo < _blocks[-1][0] + _blocks[-1][2]
+                or _bj + _lo < _blocks[-1][1] + _blocks[-1][2]
+            ):
+                return None
+            _blocks.append((_bi + _lo, _bj + _lo, _hi - _lo))
+
+    if not regions:
+        _blocks.append((0, 0, len(index.before)))
+    _blocks.append((len(index.before), len(index.after), 0))
+
+    return _blocks
+
+
+def _get_opcodes(blocks: Iterable[Match]) -> List[Opcode]:
+    """Return the opcodes between the matching blocks.
+
+    This is SequenceMatcher.get_opcodes() for matching blocks that weren't
+    found by a SequenceMatcher, joining adjacent blocks first.
+    """
+    _opcodes: List[Opcode] = []
+    _i, _j = 0, 0
+    for _bi, _bj, _bk in blocks:
+        if _i < _bi and _j < _bj:
+            _opcodes.append(("replace", _i, _bi, _j, _bj))
+        elif _i < _bi:
+            _opcodes.append(("delete", _i, _bi, _j, _bj))
+        elif _j < _bj:
+            _opcodes.append(("insert", _i, _bi, _j, _bj))
+
+        if _bk:
+            if _opcodes and _opcodes[-1][0] == "equal" and _opcodes[-1][2] == _bi:
+                _opcodes[-1] = (
+                    "equal",
+                    _opcodes[-1][1],
+                    _bi + _bk,
+                    _opcodes[-1][3],
+                    _bj + _bk,
+                )
+            else:
+                _opcodes.append(("equal", _bi, _bi + _bk, _bj, _bj + _bk))
+        _i, _j = _bi + _bk, _bj + _bk
+
+    return _opcodes
+
+
+def _get_region_opcodes(
+    before: Sequence[str], after: Sequence[str], regions: Iterable[Region]
+) -> Union[List[Opcode], None]:
+    """Return the opcodes of the changes, only matching lines near regions.
+
+    The lines of each region are matched with the unchanged lines on either
+    side of it, so a region is matched as it would be in the whole file.
+    Lines are popular, and can't start a match, when they are popular in the
+    whole file.  Returns None when the regions can't be matched apart from
+    each other.
+    """
+    # Finding the positions of each line and the popular lines takes linear
+    # time.  Only matching every line of the file doesn't.
+    _index = _LineIndex(before, after)
+    _regions = _get_merged_regions(_index, regions)
+
+    _window_blocks = _get_window_blocks(_index, _regions)
+    if _window_blocks is None:
+        return None
+
+    _blocks = _get_joined_blocks(_index, _regions, _window_blocks)
+    if _blocks is None:
+        return None
+
+    return _get_opcodes(_blocks)
+
+
+def get_unified_diff(
+    before: Sequence[str],
+    after: Sequence[str],
+    labels: Tuple[str, str],
+    regions: Union[Iterable[Region], None] = None,
+    context: int = 3,
+) -> Iterator[str]:
+    """Yield the lines of the unified diff between two lists of lines.
+
+    Parameters
+    ----------
+    before : list
+        The lines before formatting, without line endings.
+    after : list
+        The lines after formatting, without line endings.
+    labels : tuple
+        The names of the file before and after formatting.
+    regions : list
+        The changed regions, sorted and not overlapping.  The lines between
+        the regions must be the same before and after formatting.  Lines are
+        only matched near the regions, which takes linear time instead of
+        matching every line of a large file.  Defaults to matching every line.
+    context : int
+        The number of unchanged lines shown around each change.
+
+    Yields
+    ------
+    str
+        The lines of the diff, without line endings.
+    """
+    _fromfile, _tofile = labels
+    _opcodes = None
+    if regions is not None:
+        _opcodes = _get_region_opcodes(before, after, regions)
+    if _opcodes is None:
+        # Standard Library Imports
+        import difflib
+
+        yield from difflib.unified_diff(
+            before, after, _fromfile, _tofile, n=context, lineterm=""
+        )
+        return
+
+    _started = False
+    for _group in _get_grouped_opcodes(_opcodes, context):
+        if not _started:
+            _started = True
+            yield f"--- {_fromfile}"
+            yield f"+++ {_tofile}"
+
+        yield (
+            f"@@ -{_get_range(_group[0][1], _group[-1][2])} "
+            f"+{_get_range(_group[0][3], _group[-1][4])} @@"
+        )
+        for _tag, _i1, _i2, _j1, _j2 in _group:
+            if _tag == "equal":
+                for _line in before[_i1:_i2]:
+                    yield " " + _line
+                continue
+            for _line in before[_i1:_i2]:
+                yield "-" + _line
+            for _line in after[_j1:_j2]:
+                yield "+" + _line
@@ -27,13 +27,14 @@
 """This module provides docformatter's Encoder class."""
 
 # Standard Library Imports
+import codecs
 import collections
+import encodings
 import locale
+import re
 import sys
-from typing import Dict, List
-
-# Third Party Imports
-from charset_normalizer import from_path  # pylint: disable=import-error
+from encodings.aliases import aliases
+from typing import Dict, List, Union
 
 unicode = str
 
@@ -48,11 +49,19 @@ class Encoder:
     # Default encoding to use if the file encoding cannot be detected
     DEFAULT_ENCODING = sys.getdefaultencoding()
 
+    # PEP 263 encoding declaration and the blank or comment-only line that may
+    # precede it.
+    CODING_REGEX = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)")
+    BLANK_REGEX = re.compile(rb"^[ \t\f]*(?:[#\r\n]|$)")
+
     def __init__(self):
         """Initialize an Encoder instance."""
         self.encoding = self.DEFAULT_ENCODING
         self.system_encoding = locale.getpreferredencoding() or sys.getdefaultencoding()
 
+        self.detections: Dict[str, int] = collections.Counter()
+        """Number of files whose encoding was found by each detection method."""
+
     def do_detect_encoding(self, filename) -> None:
         """Return the detected file encoding.
 
@@ -61,23 +70,144 @@ class Encoder:
         filename : str
             The full path name of the file whose encoding is to be detected.
         """
+        with open(filename, "rb") as input_file:
+            self.do_detect_encoding_from_bytes(input_file.read())
+
+    def do_detect_encoding_from_bytes(self, source: bytes) -> None:
+        """Detect the encoding of the raw file contents.
+
+        Parameters
+        ----------
+        source : bytes
+            The raw contents of the file whose encoding is to be detected.
+        """
+        self.encoding = self.get_encoding(source)
+
+    def get_encoding(self, source: bytes) -> str:
+        """Return the detected encoding of the raw file contents.
+
+        Unlike do_detect_encoding_from_bytes(), the encoding attribute is left
+        alone, so the same instance can be used for many files at once.
+
+        Parameters
+        ----------
+        source : bytes
+            The raw contents of the file whose encoding is to be detected.
+
+        Returns
+        -------
+        encoding : str
+            The detected encoding.
+        """
+        _encoding, _method = self._do_detect_fast_encoding(source)
+        if _encoding is not None:
+            self.detections[_method] += 1
+            return _encoding
+
+        # Importing charset_normalizer is slow, so only do so when the fast paths
+        # fail.
+        # Third Party Imports
+        from charset_normalizer import from_bytes  # pylint: disable=import-error
+
         try:
-            detection_result = from_path(filename).best()
+            detection_result = from_bytes(source).best()
             if detection_result and detection_result.encoding in ["utf_16", "utf_32"]:
                 # Treat undetectable/binary encodings as failure
-                self.encoding = self.DEFAULT_ENCODING
+                _encoding = self.DEFAULT_ENCODING
+                _method = "default"
             else:
-                self.encoding = (
+                _encoding = (
                     detection_result.encoding
                     if detection_result
                     else self.DEFAULT_ENCODING
                 )
+                _method = "detector" if detection_result else "default"
 
             # Check for correctness of encoding.
-            with self.do_open_with_encoding(filename) as check_file:
-                check_file.read()
+            self.do_decode(source, _encoding)
         except (SyntaxError, LookupError, UnicodeDecodeError):
-            self.encoding = self.DEFAULT_ENCODING
+            _encoding = self.DEFAULT_ENCODING
+            _method = "default"
+
+        self.detections[_method] += 1
+        return _encoding
+
+    def do_decode(self, source: bytes, encoding: Union[str, None] = None) -> str:
+        """Return the raw file contents decoded with the detected encoding.
+
+        Line endings are preserved, the same as when opening the file with
+        do_open_with_encoding().
+
+        Parameters
+        ----------
+        source : bytes
+            The raw contents of the file.
+        encoding : str
+            The encoding to decode with.  Defaults to the detected encoding.
+
+        Returns
+        -------
+        contents : str
+            The decoded contents of the file.
+        """
+        return source.decode(encoding or self.encoding)
+
+    def _do_detect_fast_encoding(
+        self, source: bytes
+    ) -> tuple[Union[str, None], str]:
+        """Return the encoding when it can be found without the detector.
+
+        A UTF-8 byte order mark or a PEP 263 encoding declaration in the first two
+        lines is honoured if the contents decode with it.  Otherwise, contents that
+        decode as strict UTF-8 are ASCII or UTF-8.  Encodings are named the same as
+        charset_normalizer names them.
+
+        Parameters
+        ----------
+        source : bytes
+            The raw contents of the file.
+
+        Returns
+        -------
+        (encoding, method) : tuple
+            The encoding, or None if the detector is needed, and the name of the
+            detection method used.
+        """
+        if source.startswith(codecs.BOM_UTF8):
+            _encoding: Union[str, None] = "utf_8"
+            _method = "bom"
+        else:
+            _encoding = None
+            _method = "cookie"
+            _lines = source.split(b"\n", 2)[:2]
+            for _line in _lines:
+                _match = self.CODING_REGEX.match(_line)
+                if _match:
+                    _name = encodings.normalize_encoding(
+                        _match.group(1).decode("ascii")
+                    ).lower()
+                    _encoding = aliases.get(_name, _name)
+                    break
+                if not self.BLANK_REGEX.match(_line):
+                    break
+
+        if _encoding is not None:
+            try:
+                source.decode(_encoding)
+            except (LookupError, UnicodeDecodeError):
+                return None, _method
+
+            return _encoding, _method
+
+        if source.isascii():
+            return "ascii", "ascii"
+
+        try:
+            source.decode("utf_8")
+        except UnicodeDecodeError:
+            return None, "utf-8"
+
+        return "utf_8", "utf-8"
 
     def do_find_newline(self, source: List[str]) -> str:
         """Return type of newline used in source.
@@ -112,7 +242,9 @@ class Encoder:
             or [self.LF]
         )[0]
 
-    def do_open_with_encoding(self, filename, mode: str = "r"):
+    def do_open_with_encoding(
+        self, filename, mode: str = "r", encoding: Union[str, None] = None
+    ):
         """Return opened file with a specific encoding.
 
         Parameters
@@ -121,6 +253,9 @@ class Encoder:
             The full path name of the file to open.
         mode : str
             The mode to open the file in.  Defaults to read-only.
+        encoding : str
+            The encoding to open the file with.  Defaults to the detected
+            encoding.
 
         Returns
         -------
@@ -128,5 +263,5 @@ class Encoder:
             The contents of the file.
         """
         return open(
-            filename, mode=mode, encoding=self.encoding, newline=""
+            filename, mode=mode, encoding=encoding or self.encoding, newline=""
         )  # Preserve line endings
@@ -28,17 +28,26 @@
 
 # Standard Library Imports
 import argparse
+import bisect
 import collections
 import contextlib
-import difflib
+import dataclasses
 import io
+import itertools
+import os
+import threading
 import tokenize
-from typing import TextIO, Union
+from typing import Iterable, Iterator, Sequence, TextIO, Union
 
 # docformatter Package Imports
+import docformatter.cache as _cache
 import docformatter.classify as _classify
+import docformatter.configuration as _configuration
+import docformatter.diff as _diff
 import docformatter.encode as _encode
 import docformatter.patterns as _patterns
+import docformatter.profiler as _profiler
+import docformatter.report as _report
 import docformatter.strings as _strings
 import docformatter.util as _util
 import docformatter.wrappers as _wrappers
@@ -49,7 +58,7 @@ unicode = str
 
 def _do_remove_preceding_blank_lines(
     tokens: list[tokenize.TokenInfo],
-    blocks: list[tuple[int, int, str]],
+    block_index: dict[int, tuple[int, int, str]],
 ) -> list[tokenize.TokenInfo]:
     """Remove all blank lines preceding a docstring.
 
@@ -64,49 +73,91 @@ def _do_remove_preceding_blank_lines(
     ----------
     tokens : list
         A list of tokens from the source code.
-    blocks : list
-        A list of tuples containing the index of any docstrings and the docstring type.
+    block_index : dict
+        The docstring blocks keyed by the index of the docstring token.
 
     Returns
     -------
     list
         A list of tokens with blank lines preceding docstrings removed.
     """
+    _indices_to_remove = _get_preceding_blank_lines(tokens, block_index)
+
+    # Rebuild the token list once rather than popping each blank line, which
+    # would shift every following token on each removal.
+    return [
+        _token
+        for _idx, _token in enumerate(tokens)
+        if _idx not in _indices_to_remove
+    ]
+
+
+def _get_preceding_blank_lines(
+    tokens: Sequence[tokenize.TokenInfo],
+    block_index: dict[int, tuple[int, int, str]],
+) -> set[int]:
+    """Find the blank lines preceding each docstring.
+
+    Parameters
+    ----------
+    tokens : sequence
+        A sequence of tokens from the source code.
+    block_index : dict
+        The docstring blocks keyed by the index of the docstring token.
+
+    Returns
+    -------
+    set
+        The indices of the blank line tokens to remove.
+    """
     _num_tokens = len(tokens)
-    _indices_to_remove = []
-
-    for i in range(_num_tokens):
-        match = next(((s, d, t) for (s, d, t) in blocks if d == i), None)
-        if match:
-            s, d, typ = match
-            for j in range(d - 1, 0, -1):
-                # Break out of loop once we reach a class, function, method, or
-                # attribute.  No more blank lines should be removed once we get to the
-                # structure the docstring is associated with.
-                if (
-                    tokens[j].type == tokenize.NAME
-                    and tokens[j].string in ("class", "def", "async")
-                ) or (tokens[j].type == tokenize.OP and tokens[j].string in ("=", ":")):
-                    break
-                elif (
-                    tokens[j].type in (tokenize.NEWLINE, tokenize.NL)
-                    and tokens[j].line == "\n"
-                    and not tokens[j - 1].line.startswith("#")
-                ):
-                    _indices_to_remove.append(j)
+    _indices_to_remove: set[int] = set()
 
-    # We need to go in reverse order to prevent the token list indices from
-    # getting out of whack.  For example, if _indices_to_remove = [5, 21] and we
-    # removed index 5 first, then old index 22 would become the new index 21 and
-    # the next iteration of the loop would remove the wrong token.
-    _indices_to_remove.sort(reverse=True)
+    for d in block_index:
+        if d >= _num_tokens:
+            continue
 
-    # Loop through the token indices in reverse order and remove them from the token
-    # line.
-    for i in _indices_to_remove:
-        tokens.pop(i)
+        for j in range(d - 1, 0, -1):
+            # Break out of loop once we reach a class, function, method, or
+            # attribute.  No more blank lines should be removed once we get to the
+            # structure the docstring is associated with.
+            if (
+                tokens[j].type == tokenize.NAME
+                and tokens[j].string in ("class", "def", "async")
+            ) or (tokens[j].type == tokenize.OP and tokens[j].string in ("=", ":")):
+                break
+            elif (
+                tokens[j].type in (tokenize.NEWLINE, tokenize.NL)
+                and tokens[j].line == "\n"
+                and not tokens[j - 1].line.startswith("#")
+            ):
+                _indices_to_remove.add(j)
 
-    return tokens
+    return _indices_to_remove
+
+
+def _get_block_index(
+    blocks: list[tuple[int, int, str]],
+) -> dict[int, tuple[int, int, str]]:
+    """Index the docstring blocks by the index of their docstring token.
+
+    Parameters
+    ----------
+    blocks : list
+        A list of tuples containing the anchor index, docstring index, and
+        docstring type of each docstring block.
+
+    Returns
+    -------
+    dict
+        The docstring blocks keyed by docstring index.  Only the first block
+        is kept for a docstring index that appears more than once.
+    """
+    _block_index: dict[int, tuple[int, int, str]] = {}
+    for _block in blocks:
+        _block_index.setdefault(_block[1], _block)
+
+    return _block_index
 
 
 def _do_skip_newlines(
@@ -540,6 +591,143 @@ def _get_unmatched_start_end_indices(
     return (_start_row, _start_col), (_end_row, _end_col)
 
 
+def _get_line_offsets(source: str) -> list[int]:
+    """Return the offset of the start of each line in the source code.
+
+    Parameters
+    ----------
+    source : str
+        The text of the source code.
+
+    Returns
+    -------
+    list
+        The offset of the start of each row, starting with row one, followed by
+        the length of the source code.  Lines are split the same way as
+        tokenize splits them.
+    """
+    return list(
+        itertools.accumulate(map(len, io.StringIO(source, newline="")), initial=0)
+    )
+
+
+_BLANK_LINE_TOKEN = tokenize.TokenInfo(tokenize.NEWLINE, "\n", (0, 0), (0, 1), "\n")
+"""A blank line added after a docstring."""
+
+
+def _get_newline_token(token: tokenize.TokenInfo, line: str) -> tokenize.TokenInfo:
+    """Return the token ending the line of a rewritten docstring.
+
+    Parameters
+    ----------
+    token : tokenize.TokenInfo
+        The docstring token.
+    line : str
+        The rewritten line of the docstring.
+
+    Returns
+    -------
+    tokenize.TokenInfo
+        The newline token added after the docstring.
+    """
+    return tokenize.TokenInfo(
+        type=tokenize.NEWLINE,
+        string="\n",
+        start=token.end,
+        end=(token.end[0], token.end[1] + 1),
+        line=line,
+    )
+
+
+class _RewrittenTokens(Sequence[tokenize.TokenInfo]):
+    """The tokens _do_rewrite_docstring_blocks() would build, found on demand.
+
+    Only the tokens replacing each docstring are stored.  Every other token is
+    looked up in the original tokens, so the blank lines preceding docstrings
+    are found exactly as they are in the rewritten tokens.
+    """
+
+    def __init__(self, tokens: list[tokenize.TokenInfo]) -> None:
+        """Initialize a _RewrittenTokens instance.
+
+        Parameters
+        ----------
+        tokens : list
+            The tokens of the source code.
+        """
+        self.tokens = tokens
+
+        self.starts: list[int] = []
+        """The index of the first token replacing each docstring."""
+
+        self.replacements: list[tuple[list[tokenize.TokenInfo], int]] = []
+        """The tokens replacing each docstring and the index of the next token."""
+
+        self.resume = 0
+        """The index of the first token after the last replaced tokens."""
+
+        self._end = 0
+
+    def __getitem__(self, index: int) -> tokenize.TokenInfo:  # type: ignore[override]
+        """Return the rewritten token at the index."""
+        _replacement, _index = self.get_position(index)
+        if _replacement < 0:
+            return self.tokens[_index]
+
+        return self.replacements[_replacement][0][_index]
+
+    def __len__(self) -> int:
+        """Return the number of rewritten tokens."""
+        return self._end + len(self.tokens) - self.resume
+
+    def do_add_replacement(
+        self,
+        index: int,
+        replacement: list[tokenize.TokenInfo],
+        resume: int,
+    ) -> None:
+        """Replace the tokens of a docstring.
+
+        Parameters
+        ----------
+        index : int
+            The index of the docstring token.
+        replacement : list
+            The tokens replacing the docstring token and the tokens after it.
+        resume : int
+            The index of the first token after the replaced tokens.
+        """
+        self.starts.append(self._end + index - self.resume)
+        self.replacements.append((replacement, resume))
+        self._end = self.starts[-1] + len(replacement)
+        self.resume = resume
+
+    def get_position(self, index: int) -> tuple[int, int]:
+        """Find where a rewritten token comes from.
+
+        Parameters
+        ----------
+        index : int
+            The index of the rewritten token.
+
+        Returns
+        -------
+        tuple
+            The number of the replacement and the index of the token in it, or
+            -1 and the index of the original token.
+        """
+        _replacement = bisect.bisect_right(self.starts, index) - 1
+        if _replacement < 0:
+            return -1, index
+
+        _tokens, _resume = self.replacements[_replacement]
+        _offset = index - self.starts[_replacement]
+        if _offset < len(_tokens):
+            return _replacement, _offset
+
+        return -1, _resume + _offset - len(_tokens)
+
+
 class FormatResult:
     """Possible exit codes."""
 
@@ -549,9 +737,129 @@ class FormatResult:
     format_required = 3
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class FormatOutcome:
+    """The result of formatting the docstrings in some source code."""
+
+    source: str
+    """The source code as it was given."""
+
+    formatted: str
+    """The source code with its docstrings formatted."""
+
+    edits: Union[Sequence[tuple[int, int, str]], None] = dataclasses.field(
+        default=None, compare=False
+    )
+    """The edits that formatted the source code, if they were recorded."""
+
+    @property
+    def changed(self) -> bool:
+        """Determine if formatting changed the source code."""
+        return self.source != self.formatted
+
+    def get_changed_lines(self) -> list[tuple[int, int]]:
+        """Return the lines of the source code that formatting changed.
+
+        Returns
+        -------
+        list
+            The first and last line of each change, indexed at 1.  Lines that
+            were only inserted are reported at the line they were inserted
+            before.
+        """
+        # Standard Library Imports
+        import difflib
+
+        _lines = self.source.splitlines()
+        _changes = []
+        for _tag, _start, _end, _, _ in difflib.SequenceMatcher(
+            None, _lines, self.formatted.splitlines()
+        ).get_opcodes():
+            if _tag != "equal":
+                _first = min(_start + 1, max(len(_lines), 1))
+                _changes.append((_first, max(_end, _first)))
+
+        return _changes
+
+    def get_changed_regions(self) -> Union[list[tuple[int, int, int, int]], None]:
+        """Return the regions of lines replaced by the recorded edits.
+
+        Returns
+        -------
+        list | None
+            The first and last line, indexed at 0 and exclusive, of each region
+            before and after formatting, sorted and not overlapping.  None if
+            the edits weren't recorded or the lines between the regions don't
+            match, so the regions might not cover every change.
+        """
+        if self.edits is None:
+            return None
+
+        _before = self.source.splitlines()
+        _after = self.formatted.splitlines()
+        _offsets = _get_line_offsets(self.source)
+
+        # Line numbers from the offsets only agree with splitlines() when the
+        # source has no other line boundaries, such as form feeds.
+        if len(_offsets) - 1 != len(_before):
+            return None
+
+        # The lines each edit touches, merging edits on the same or adjacent
+        # lines so their lines are matched together.
+        _spans: list[tuple[int, int, list[tuple[int, int, str]]]] = []
+        for _start, _end, _replacement in self.edits:
+            _i1 = bisect.bisect_right(_offsets, _start) - 1
+            _i2 = bisect.bisect_left(_offsets, _end)
+            if _spans and _i1 <= _spans[-1][1]:
+                _i1, _last, _span_edits = _spans.pop()
+                _i2 = max(_i2, _last)
+            else:
+                _span_edits = []
+            _span_edits.append((_start, _end, _replacement))
+            _spans.append((_i1, _i2, _span_edits))
+
+        _regions = []
+        _delta = 0
+        _prev_i2 = 0
+        for _i1, _i2, _span_edits in _spans:
+            _base = _offsets[_i1]
+            _length = len(
+                _strings.do_splice_edits(
+                    self.source[_base : _offsets[_i2]],
+                    [
+                        (_start - _base, _end - _base, _text)
+                        for _start, _end, _text in _span_edits
+                    ],
+                ).splitlines()
+            )
+
+            _j1 = _i1 + _delta
+            if _before[_prev_i2:_i1] != _after[_prev_i2 + _delta : _j1]:
+                return None
+
+            _delta += _length - (_i2 - _i1)
+            _regions.append((_i1, _i2, _j1, _i2 + _delta))
+            _prev_i2 = _i2
+
+        if _before[_prev_i2:] != _after[_prev_i2 + _delta :]:
+            return None
+
+        return _regions
+
+
 # noinspection PyArgumentList
 class Formatter:
-    """Format docstrings."""
+    """Format docstrings.
+
+    Everything that changes while formatting some source code is local to the
+    call of format_source(), except the memo of formatted docstrings, its hit
+    and miss counts, and the profiler.  The memo tolerates concurrent use and
+    the counts and timings are updated under a lock, so one instance can format
+    many sources at once from different threads.
+    """
+
+    MAX_MEMO_ENTRIES = 4096
+    """Maximum number of formatted docstrings remembered during a run."""
 
     parser = None
     """Parser object."""
@@ -584,13 +892,47 @@ class Formatter:
         object
         """
         self.args = args
+        self.options = _configuration.FormatOptions.from_args(args)
         self.stderror: TextIO = stderror
         self.stdin: TextIO = stdin
         self.stdout: TextIO = stdout
 
         self.encodor = _encode.Encoder()
 
-        self.new_tokens: list[tokenize.TokenInfo] = []
+        # The span engine edits the source code in place instead of rebuilding
+        # it from the rewritten tokens.
+        self.rewrite_engine: str = getattr(args, "rewrite_engine", "tokens")
+
+        # The docstrings diff mode only matches lines in the regions the span
+        # engine edited.
+        self.diff_mode: str = getattr(args, "diff_mode", "full")
+
+        self.profiler = _profiler.Profiler(bool(getattr(args, "profile", False)))
+
+        # The docstrings to format are selected the same way in every file, so
+        # the selection is only built again for other options.
+        self.selection = _util.DocstringSelection(
+            self.options.line_range, self.options.length_range
+        )
+        self._selection_arguments = (self.options.line_range, self.options.length_range)
+
+        # Files are reported as text on standard error and diffs on standard
+        # out unless a machine-readable format is asked for.
+        self.reporter: Union[_report.Reporter, None] = None
+        if getattr(args, "report_format", "text") != "text":
+            self.reporter = _report.Reporter(args.report_format, self.stdout)
+
+        self.cache: Union[_cache.Cache, None] = None
+        if getattr(args, "cache_dir", None) and not getattr(args, "no_cache", False):
+            self.cache = _cache.Cache(args.cache_dir, args)
+
+        # Identical docstrings are common, so each formatted docstring is
+        # remembered along with the options it was formatted with.
+        self.memo: collections.OrderedDict[
+            tuple[_configuration.FormatOptions, str, str], str
+        ] = collections.OrderedDict()
+        self.memo_stats: collections.Counter[str] = collections.Counter()
+        self._memo_stats_lock = threading.Lock()
 
     def do_format_standard_in(self, parser: argparse.ArgumentParser) -> None:
         """Print formatted text from standard in to standard out.
@@ -612,15 +954,41 @@ class Formatter:
         encoding = None
         source = self.stdin.read()
         if not isinstance(source, unicode):
-            encoding = self.stdin.encoding or self.encodor.system_encoding
-            source = source.decode(encoding)
+            encoding = self.stdin.encoding
 
-        formatted_source = self._do_format_code(source)
+        self.stdout.write(self.format_buffer(source, encoding))  # type: ignore
 
-        if encoding:
-            formatted_source = formatted_source.encode(encoding)
+    def format_buffer(
+        self,
+        source: Union[str, bytes],
+        encoding: Union[str, None] = None,
+        options: Union[_configuration.FormatOptions, None] = None,
+    ) -> Union[str, bytes]:
+        """Format the docstrings in an editor buffer or standard in.
+
+        Parameters
+        ----------
+        source : str | bytes
+            The text of the buffer.  Bytes are decoded and the formatted text
+            is encoded again.
+        encoding : str
+            The encoding of the buffer when it is bytes.  Defaults to the
+            system encoding.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
+
+        Returns
+        -------
+        str | bytes
+            The text of the buffer with its docstrings formatted.
+        """
+        if isinstance(source, unicode):
+            return self.format_source(source, options).formatted
 
-        self.stdout.write(formatted_source)
+        _encoding = encoding or self.encodor.system_encoding
+        _formatted = self.format_source(source.decode(_encoding), options).formatted
+        return _formatted.encode(_encoding)
 
     def do_format_files(self) -> Union[int, None]:
         """Format multiple files.
@@ -630,7 +998,7 @@ class Formatter:
         code : int | None
             One of the FormatResult return codes.
         """
-        outcomes: dict[int, int] = collections.Counter()
+        outcomes: collections.Counter[int] = collections.Counter()
 
         return_codes = [  # in order of preference
             FormatResult.error,
@@ -638,24 +1006,47 @@ class Formatter:
             FormatResult.ok,
         ]
 
-        _files_to_format = _util.find_py_files(
-            list(self.args.files), self.args.recursive, self.args.exclude
-        )
+        try:
+            _files_to_format, _line_ranges = self._get_files_to_format()
+        except (OSError, ValueError) as exception:
+            # noinspection PyTypeChecker
+            print(unicode(exception), file=self.stderror)
+            return FormatResult.error
+
+        # Having no changed or listed docstrings to format is not an error, but
+        # otherwise there were no files to process.
+        if not _files_to_format:
+            outcomes[
+                FormatResult.error if _line_ranges is None else FormatResult.ok
+            ] += 1
+
+        if self.reporter is not None:
+            self.reporter.do_start()
+
+        _jobs = getattr(self.args, "jobs", 1) or os.cpu_count() or 1
+        if _jobs > 1 and len(_files_to_format) > 1:
+            outcomes.update(
+                self._do_format_files_parallel(_files_to_format, _jobs, _line_ranges)
+            )
+        else:
+            outcomes.update(
+                self._do_format_files_serial(_files_to_format, _line_ranges)
+            )
 
-        is_empty = True
-        for filename in _files_to_format:
-            is_empty = False
-            try:
-                result = self._do_format_file(filename)
-                outcomes[result] += 1
-            except OSError as exception:
-                outcomes[FormatResult.error] += 1
-                # noinspection PyTypeChecker
-                print(unicode(exception), file=self.stderror)
+        if self.reporter is not None:
+            self.reporter.do_finish()
 
-        # There were no files to process.
-        if is_empty:
-            outcomes[FormatResult.error] += 1
+        if self.cache is not None:
+            self.cache.do_write()
+
+        if getattr(self.args, "verbose", 0):
+            self._do_report_encodings()
+            self._do_report_memo()
+
+        if self.profiler.enabled:
+            self.profiler.do_print_report(
+                self.stderror, getattr(self.args, "profile_format", "table")
+            )
 
         for code in return_codes:
             if outcomes[code]:
@@ -663,8 +1054,58 @@ class Formatter:
 
         return 0
 
+    def _get_files_to_format(
+        self,
+    ) -> tuple[list[str], Union[dict[str, _util.LineRanges], None]]:
+        """Return the files to format and the lines to format docstrings on.
+
+        Returns
+        -------
+        files_to_format : list
+            The paths to the files to be formatted.
+        line_ranges : dict
+            The lines of each file to format docstrings on, or None to format
+            the docstrings on every line.
+
+        Raises
+        ------
+        OSError
+            If the lines changed in git or the range file can't be read.
+        ValueError
+            If the git reference looks like an option or the range file is
+            malformed.
+        """
+        if getattr(self.args, "since", None) or getattr(self.args, "staged", False):
+            _line_ranges = self._get_changed_lines()
+
+            return (
+                list(_util.find_py_files(list(_line_ranges), False, self.args.exclude)),
+                _line_ranges,
+            )
+
+        _range_file = None
+        if getattr(self.args, "range_file", None):
+            _range_file = _util.do_read_range_file(self.args.range_file)
+
+        _files_to_format = list(
+            _util.find_py_files(
+                list(self.args.files), self.args.recursive, self.args.exclude
+            )
+        )
+        if _range_file is None:
+            return _files_to_format, None
+
+        _line_ranges = {
+            _filename: _range_file[os.path.abspath(_filename)]
+            for _filename in _files_to_format
+            if os.path.abspath(_filename) in _range_file
+        }
+
+        return list(_line_ranges), _line_ranges
+
     def _do_add_blank_lines(
         self,
+        new_tokens: list[tokenize.TokenInfo],
         num_blank_lines: int,
         start_row: int,
         end_row: int,
@@ -673,6 +1114,8 @@ class Formatter:
 
         Parameters
         ----------
+        new_tokens : list
+            The list of new tokens to add to.
         num_blank_lines : int
             The number of blank lines to add.
         start_row : int
@@ -690,21 +1133,26 @@ class Formatter:
                 end=_end,
                 line="\n",
             )
-            self.new_tokens.append(new_tok)
+            new_tokens.append(new_tok)
             _start = (_end[0] + 1, 0)
             _end = (_start[0], 1)
 
-    def _do_add_formatted_docstring(
+    def _do_add_formatted_docstring(  # noqa: PLR0913
         self,
+        new_tokens: list[tokenize.TokenInfo],
         token: tokenize.TokenInfo,
         next_token: tokenize.TokenInfo,
         docstring_type: str,
         blank_line_count: int,
+        *,
+        options: Union[_configuration.FormatOptions, None] = None,
     ) -> None:
         """Add a formatted docstring to the new tokens list.
 
         Parameters
         ----------
+        new_tokens : list
+            The list of new tokens to add to.
         token : tokenize.TokenInfo
             The token representing the docstring.
         next_token : tokenize.TokenInfo
@@ -713,9 +1161,14 @@ class Formatter:
             The type of the docstring (e.g., module, class, function, attribute).
         blank_line_count : int
             The number of blank lines to add after the docstring.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
         """
         _indent = " " * token.start[1] if docstring_type != "module" else ""
-        _formatted = self._do_format_docstring(_indent, token.string)
+        _formatted = self._do_format_docstring_memoized(
+            _indent, token.string, self.options if options is None else options
+        )
         _line = _indent + _formatted
 
         # Add a newline to the end of the docstring line unless it already
@@ -731,14 +1184,14 @@ class Formatter:
             end=token.end,
             line=_line,
         )
-        self.new_tokens.append(_new_tok)
+        new_tokens.append(_new_tok)
 
         with contextlib.suppress(IndexError):
             if (
-                self.new_tokens[-2].type == tokenize.INDENT
-                and self.new_tokens[-2].end[0] == _new_tok.start[0]
+                new_tokens[-2].type == tokenize.INDENT
+                and new_tokens[-2].end[0] == _new_tok.start[0]
             ):
-                self.new_tokens[-2] = self.new_tokens[-2]._replace(line=_line)
+                new_tokens[-2] = new_tokens[-2]._replace(line=_line)
 
         # If a comment follows the docstring, skip adding a newline token for
         # the line.
@@ -750,11 +1203,12 @@ class Formatter:
                 end=(token.end[0], token.end[1] + 1),
                 line=_line,
             )
-            self.new_tokens.append(_new_tok)
+            new_tokens.append(_new_tok)
 
         # Add the appropriate number of NEWLINE tokens based on the type of
         # docstring.
         self._do_add_blank_lines(
+            new_tokens,
             blank_line_count,
             _new_tok.end[0] + 1,
             _new_tok.end[0] + 1,
@@ -762,6 +1216,7 @@ class Formatter:
 
     def _do_add_unformatted_docstring(
         self,
+        new_tokens: list[tokenize.TokenInfo],
         token: tokenize.TokenInfo,
         docstring_type: str,
     ) -> None:
@@ -769,6 +1224,8 @@ class Formatter:
 
         Parameters
         ----------
+        new_tokens : list
+            The list of new tokens to add to.
         token : tokenize.TokenInfo
             The token representing the docstring.
         docstring_type : str
@@ -783,7 +1240,7 @@ class Formatter:
             end=token.end,
             line=_line,
         )
-        self.new_tokens.append(_new_token)
+        new_tokens.append(_new_token)
 
         # Add a token for the newline after the docstring.
         _new_token = tokenize.TokenInfo(
@@ -793,98 +1250,420 @@ class Formatter:
             end=(token.end[0], token.end[1] + 1),
             line=_line,
         )
-        self.new_tokens.append(_new_token)
+        new_tokens.append(_new_token)
+
+    def _do_format_files_serial(
+        self,
+        filenames: list[str],
+        line_ranges: Union[dict[str, _util.LineRanges], None] = None,
+    ) -> Iterator[int]:
+        """Format files one at a time in this process.
+
+        Parameters
+        ----------
+        filenames : list
+            The paths to the files to be formatted.
+        line_ranges : dict
+            The lines of each file to format docstrings on, if only the
+            docstrings on some lines are formatted.
+
+        Yields
+        ------
+        int
+            One of the FormatResult codes for each file.
+        """
+        for filename in filenames:
+            try:
+                result = self._do_format_file(
+                    filename,
+                    None if line_ranges is None else line_ranges[filename],
+                )
+            except OSError as exception:
+                result = FormatResult.error
+                # noinspection PyTypeChecker
+                print(unicode(exception), file=self.stderror)
+                if self.reporter is not None:
+                    self.reporter.do_add_error(filename, unicode(exception))
+
+            yield result
+
+    def _do_format_files_parallel(
+        self,
+        filenames: list[str],
+        jobs: int,
+        line_ranges: Union[dict[str, _util.LineRanges], None] = None,
+    ) -> Iterator[int]:
+        """Format files in a pool of worker processes.
+
+        Each worker captures the diff and --check output for the file it formats.
+        That output is written here in sorted filename order so the results do not
+        depend on which worker finishes first.
+
+        Parameters
+        ----------
+        filenames : list
+            The paths to the files to be formatted.
+        jobs : int
+            The number of worker processes to use.
+        line_ranges : dict
+            The lines of each file to format docstrings on, if only the
+            docstrings on some lines are formatted.
+
+        Yields
+        ------
+        int
+            One of the FormatResult codes for each file.
+        """
+        # Standard Library Imports
+        import concurrent.futures
+
+        _filenames = sorted(filenames)
+        _chunksize = max(1, len(_filenames) // (jobs * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(_filenames)),
+            initializer=_do_initialize_worker,
+            initargs=(self.args,),
+        ) as executor:
+            for (
+                result,
+                stdout,
+                stderror,
+                cache_updates,
+                detections,
+                memo_stats,
+                profile,
+                records,
+            ) in executor.map(
+                _do_format_file_in_worker,
+                _filenames,
+                [
+                    None if line_ranges is None else line_ranges[_filename]
+                    for _filename in _filenames
+                ],
+                chunksize=_chunksize,
+            ):
+                if self.cache is not None:
+                    self.cache.do_update(cache_updates)
+                self.encodor.detections.update(detections)
+                self.memo_stats.update(memo_stats)
+                self.profiler.do_update(profile)
+                if self.reporter is not None:
+                    for _record in records:
+                        self.reporter.do_write_record(_record)
+                if stdout:
+                    self.stdout.write(stdout)
+                if stderror:
+                    # noinspection PyTypeChecker
+                    print(stderror, end="", file=self.stderror)
+
+                yield result
+
+    def _get_changed_lines(self) -> dict[str, _util.LineRanges]:
+        """Return the lines changed in git in the files to format.
+
+        Returns
+        -------
+        changed_lines : dict
+            The first and last row of each changed range of lines, keyed by the
+            path of each changed file relative to the current directory.
+
+        Raises
+        ------
+        OSError
+            If git can't be run or the files are not in a git repository.
+        ValueError
+            If the git reference looks like an option.
+        """
+        # docformatter Package Imports
+        import docformatter.git as _git
+
+        # Directories are only searched in recursive mode, the same as when
+        # formatting every file.  Without any sources, git would diff the whole
+        # repository.
+        _sources = [
+            _source
+            for _source in self.args.files
+            if self.args.recursive or not os.path.isdir(_source)
+        ]
+        if not _sources:
+            return {}
+
+        return {
+            os.path.relpath(_path): _util.LineRanges(_line_ranges)
+            for _path, _line_ranges in _git.get_changed_lines(
+                _sources, self.args.since, self.args.staged
+            ).items()
+        }
+
+    def _do_report_encodings(self) -> None:
+        """Print the number of files found by each encoding detection method."""
+        _detections = ", ".join(
+            f"{_method} {_count}"
+            for _method, _count in sorted(self.encodor.detections.items())
+        )
+        # noinspection PyTypeChecker
+        print(
+            f"encodings detected by: {_detections or 'none'}",
+            file=self.stderror,
+        )
 
-    def _do_format_file(self, filename: str) -> int:
+    def _do_report_memo(self) -> None:
+        """Print the number of docstrings found in and added to the memo."""
+        # noinspection PyTypeChecker
+        print(
+            f"docstrings memoized: {self.memo_stats['hits']} hits, "
+            f"{self.memo_stats['misses']} misses",
+            file=self.stderror,
+        )
+
+    def _do_show_diff(
+        self,
+        filename: str,
+        source: str,
+        outcome: FormatOutcome,
+    ) -> Union[str, None]:
+        """Print the diff of a formatted file, or return it for the report.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file that was formatted.
+        source : str
+            The text of the file before formatting.
+        outcome : FormatOutcome
+            The outcome of formatting the file.
+
+        Returns
+        -------
+        str or None
+            The text of the diff when files are reported in a machine-readable
+            format, otherwise None after printing the diff.
+        """
+        with self.profiler.stage("diff"):
+            diff = (
+                _line + "\n"
+                for _line in _diff.get_unified_diff(
+                    source.splitlines(),
+                    outcome.formatted.splitlines(),
+                    (f"before/{filename}", f"after/{filename}"),
+                    (
+                        outcome.get_changed_regions()
+                        if self.diff_mode == "docstrings"
+                        else None
+                    ),
+                )
+            )
+            if self.reporter is not None:
+                return "".join(diff)
+
+            # The lines are written as they are found.
+            self.stdout.writelines(diff)
+
+        return None
+
+    def _do_report_file(
+        self,
+        filename: str,
+        status: str,
+        outcome: Union[FormatOutcome, None] = None,
+        diff_text: Union[str, None] = None,
+    ) -> None:
+        """Add a file to the report, if files are reported.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file that was checked or formatted.
+        status : str
+            One of ok, format_required, or formatted.
+        outcome : FormatOutcome
+            The outcome of formatting the file.  Defaults to a file that was
+            not formatted.
+        diff_text : str
+            The text of the diff of the file, if it was found.
+        """
+        if self.reporter is None:
+            return
+
+        self.reporter.do_add_file(
+            filename,
+            status,
+            outcome.get_changed_lines() if outcome and outcome.changed else (),
+            diff_text,
+        )
+
+    def _do_format_file(
+        self,
+        filename: str,
+        line_ranges: Union[_util.LineRanges, None] = None,
+    ) -> int:
         """Format docstrings in a file.
 
         Parameters
         ----------
         filename : str
             The path to the file to be formatted.
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in.  Defaults to all the
+            lines.
 
         Return
         ------
         int
             One of the FormatResult codes.
         """
-        self.encodor.do_detect_encoding(filename)
+        self.profiler.filename = filename
+        with self.profiler.stage(_profiler.FILE_STAGE, filename):
+            # Read the file once; the same bytes are used for the cache lookup,
+            # encoding detection, and decoding.
+            with self.profiler.stage("read file"), open(filename, "rb") as input_file:
+                _raw_source = input_file.read()
+
+            _digest = None
+            if self.cache is not None:
+                _digest = self.cache.get_digest(_raw_source)
+
+                # The file was correctly formatted the last time it was seen with
+                # these options, so there is no need to tokenize it again.
+                if self.cache.is_clean(filename, _digest):
+                    self._do_report_file(filename, "ok")
+                    return FormatResult.ok
+
+            with self.profiler.stage("detect encoding"):
+                _encoding = self.encodor.get_encoding(_raw_source)
+                source = self.encodor.do_decode(_raw_source, _encoding)
+
+            _outcome = self.format_source(source, line_ranges=line_ranges)
+            formatted_source = _outcome.formatted
+
+            ret = FormatResult.ok
+            show_diff = self.args.diff
+            _status = "ok"
+            _diff_text = None
+
+            if _outcome.changed:
+                ret = FormatResult.format_required
+                _status = "format_required"
+                if self.args.check:
+                    if self.reporter is None:
+                        # noinspection PyTypeChecker
+                        print(unicode(filename), file=self.stderror)
+                elif self.args.in_place:
+                    _status = "formatted"
+                    with self.profiler.stage(
+                        "write file"
+                    ), self.encodor.do_open_with_encoding(
+                        filename,
+                        mode="w",
+                        encoding=_encoding,
+                    ) as output_file:
+                        output_file.write(formatted_source)
+                else:
+                    show_diff = True
 
-        with self.encodor.do_open_with_encoding(filename) as input_file:
-            source = input_file.read()
-            formatted_source = self._do_format_code(source)
+                if show_diff:
+                    _diff_text = self._do_show_diff(filename, source, _outcome)
+            elif _digest is not None and line_ranges is None:
+                # Only the whole file being correctly formatted is remembered.
+                self.cache.do_mark_clean(filename, _digest)  # type: ignore
 
-        ret = FormatResult.ok
-        show_diff = self.args.diff
+            self._do_report_file(filename, _status, _outcome, _diff_text)
 
-        if source != formatted_source:
-            ret = FormatResult.format_required
-            if self.args.check:
-                # noinspection PyTypeChecker
-                print(unicode(filename), file=self.stderror)
-            elif self.args.in_place:
-                with self.encodor.do_open_with_encoding(
-                    filename,
-                    mode="w",
-                ) as output_file:
-                    output_file.write(formatted_source)
-            else:
-                show_diff = True
+            return ret
 
-            if show_diff:
-                diff = difflib.unified_diff(
-                    source.splitlines(),
-                    formatted_source.splitlines(),
-                    f"before/{filename}",
-                    f"after/{filename}",
-                    lineterm="",
-                )
-                self.stdout.write("\n".join(list(diff) + [""]))
-
-        return ret
-
-    def _do_format_code(self, source: str) -> str:
-        """Return source code with docstrings formatted.
+    def format_source(
+        self,
+        source: str,
+        options: Union[_configuration.FormatOptions, None] = None,
+        line_ranges: Union[Iterable[tuple[int, int]], None] = None,
+    ) -> FormatOutcome:
+        """Format the docstrings in some source code.
 
         Parameters
         ----------
         source : str
-            The text from the source file.
+            The text of the source code.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
+        line_ranges : list
+            The first and last row of each range of lines to format docstrings
+            in.  Defaults to all the lines.
 
         Returns
         -------
-        str
-            The source file text with docstrings formatted.
+        FormatOutcome
+            The source code before and after formatting.
         """
+        _options = self.options if options is None else options
+
         if not source:
-            return source
+            return FormatOutcome(source, source)
+
+        if _options.line_range is not None:
+            assert all(_line > 0 for _line in _options.line_range)
 
-        if self.args.line_range is not None:
-            assert self.args.line_range[0] > 0 and self.args.line_range[1] > 0
+        if line_ranges is not None and not isinstance(line_ranges, _util.LineRanges):
+            line_ranges = _util.LineRanges(line_ranges)
 
-        if self.args.length_range is not None:
-            assert self.args.length_range[0] > 0 and self.args.length_range[1] > 0
+        if _options.length_range is not None:
+            assert _options.length_range[0] > 0 and _options.length_range[1] > 0
 
         try:
             _original_newline = self.encodor.do_find_newline(source.splitlines(True))
-            tokens = list(
-                tokenize.generate_tokens(io.StringIO(source, newline="").readline)
-            )
+            with self.profiler.stage("tokenize"):
+                tokens = _classify.TokenStream(
+                    tokenize.generate_tokens(io.StringIO(source, newline="").readline)
+                )
 
             # Perform docstring rewriting
-            self._do_rewrite_docstring_blocks(tokens)
-            _code = tokenize.untokenize(self.new_tokens)
-
-            return _strings.do_normalize_line_endings(
-                _code.splitlines(True), _original_newline
-            ).rstrip(" ")
+            _edits = None
+            if self.rewrite_engine == "spans":
+                with self.profiler.stage("find edits"):
+                    _edits = self._get_docstring_edits(
+                        source, tokens, _options, line_ranges
+                    )
+                with self.profiler.stage("splice edits"):
+                    _code = _strings.do_splice_edits(source, _edits)
+            else:
+                with self.profiler.stage("rewrite tokens"):
+                    _new_tokens = self._do_rewrite_docstring_blocks(
+                        tokens, _options, line_ranges
+                    )
+                with self.profiler.stage("untokenize"):
+                    _code = tokenize.untokenize(_new_tokens)
+
+            return FormatOutcome(
+                source,
+                _strings.do_normalize_line_endings(
+                    _code.splitlines(True), _original_newline
+                ).rstrip(" "),
+                _edits,
+            )
         except (tokenize.TokenError, IndentationError):
-            return source
+            return FormatOutcome(source, source)
+
+    def _do_format_code(self, source: str) -> str:
+        """Return source code with docstrings formatted.
+
+        Parameters
+        ----------
+        source : str
+            The text from the source file.
+
+        Returns
+        -------
+        str
+            The source file text with docstrings formatted.
+        """
+        return self.format_source(source).formatted
 
     def _do_format_docstring(  # noqa PLR0911
         self,
         indentation: str,
         docstring: str,
+        options: Union[_configuration.FormatOptions, None] = None,
     ) -> str:
         """Return formatted version of docstring.
 
@@ -894,19 +1673,23 @@ class Formatter:
             The indentation characters for the docstring.
         docstring : str
             The docstring itself.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
 
         Returns
         -------
         str
             The docstring formatted according the various options.
         """
+        _options = self.options if options is None else options
         contents, open_quote = _strings.do_strip_docstring(docstring)
 
         if (
-            self.args.black
+            _options.black
             and contents.startswith('"')
-            or not self.args.black
-            and self.args.pre_summary_space
+            or not _options.black
+            and _options.pre_summary_space
         ):
             open_quote = f"{open_quote} "
 
@@ -929,39 +1712,109 @@ class Formatter:
         # Leave docstrings with only field lists alone.
         if _patterns.is_field_list(
             summary,
-            self.args.style,
+            _options.style,
         ):
             return docstring
 
-        if not self.args.force_wrap and (
+        if not _options.force_wrap and (
             _patterns.is_type_of_list(
                 summary,
-                self.args.non_strict,
-                self.args.style,
+                _options.non_strict,
+                _options.style,
             )
             or _patterns.do_find_links(summary)
         ):
             # Something probably isn't right with the splitting.
             return docstring
 
-        # Compensate for textwrap counting each tab in indentation as 1
-        # character.
-        tab_compensation = indentation.count("\t") * (self.args.tab_width - 1)
-        self.args.wrap_summaries -= tab_compensation
-        self.args.wrap_descriptions -= tab_compensation
-
         if description:
             return self._do_format_multiline_docstring(
                 indentation,
                 summary,
                 description,
                 open_quote,
+                _options,
             )
 
         return self._do_format_oneline_docstring(
             indentation,
             contents,
             open_quote,
+            _options,
+        )
+
+    def _do_format_docstring_memoized(
+        self,
+        indentation: str,
+        docstring: str,
+        options: _configuration.FormatOptions,
+    ) -> str:
+        """Return formatted version of docstring, reusing earlier results.
+
+        Another thread may evict a docstring from the memo at any time, so a
+        missing key is never an error.
+
+        Parameters
+        ----------
+        indentation : str
+            The indentation characters for the docstring.
+        docstring : str
+            The docstring itself.
+        options : FormatOptions
+            The formatting options to use.
+
+        Returns
+        -------
+        str
+            The docstring formatted according the various options.
+        """
+        _key = (options, indentation, docstring)
+
+        _formatted = self.memo.get(_key)
+        if _formatted is not None:
+            with contextlib.suppress(KeyError):
+                self.memo.move_to_end(_key)
+            with self._memo_stats_lock:
+                self.memo_stats["hits"] += 1
+            return _formatted
+
+        with self._memo_stats_lock:
+            self.memo_stats["misses"] += 1
+        with self.profiler.stage(_profiler.DOCSTRING_STAGE, docstring):
+            _formatted = self._do_format_docstring(indentation, docstring, options)
+        self.memo[_key] = _formatted
+        if len(self.memo) > self.MAX_MEMO_ENTRIES:
+            with contextlib.suppress(KeyError):
+                self.memo.popitem(last=False)
+
+        return _formatted
+
+    @staticmethod
+    def _get_wrap_lengths(
+        indentation: str,
+        options: _configuration.FormatOptions,
+    ) -> tuple[int, int]:
+        """Return the summary and description wrap lengths for the indentation.
+
+        Parameters
+        ----------
+        indentation : str
+            The indentation characters for the docstring.
+        options : FormatOptions
+            The formatting options to use.
+
+        Returns
+        -------
+        tuple[int, int]
+            The summary and description wrap lengths.
+        """
+        # Compensate for textwrap counting each tab in indentation as 1
+        # character.
+        _tab_compensation = indentation.count("\t") * (options.tab_width - 1)
+
+        return (
+            options.wrap_summaries - _tab_compensation,
+            options.wrap_descriptions - _tab_compensation,
         )
 
     def _do_format_oneline_docstring(
@@ -969,6 +1822,7 @@ class Formatter:
         indentation: str,
         contents: str,
         open_quote: str,
+        options: Union[_configuration.FormatOptions, None] = None,
     ) -> str:
         """Format one line docstrings.
 
@@ -981,18 +1835,24 @@ class Formatter:
         open_quote : str
             The type of quote used by the original docstring.  Selected from
             QUOTE_TYPES.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
 
         Returns
         -------
         str
             The formatted docstring.
         """
-        if self.args.make_summary_multi_line:
+        _options = self.options if options is None else options
+        _wrap_summaries, _ = self._get_wrap_lengths(indentation, _options)
+
+        if _options.make_summary_multi_line:
             beginning = f"{open_quote}\n{indentation}"
             ending = f'\n{indentation}"""'
             summary_wrapped = _wrappers.do_wrap_summary(
-                _strings.do_normalize_summary(contents, self.args.non_cap),
-                wrap_length=self.args.wrap_summaries,
+                _strings.do_normalize_summary(contents, _options.non_cap),
+                wrap_length=_wrap_summaries,
                 initial_indent=indentation,
                 subsequent_indent=indentation,
             ).strip()
@@ -1000,13 +1860,13 @@ class Formatter:
         else:
             summary_wrapped = _wrappers.do_wrap_summary(
                 open_quote
-                + _strings.do_normalize_summary(contents, self.args.non_cap)
+                + _strings.do_normalize_summary(contents, _options.non_cap)
                 + '"""',
-                wrap_length=self.args.wrap_summaries,
+                wrap_length=_wrap_summaries,
                 initial_indent=indentation,
                 subsequent_indent=indentation,
             ).strip()
-            if self.args.close_quotes_on_newline and "\n" in summary_wrapped:
+            if _options.close_quotes_on_newline and "\n" in summary_wrapped:
                 summary_wrapped = (
                     f"{summary_wrapped[:-3]}\n{indentation}{summary_wrapped[-3:]}"
                 )
@@ -1018,6 +1878,7 @@ class Formatter:
         summary: str,
         description: str,
         open_quote: str,
+        options: Union[_configuration.FormatOptions, None] = None,
     ) -> str:
         """Format multiline docstrings.
 
@@ -1032,34 +1893,42 @@ class Formatter:
         open_quote : str
             The type of quote used by the original docstring.  Selected from
             QUOTE_TYPES.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
 
         Returns
         -------
         str
             The formatted docstring.
         """
+        _options = self.options if options is None else options
+        _wrap_summaries, _wrap_descriptions = self._get_wrap_lengths(
+            indentation, _options
+        )
+
         # Compensate for triple quotes by temporarily prepending 3 spaces.
         # This temporary prepending is undone below.
         initial_indent = (
-            indentation if self.args.pre_summary_newline else 3 * " " + indentation
+            indentation if _options.pre_summary_newline else 3 * " " + indentation
         )
-        pre_summary = "\n" + indentation if self.args.pre_summary_newline else ""
+        pre_summary = "\n" + indentation if _options.pre_summary_newline else ""
         summary = _wrappers.do_wrap_summary(
-            _strings.do_normalize_summary(summary, self.args.non_cap),
-            wrap_length=self.args.wrap_summaries,
+            _strings.do_normalize_summary(summary, _options.non_cap),
+            wrap_length=_wrap_summaries,
             initial_indent=initial_indent,
             subsequent_indent=indentation,
         ).lstrip()
         description = _wrappers.do_wrap_description(
             description,
             indentation=indentation,
-            wrap_length=self.args.wrap_descriptions,
-            force_wrap=self.args.force_wrap,
-            strict=self.args.non_strict,
-            rest_sections=self.args.rest_section_adorns,
-            style=self.args.style,
+            wrap_length=_wrap_descriptions,
+            force_wrap=_options.force_wrap,
+            strict=_options.non_strict,
+            rest_sections=_options.rest_section_adorns,
+            style=_options.style,
         )
-        post_description = "\n" if self.args.post_description_blank else ""
+        post_description = "\n" if _options.post_description_blank else ""
         return f'''\
 {open_quote}{pre_summary}{summary}
 
@@ -1067,63 +1936,103 @@ class Formatter:
 {indentation}"""\
 '''
 
+    def _get_selection(
+        self,
+        options: _configuration.FormatOptions,
+        line_ranges: Union[_util.LineRanges, None] = None,
+    ) -> _util.DocstringSelection:
+        """Return the selection of docstrings to format in a source.
+
+        Parameters
+        ----------
+        options : FormatOptions
+            The formatting options to use.
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in.  Defaults to all the
+            lines.
+
+        Returns
+        -------
+        DocstringSelection
+            The selection built for the run, unless the options select other
+            docstrings, extended with the line ranges.
+        """
+        _selection = self.selection
+        if (options.line_range, options.length_range) != self._selection_arguments:
+            _selection = _util.DocstringSelection(
+                options.line_range, options.length_range
+            )
+
+        if line_ranges is not None:
+            _selection = _selection.with_line_ranges(line_ranges)
+
+        return _selection
+
     def _do_rewrite_docstring_blocks(
         self,
         tokens: list[tokenize.TokenInfo],
-    ) -> None:
+        options: Union[_configuration.FormatOptions, None] = None,
+        line_ranges: Union[_util.LineRanges, None] = None,
+    ) -> list[tokenize.TokenInfo]:
         """Replace all docstring blocks with properly formatted docstrings.
 
         Parameters
         ----------
         tokens : list
             The tokenized Python source code.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in.  Defaults to all the
+            lines.
+
+        Returns
+        -------
+        list
+            The tokens with the docstrings formatted.
         """
-        # print(tokens)
-        _blocks = _classify.do_find_docstring_blocks(tokens)
+        _options = self.options if options is None else options
+        _selection = self._get_selection(_options, line_ranges)
+        with self.profiler.stage("find docstring blocks"):
+            _block_index = _get_block_index(_classify.do_find_docstring_blocks(tokens))
         _skip_indices: set[int] = set()
-        self.new_tokens = []
+        _new_tokens: list[tokenize.TokenInfo] = []
 
         for _idx, _token in enumerate(tokens):
             if _idx in _skip_indices:
                 continue
 
-            _match = next(((s, d, t) for (s, d, t) in _blocks if d == _idx), None)
+            _match = _block_index.get(_idx)
             if _match:
                 _anchor_idx, _docstr_idx, _type = _match
                 _last_idx = _do_skip_newlines(tokens, _docstr_idx)
                 _skip_indices.update(range(_anchor_idx + 1, _last_idx))
 
                 _docstring_token = tokens[_docstr_idx]
-                _blank_line_count = _get_newlines_by_type(
-                    tokens,
-                    _docstr_idx,
-                )
 
-                if (
-                    _util.is_in_range(
-                        self.args.line_range,
-                        _docstring_token.start[0],
-                        _docstring_token.end[0],
-                    )
-                    and _util.has_correct_length(
-                        self.args.length_range,
-                        _docstring_token.start[0],
-                        _docstring_token.end[0],
-                    )
-                    and not _patterns.is_string_constant(tokens[_docstr_idx - 1])
-                ):
+                if _selection.is_selected(
+                    _docstring_token.start[0], _docstring_token.end[0]
+                ) and not _patterns.is_string_constant(tokens[_docstr_idx - 1]):
                     self._do_add_formatted_docstring(
+                        _new_tokens,
                         _docstring_token,
                         tokens[_idx + 1],
                         _type,
-                        _blank_line_count,
+                        _get_newlines_by_type(tokens, _docstr_idx),
+                        options=_options,
                     )
                 else:
-                    self._do_add_unformatted_docstring(_docstring_token, _type)
+                    self._do_add_unformatted_docstring(
+                        _new_tokens, _docstring_token, _type
+                    )
+                    # Keep the blank lines after a docstring that isn't
+                    # formatted; they were skipped with the newline tokens.
+                    _new_tokens.extend(tokens[_docstr_idx + 2 : _last_idx])
 
                 if (
                     (
-                        self.new_tokens[-2].string == tokens[_idx + 1].string
+                        _new_tokens[-2].string == tokens[_idx + 1].string
                         and _docstring_token.line == tokens[_idx + 1].line
                     )
                     or tokens[_idx + 1].string == "\n"
@@ -1147,7 +2056,230 @@ class Formatter:
                         line=_line,
                     )
 
-                self.new_tokens.append(_new_tok)
+                _new_tokens.append(_new_tok)
+
+        with self.profiler.stage("update token indices"):
+            _new_tokens = _do_remove_preceding_blank_lines(_new_tokens, _block_index)
+            return _do_update_token_indices(_new_tokens)
+
+    def _get_docstring_edits(
+        self,
+        source: str,
+        tokens: list[tokenize.TokenInfo],
+        options: Union[_configuration.FormatOptions, None] = None,
+        line_ranges: Union[_util.LineRanges, None] = None,
+    ) -> list[tuple[int, int, str]]:
+        """Find the edits that format the docstrings in the source code.
+
+        The docstrings and blank lines are formatted the same way as
+        _do_rewrite_docstring_blocks() formats them.  The code between them is
+        left exactly as it is instead of being rebuilt from the tokens.
+
+        Parameters
+        ----------
+        source : str
+            The text of the source code.
+        tokens : list
+            The tokenized Python source code.
+        options : FormatOptions
+            The formatting options to use.  Defaults to the options the
+            Formatter was created with.
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in.  Defaults to all the
+            lines.
+
+        Returns
+        -------
+        list
+            The start offset, end offset, and replacement text of each edit,
+            sorted by start offset.
+        """
+        _options = self.options if options is None else options
+        _selection = self._get_selection(_options, line_ranges)
+        with self.profiler.stage("find docstring blocks"):
+            _block_index = _get_block_index(_classify.do_find_docstring_blocks(tokens))
+        _offsets = _get_line_offsets(source)
+        _rewritten = _RewrittenTokens(tokens)
+        _edits: list[tuple[int, int, str]] = []
+
+        # The start offset, end offset, text, and number of blank lines after
+        # each formatted docstring.  Blank lines are removed from the count
+        # when they precede the next docstring.
+        _docstrings: dict[int, list] = {}
+
+        def _get_offset(position: tuple[int, int]) -> int:
+            # The NEWLINE token tokenize adds at the end of a source without
+            # a final newline ends past the end of the source.
+            return min(_offsets[position[0] - 1] + position[1], len(source))
+
+        for _docstr_idx in sorted(_block_index):
+            if _docstr_idx < _rewritten.resume:
+                continue
+
+            _type = _block_index[_docstr_idx][2]
+            _docstring_token = tokens[_docstr_idx]
+            _next_token = tokens[_docstr_idx + 1]
+            _last_idx = _do_skip_newlines(tokens, _docstr_idx)
+            _indent = " " * _docstring_token.start[1] if _type != "module" else ""
+
+            if _selection.is_selected(
+                _docstring_token.start[0], _docstring_token.end[0]
+            ) and not _patterns.is_string_constant(tokens[_docstr_idx - 1]):
+                _formatted = self._do_format_docstring_memoized(
+                    _indent, _docstring_token.string, _options
+                )
+                _line = _indent + _formatted
+                _replacement = [
+                    _docstring_token._replace(string=_formatted, line=_line)
+                ]
+                if not _next_token.string.startswith("#"):
+                    _replacement.append(_get_newline_token(_docstring_token, _line))
+
+                _end = _get_offset(_docstring_token.end)
+                if _next_token.type in (tokenize.NEWLINE, tokenize.NL):
+                    # Replace the newline and the blank lines after the
+                    # docstring.
+                    _end = _offsets[tokens[_last_idx].start[0] - 1]
+                    _formatted += "\n"
+
+                _blank_lines = _get_newlines_by_type(tokens, _docstr_idx)
+                _replacement.extend([_BLANK_LINE_TOKEN] * _blank_lines)
+                _docstrings[len(_rewritten.replacements)] = [
+                    _get_offset(_docstring_token.start),
+                    _end,
+                    _formatted,
+                    _blank_lines,
+                ]
+            else:
+                _line = _indent + _docstring_token.string
+                _replacement = [
+                    _docstring_token._replace(line=_line),
+                    _get_newline_token(_docstring_token, _line),
+                    *tokens[_docstr_idx + 2 : _last_idx],
+                ]
+                if _next_token.type in (tokenize.NEWLINE, tokenize.NL):
+                    # Whitespace after the docstring is removed.
+                    _edits.append(
+                        (
+                            _get_offset(_docstring_token.end),
+                            _get_offset(_next_token.end),
+                            "\n",
+                        )
+                    )
+
+            _rewritten.do_add_replacement(_docstr_idx, _replacement, _last_idx)
+
+        for _idx in _get_preceding_blank_lines(_rewritten, _block_index):
+            _replacement_idx, _token_idx = _rewritten.get_position(_idx)
+            if _replacement_idx in _docstrings and _token_idx >= 1:
+                _docstrings[_replacement_idx][3] -= 1
+            else:
+                _token = _rewritten[_idx]
+                _edits.append(
+                    (_get_offset(_token.start), _get_offset(_token.end), "")
+                )
+
+        for _start, _end, _formatted, _blank_lines in _docstrings.values():
+            # Blank lines are only added after a docstring that ends its line.
+            if _formatted.endswith("\n"):
+                _formatted += "\n" * _blank_lines
+            _edits.append((_start, _end, _formatted))
+
+        return sorted(_edits)
+
+
+_worker_formatter: Union[Formatter, None] = None
+"""The Formatter instance used by a worker process when running with --jobs."""
+
 
-        self.new_tokens = _do_remove_preceding_blank_lines(self.new_tokens, _blocks)
-        self.new_tokens = _do_update_token_indices(self.new_tokens)
+def _do_initialize_worker(args: argparse.Namespace) -> None:
+    """Create the Formatter instance used by a worker process.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments and configuration file options.
+    """
+    global _worker_formatter  # noqa: PLW0603
+
+    _worker_formatter = Formatter(
+        args,
+        stderror=io.StringIO(),
+        stdin=io.StringIO(),
+        stdout=io.StringIO(),
+    )
+
+    # The records are returned with each file and written by the main process.
+    if _worker_formatter.reporter is not None:
+        _worker_formatter.reporter.stream = None
+
+
+def _do_format_file_in_worker(
+    filename: str,
+    line_ranges: Union[_util.LineRanges, None] = None,
+) -> tuple[
+    int,
+    str,
+    str,
+    dict[str, list[Union[str, float]]],
+    dict[str, int],
+    dict[str, int],
+    dict[str, dict],
+    list[dict],
+]:
+    """Format a single file in a worker process.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to be formatted.
+    line_ranges : LineRanges
+        The ranges of lines to format docstrings in.  Defaults to all the lines.
+
+    Returns
+    -------
+    tuple[int, str, str, dict, dict, dict, dict, list]
+        The FormatResult code, anything written to standard out and standard
+        error while formatting the file, any new cache entries, the encoding
+        detection method used, the docstring memo hits and misses, the time
+        spent in each stage of formatting, and the report records.
+    """
+    assert _worker_formatter is not None
+
+    _worker_formatter.stdout = io.StringIO()
+    _worker_formatter.stderror = io.StringIO()
+    _worker_formatter.encodor.detections.clear()
+    _worker_formatter.memo_stats.clear()
+    _worker_formatter.profiler.do_clear()
+
+    try:
+        result = _worker_formatter._do_format_file(filename, line_ranges)
+    except Exception as exception:
+        # An error is reported with the file it came from instead of ending
+        # every worker and losing the results of the other files.
+        result = FormatResult.error
+        # noinspection PyTypeChecker
+        print(unicode(exception), file=_worker_formatter.stderror)
+        if _worker_formatter.reporter is not None:
+            _worker_formatter.reporter.do_add_error(filename, unicode(exception))
+
+    _records = []
+    if _worker_formatter.reporter is not None:
+        _records = _worker_formatter.reporter.records
+        _worker_formatter.reporter.records = []
+
+    _cache_updates = {}
+    if _worker_formatter.cache is not None:
+        _cache_updates = _worker_formatter.cache.updates
+        _worker_formatter.cache.updates = {}
+
+    return (
+        result,
+        _worker_formatter.stdout.getvalue(),  # type: ignore
+        _worker_formatter.stderror.getvalue(),  # type: ignore
+        _cache_updates,
+        dict(_worker_formatter.encodor.detections),
+        dict(_worker_formatter.memo_stats),
+        _worker_formatter.profiler.get_state(),
+        _records,
+    )
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+#
+#       docformatter.git.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's git functions."""
+
+# Standard Library Imports
+import os
+import re
+import subprocess
+from typing import Dict, List, Sequence, Tuple, Union
+
+HUNK_REGEX = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+"""Regular expression matching the start line and length of a changed hunk."""
+
+ESCAPE_REGEX = re.compile(rb"\\(?:([0-7]{3})|(.))")
+"""Regular expression matching an octal or character escape in a quoted path."""
+
+ESCAPES = {
+    b"a": b"\a",
+    b"b": b"\b",
+    b"f": b"\f",
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"v": b"\v",
+}
+"""The characters of the escape sequences git quotes paths with."""
+
+
+def _do_run_git(arguments: Sequence[str], cwd: Union[str, None] = None) -> str:
+    """Return the output of a git command.
+
+    Parameters
+    ----------
+    arguments : list
+        The arguments to pass to git.
+    cwd : str
+        The directory to run git in.  Defaults to the current directory.
+
+    Returns
+    -------
+    output : str
+        The standard output of the git command.
+
+    Raises
+    ------
+    OSError
+        If git can't be run or the command fails.
+    """
+    try:
+        _result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *arguments],
+            capture_output=True,
+            check=True,
+            cwd=cwd,
+            encoding="utf-8",
+            errors="surrogateescape",
+        )
+    except subprocess.CalledProcessError as exception:
+        raise OSError(
+            f"git {arguments[0]} failed: {exception.stderr.strip()}"
+        ) from exception
+
+    return _result.stdout
+
+
+def _get_unquoted_path(path: str) -> str:
+    """Return a path from a diff header as it is named in the file system.
+
+    git quotes paths with unusual characters in double quotes, escaping them as
+    in C, and puts a tab after unquoted paths with spaces.
+
+    Parameters
+    ----------
+    path : str
+        The path from a diff header.
+
+    Returns
+    -------
+    path : str
+        The path without quotes and escape sequences.
+    """
+    if not (len(path) > 1 and path.startswith('"') and path.endswith('"')):
+        return path.rstrip("\t")
+
+    def _get_character(match: "re.Match[bytes]") -> bytes:
+        _octal, _escape = match.groups()
+        if _octal is not None:
+            return bytes([int(_octal, 8)])
+        return ESCAPES.get(_escape, _escape)
+
+    return ESCAPE_REGEX.sub(
+        _get_character, path[1:-1].encode("utf-8", "surrogateescape")
+    ).decode("utf-8", "surrogateescape")
+
+
+def do_parse_diff(diff: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Return the lines changed in each file of a unified diff.
+
+    Parameters
+    ----------
+    diff : str
+        The output of git diff with no context lines and no path prefixes.
+
+    Returns
+    -------
+    changed_lines : dict
+        The first and last changed line of each hunk, keyed by the path of the
+        file relative to the root of the repository.  A hunk that only removes
+        lines covers the lines on either side of the removal.
+    """
+    _changed_lines: Dict[str, List[Tuple[int, int]]] = {}
+    _hunks: List[Tuple[int, int]] = []
+
+    # Without context lines, an added line starting with "++ " looks like the
+    # header naming a file, so the header is only looked for before the hunks
+    # of each file.
+    _is_header = True
+
+    for _line in diff.splitlines():
+        if _line.startswith("diff --git "):
+            _is_header = True
+            continue
+
+        if _is_header and _line.startswith("+++ "):
+            _hunks = _changed_lines.setdefault(_get_unquoted_path(_line[4:]), [])
+            continue
+
+        _match = HUNK_REGEX.match(_line)
+        if _match:
+            _is_header = False
+            _start = int(_match.group(1))
+            _length = 1 if _match.group(2) is None else int(_match.group(2))
+            if _length:
+                _hunks.append((_start, _start + _length - 1))
+            else:
+                _hunks.append((max(_start, 1), _start + 1))
+
+    return _changed_lines
+
+
+def get_changed_lines(
+    sources: Sequence[str],
+    since: Union[str, None] = None,
+    staged: bool = False,
+) -> Dict[str, List[Tuple[int, int]]]:
+    """Return the lines of the Python files changed since a git reference.
+
+    Parameters
+    ----------
+    sources : list
+        The files and directories to look for changes in.
+    since : str
+        The git reference to compare with.  Defaults to HEAD when only staged
+        changes are wanted, otherwise the index.
+    staged : bool
+        Only look for changes that are staged for commit.
+
+    Returns
+    -------
+    changed_lines : dict
+        The first and last changed line of each hunk, keyed by the absolute path
+        of each changed Python file.
+
+    Raises
+    ------
+    OSError
+        If git can't be run or the sources are not in a git repository.
+    ValueError
+        If the git reference looks like an option.
+    """
+    # The reference may come from a configuration file, and git would take one
+    # starting with a dash as an option.
+    if since is not None and since.startswith("-"):
+        raise ValueError(f"invalid git reference: {since}")
+
+    _root = _do_run_git(["rev-parse", "--show-toplevel"]).strip()
+
+    _arguments = [
+        "diff",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-prefix",
+        "--no-renames",
+        "--unified=0",
+        "--diff-filter=ACMR",
+    ]
+    if staged:
+        _arguments.append("--cached")
+    if since is not None:
+        _arguments.append(since)
+
+    _diff = _do_run_git([*_arguments, "--", *sources])
+
+    return {
+        os.path.join(_root, _path): _hunks
+        for _path, _hunks in do_parse_diff(_diff).items()
+        if _path.endswith(".py")
+    }
@@ -31,5 +31,6 @@ from .fields import *  # noqa F403
 from .headers import *  # noqa F403
 from .lists import *  # noqa F403
 from .misc import *  # noqa F403
+from .registry import *  # noqa F403
 from .rest import *  # noqa F403
 from .url import *  # noqa F403
@@ -27,7 +27,6 @@
 """This module provides docformatter's field list pattern recognition functions."""
 
 # Standard Library Imports
-import re
 from re import Match
 from typing import Union
 
@@ -37,8 +36,20 @@ from docformatter.constants import (
     GOOGLE_REGEX,
     NUMPY_REGEX,
     SPHINX_REGEX,
+    USER_DEFINED_REGEX,
 )
 
+# docformatter Local Imports
+from .registry import get_compiled_pattern
+
+_EPYTEXT_FINDITER = get_compiled_pattern(EPYTEXT_REGEX).finditer
+_EPYTEXT_MATCH = get_compiled_pattern(EPYTEXT_REGEX).match
+_GOOGLE_MATCH = get_compiled_pattern(GOOGLE_REGEX).match
+_NUMPY_MATCH = get_compiled_pattern(NUMPY_REGEX).match
+_SPHINX_FINDITER = get_compiled_pattern(SPHINX_REGEX).finditer
+_SPHINX_MATCH = get_compiled_pattern(SPHINX_REGEX).match
+_USER_DEFINED_MATCH = get_compiled_pattern(USER_DEFINED_REGEX).match
+
 
 def do_find_field_lists(
     text: str,
@@ -67,13 +78,13 @@ def do_find_field_lists(
     if style == "epytext":
         _field_idx = [
             (_field.start(0), _field.end(0))
-            for _field in re.finditer(EPYTEXT_REGEX, text)
+            for _field in _EPYTEXT_FINDITER(text)
         ]
         _wrap_parameters = True
     elif style == "sphinx":
         _field_idx = [
             (_field.start(0), _field.end(0))
-            for _field in re.finditer(SPHINX_REGEX, text)
+            for _field in _SPHINX_FINDITER(text)
         ]
         _wrap_parameters = True
 
@@ -128,7 +139,7 @@ def is_epytext_field_list(line: str) -> Union[Match[str], None]:
         @param x:
         @type x:
     """
-    return re.match(EPYTEXT_REGEX, line)
+    return _EPYTEXT_MATCH(line)
 
 
 def is_google_field_list(line: str) -> Union[Match[str], None]:
@@ -149,7 +160,7 @@ def is_google_field_list(line: str) -> Union[Match[str], None]:
     Google field lists have the following pattern:
         x (int): Description of x.
     """
-    return re.match(GOOGLE_REGEX, line)
+    return _GOOGLE_MATCH(line)
 
 
 def is_numpy_field_list(line: str) -> Union[Match[str], None]:
@@ -173,7 +184,7 @@ def is_numpy_field_list(line: str) -> Union[Match[str], None]:
         x
             Description of x.
     """
-    return re.match(NUMPY_REGEX, line)
+    return _NUMPY_MATCH(line)
 
 
 def is_sphinx_field_list(line: str) -> Union[Match[str], None]:
@@ -194,11 +205,9 @@ def is_sphinx_field_list(line: str) -> Union[Match[str], None]:
     Sphinx field lists have the following pattern:
         :parameter: description
     """
-    return re.match(SPHINX_REGEX, line)
+    return _SPHINX_MATCH(line)
 
 
-# TODO: Add a USER_DEFINED_REGEX to constants.py and use that instead of the
-#  hardcoded patterns.
 def is_user_defined_field_list(line: str) -> Union[Match[str], None]:
     """Check if the line is a user-defined field list.
 
@@ -224,8 +233,4 @@ def is_user_defined_field_list(line: str) -> Union[Match[str], None]:
     conform to any common docstring styles.  There is no documented reason they were
     included and are retained for historical purposes.
     """
-    return (
-        re.match(r"[\S ]+ - \S+", line)
-        or re.match(r"\s*\S+\s+--\s+", line)
-        or re.match(r"^ *@[a-zA-Z0-9_\- ]*(?:(?!:).)*$", line)
-    )
+    return _USER_DEFINED_MATCH(line)
@@ -27,7 +27,6 @@
 """This module provides docformatter's header pattern recognition functions."""
 
 # Standard Library Imports
-import re
 from re import Match
 from typing import Union
 
@@ -38,6 +37,13 @@ from docformatter.constants import (
     REST_SECTION_REGEX,
 )
 
+# docformatter Local Imports
+from .registry import get_compiled_pattern
+
+_ALEMBIC_MATCH = get_compiled_pattern(ALEMBIC_REGEX).match
+_NUMPY_SECTION_MATCH = get_compiled_pattern(NUMPY_SECTION_REGEX).match
+_REST_SECTION_MATCH = get_compiled_pattern(REST_SECTION_REGEX).match
+
 
 def is_alembic_header(line: str) -> Union[Match[str], None]:
     """Check if the line is an Alembic header.
@@ -59,7 +65,7 @@ def is_alembic_header(line: str) -> Union[Match[str], None]:
     bool
         True if the line matches an Alembic header pattern, False otherwise.
     """
-    return re.match(ALEMBIC_REGEX, line)
+    return _ALEMBIC_MATCH(line)
 
 
 def is_numpy_section_header(line: str) -> Union[Match[str], None]:
@@ -95,7 +101,7 @@ def is_numpy_section_header(line: str) -> Union[Match[str], None]:
         A match object if the line matches a NumPy section header pattern, None
         otherwise.
     """
-    return re.match(NUMPY_SECTION_REGEX, line)
+    return _NUMPY_SECTION_MATCH(line)
 
 
 def is_rest_section_header(line: str) -> Union[Match[str], None]:
@@ -139,4 +145,4 @@ def is_rest_section_header(line: str) -> Union[Match[str], None]:
     bool
         True if the line matches a reST section header pattern, False otherwise.
     """
-    return re.match(REST_SECTION_REGEX, line)
+    return _REST_SECTION_MATCH(line)
@@ -27,65 +27,132 @@
 """This module provides docformatter's list pattern recognition functions."""
 
 # Standard Library Imports
-import re
 from re import Match
 from typing import Union
 
 # docformatter Package Imports
 from docformatter.constants import (
+    ALEMBIC_REGEX,
     BULLET_REGEX,
     ENUM_REGEX,
+    EPYTEXT_REGEX,
+    GOOGLE_REGEX,
     HEURISTIC_MIN_LIST_ASPECT_RATIO,
+    INLINE_MATH_REGEX,
+    LITERAL_REGEX,
+    NUMPY_REGEX,
+    NUMPY_SECTION_REGEX,
     OPTION_REGEX,
+    REST_SECTION_REGEX,
+    SPHINX_REGEX,
+    USER_DEFINED_REGEX,
 )
 
 # docformatter Local Imports
-from .fields import (
-    is_epytext_field_list,
-    is_field_list,
-    is_google_field_list,
-    is_numpy_field_list,
-    is_sphinx_field_list,
-    is_user_defined_field_list,
-)
-from .headers import is_alembic_header, is_numpy_section_header, is_rest_section_header
-from .misc import is_inline_math, is_literal_block
+from .fields import is_epytext_field_list, is_sphinx_field_list
+from .registry import get_compiled_pattern
+
+_BULLET_MATCH = get_compiled_pattern(BULLET_REGEX).match
+_ENUM_MATCH = get_compiled_pattern(ENUM_REGEX).match
+_OPTION_MATCH = get_compiled_pattern(OPTION_REGEX).match
+
+_FIELD_LIST_MATCHES = {
+    "epytext": is_epytext_field_list,
+    "sphinx": is_sphinx_field_list,
+}
+"""Field list predicate for each docstring style that wraps field lists."""
+
+_LIST_MATCH = get_compiled_pattern(
+    "|".join(
+        f"(?P<{_name}>{_regex})"
+        for _name, _regex in (
+            ("bullet", BULLET_REGEX),
+            ("enumerated", ENUM_REGEX),
+            ("option", OPTION_REGEX),
+            ("epytext", EPYTEXT_REGEX),
+            ("sphinx", SPHINX_REGEX),
+            ("numpy", NUMPY_REGEX),
+            ("google", GOOGLE_REGEX),
+            ("user_defined", USER_DEFINED_REGEX),
+            ("literal", LITERAL_REGEX),
+            ("inline_math", INLINE_MATH_REGEX),
+            ("alembic", ALEMBIC_REGEX),
+        )
+    )
+).match
+"""Match any single-line list pattern, naming the first one to match."""
+
+_SECTION_HEADER_MATCH = get_compiled_pattern(
+    f"(?P<rest_section>{REST_SECTION_REGEX})|"
+    f"(?P<numpy_section>{NUMPY_SECTION_REGEX})"
+).match
+"""Match either section header pattern, naming the first one to match."""
 
+_TITLE_MATCH = get_compiled_pattern(r"[\w ]+\Z").match
+"""Match a line that could be the title of a section header."""
 
-def _create_multiline_windows(lines: list[str], window_size: int = 3) -> list[str]:
-    r"""Create overlapping windows of consecutive lines.
 
-    This allows pattern matching against multi-line constructs like
-    NumPy section headers (e.g., "Parameters\\n----------") and reST
-    section headers (e.g., "Title\\n=====").
+def get_list_type(
+    text: str,
+    strict: bool,
+    style: str,
+) -> Union[str, None]:
+    """Return the kind of list found in the docstring text.
+
+    Each line is classified in a single pass.  The single-line patterns are
+    combined into one alternation tried in the order the is_*_list() predicates
+    were once tried, so the first alternative to match names the list kind.  Pairs
+    of consecutive lines are checked for section headers the same way.
 
     Parameters
     ----------
-    lines : list[str]
-        The list of individual lines.
-    window_size : int
-        Number of consecutive lines to join (default 3).
+    text : str
+        The text to check for potential lists.
+    strict : bool
+        Whether to strictly adhere to the wrap length argument.  If True,
+        even heuristic lists will be wrapped.
+    style : str
+        The docstring style in use.  One of 'epytext', 'sphinx', numpy', or 'googlw'.
 
     Returns
     -------
-    list[str]
-        List of multi-line strings, each containing window_size consecutive
-        lines joined with newlines.
-
-    Notes
-    -----
-    Example:
-        lines = ['A', 'B', 'C', 'D']
-        _create_multiline_windows(lines, 2)
-        # Returns: ['A\\nB', 'B\\nC', 'C\\nD']
+    str | None
+        "heuristic", a section header kind, or a single-line list kind, or None if
+        the text isn't a list or contains a field list for the style in use.
     """
-    if len(lines) < window_size:
-        return ["\n".join(lines)] if lines else []
+    if is_heuristic_list(text, strict):
+        return "heuristic"
+
+    split_lines = text.rstrip().splitlines()
+    _field_list_match = _FIELD_LIST_MATCHES.get(style)
+
+    # Both section header patterns need the line before the underline to be all
+    # word characters and spaces, so only those pairs of lines are tried.  A
+    # single line can never be a section header.
+    _is_title = False
+    _section_type = None
+    _line_type = None
+    for _idx, _line in enumerate(split_lines):
+        # Field lists for the style in use are wrapped, so they aren't lists.
+        if _field_list_match is not None and _field_list_match(_line):
+            return None
+
+        if _section_type is None:
+            if _is_title:
+                _section = _SECTION_HEADER_MATCH(f"{split_lines[_idx - 1]}\n{_line}")
+                _section_type = _section.lastgroup if _section else None
+            _is_title = _TITLE_MATCH(_line) is not None
+
+        # Section headers take precedence, so stop as soon as one is found
+        # unless a later field list could still rule the text out.
+        if _section_type is not None and _field_list_match is None:
+            return _section_type
 
-    return [
-        "\n".join(lines[i : i + window_size])
-        for i in range(len(lines) - window_size + 1)
-    ]
+        if _line_type is None:
+            _list = _LIST_MATCH(_line)
+            _line_type = _list.lastgroup if _list else None
+
+    return _section_type or _line_type
 
 
 def is_type_of_list(
@@ -110,38 +177,7 @@ def is_type_of_list(
     bool
         True if a list pattern is identified, False otherwise.
     """
-    split_lines = text.rstrip().splitlines()
-
-    if is_heuristic_list(text, strict):
-        return True
-
-    if is_field_list(text, style):
-        return False
-
-    # Check for multi-line patterns (section headers) first.
-    # These require looking at consecutive lines together.
-    multiline_windows = _create_multiline_windows(split_lines, window_size=2)
-    for window in multiline_windows:
-        if is_rest_section_header(window) or is_numpy_section_header(window):
-            return True
-
-    # Check single-line patterns.
-    return any(
-        (
-            is_bullet_list(line)
-            or is_enumerated_list(line)
-            or is_option_list(line)
-            or is_epytext_field_list(line)
-            or is_sphinx_field_list(line)
-            or is_numpy_field_list(line)
-            or is_google_field_list(line)
-            or is_user_defined_field_list(line)
-            or is_literal_block(line)
-            or is_inline_math(line)
-            or is_alembic_header(line)
-        )
-        for line in split_lines
-    )
+    return get_list_type(text, strict, style) is not None
 
 
 def is_bullet_list(line: str) -> Union[Match[str], None]:
@@ -166,7 +202,7 @@ def is_bullet_list(line: str) -> Union[Match[str], None]:
 
     See <https://docutils.sourceforge.io/docs/user/rst/quickref.html#bullet-lists>`_
     """
-    return re.match(BULLET_REGEX, line)
+    return _BULLET_MATCH(line)
 
 
 def is_definition_list(line: str) -> Union[Match[str], None]:
@@ -189,7 +225,7 @@ def is_definition_list(line: str) -> Union[Match[str], None]:
 
     See <https://docutils.sourceforge.io/docs/user/rst/quickref.html#definition-lists>`_
     """
-    return re.match(ENUM_REGEX, line)
+    return _ENUM_MATCH(line)
 
 
 def is_enumerated_list(line: str) -> Union[Match[str], None]:
@@ -213,7 +249,7 @@ def is_enumerated_list(line: str) -> Union[Match[str], None]:
 
     See <https://docutils.sourceforge.io/docs/user/rst/quickref.html#enumerated-lists>`_
     """
-    return re.match(ENUM_REGEX, line)
+    return _ENUM_MATCH(line)
 
 
 def is_heuristic_list(text: str, strict: bool) -> bool:
@@ -271,4 +307,4 @@ def is_option_list(line: str) -> Union[Match[str], None]:
 
     See <https://docutils.sourceforge.io/docs/user/rst/quickref.html#option-lists>`_
     """
-    return re.match(OPTION_REGEX, line)
+    return _OPTION_MATCH(line)
@@ -27,16 +27,24 @@
 """This module provides docformatter's miscellaneous pattern recognition functions."""
 
 # Standard Library Imports
-import re
 import tokenize
 from re import Match
 from typing import Union
 
 # docformatter Package Imports
-from docformatter.constants import LITERAL_REGEX, URL_REGEX
+from docformatter.constants import INLINE_MATH_REGEX, LITERAL_REGEX, URL_REGEX
+
+# docformatter Local Imports
+from .registry import get_compiled_pattern
+
+_INLINE_MATH_MATCH = get_compiled_pattern(INLINE_MATH_REGEX).match
+_LITERAL_MATCH = get_compiled_pattern(LITERAL_REGEX).match
+_PARAMETER_SEARCH = get_compiled_pattern(r"\s[@\-*]\s").search
+_PYDOC_REF_MATCH = get_compiled_pattern(r"^:\w+:").match
+_SENTENCE_START_MATCH = get_compiled_pattern(r"^[-@\)]").match
+_URL_MATCH = get_compiled_pattern(URL_REGEX).match
 
 
-# TODO: Create INLINE_MATH_REGEX in constants.py and use it here.
 def is_inline_math(line: str) -> Union[Match[str], None]:
     """Check if the line is an inline math expression.
 
@@ -55,7 +63,7 @@ def is_inline_math(line: str) -> Union[Match[str], None]:
     Inline math expressions have the following pattern:
         c :math:`[0, `]`
     """
-    return re.match(r" *\w *:[a-zA-Z0-9_\- ]*:", line)
+    return _INLINE_MATH_MATCH(line)
 
 
 def is_literal_block(line: str) -> Union[Match[str], None]:
@@ -77,7 +85,7 @@ def is_literal_block(line: str) -> Union[Match[str], None]:
         ::
             code
     """
-    return re.match(LITERAL_REGEX, line)
+    return _LITERAL_MATCH(line)
 
 
 def is_probably_beginning_of_sentence(line: str) -> Union[Match[str], None, bool]:
@@ -94,13 +102,12 @@ def is_probably_beginning_of_sentence(line: str) -> Union[Match[str], None, bool
         True if this token is the beginning of a sentence, False otherwise.
     """
     # Check heuristically for a parameter list.
-    for token in ["@", "-", r"\*"]:
-        if re.search(rf"\s{token}\s", line):
-            return True
+    if _PARAMETER_SEARCH(line):
+        return True
 
     stripped_line = line.strip()
-    is_beginning_of_sentence = re.match(r"^[-@\)]", stripped_line)
-    is_pydoc_ref = re.match(r"^:\w+:", stripped_line)
+    is_beginning_of_sentence = _SENTENCE_START_MATCH(stripped_line)
+    is_pydoc_ref = _PYDOC_REF_MATCH(stripped_line)
 
     return is_beginning_of_sentence and not is_pydoc_ref
 
@@ -119,7 +126,7 @@ def is_some_sort_of_code(text: str) -> bool:
         True if the text contains and code patterns, False otherwise.
     """
     return any(
-        len(word) > 50 and not re.match(URL_REGEX, word)  # noqa: PLR2004
+        len(word) > 50 and not _URL_MATCH(word)  # noqa: PLR2004
         for word in text.split()
     )
 
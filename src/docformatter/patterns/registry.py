@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+#       docformatter.patterns.registry.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's compiled regular expression registry."""
+
+# Standard Library Imports
+import re
+from re import Pattern
+from typing import Dict, Tuple
+
+__all__ = ["get_compiled_pattern"]
+
+_compiled_patterns: Dict[Tuple[str, int], Pattern[str]] = {}
+"""Compiled regular expressions keyed by pattern string and flags."""
+
+
+def get_compiled_pattern(regex: str, flags: int = 0) -> Pattern[str]:
+    """Return the compiled regular expression.
+
+    Each regular expression is compiled the first time it is requested and the
+    compiled pattern is kept for the life of the process.  Unlike the re module's
+    own cache, patterns are never evicted, so user-supplied patterns can't push out
+    the built-in ones.
+
+    Parameters
+    ----------
+    regex : str
+        The regular expression to compile.
+    flags : int
+        The re module flags to compile the regular expression with.
+
+    Returns
+    -------
+    Pattern[str]
+        The compiled regular expression.
+    """
+    _pattern = _compiled_patterns.get((regex, flags))
+    if _pattern is None:
+        _pattern = _compiled_patterns[(regex, flags)] = re.compile(regex, flags)
+
+    return _pattern
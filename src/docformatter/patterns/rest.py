@@ -32,6 +32,14 @@ import re
 # docformatter Package Imports
 from docformatter.constants import REST_DIRECTIVE_REGEX, REST_INLINE_REGEX
 
+# docformatter Local Imports
+from .registry import get_compiled_pattern
+
+_REST_DIRECTIVE_FINDITER = get_compiled_pattern(
+    REST_DIRECTIVE_REGEX, re.MULTILINE
+).finditer
+_REST_INLINE_FINDITER = get_compiled_pattern(REST_INLINE_REGEX, re.MULTILINE).finditer
+
 
 def do_find_rest_directives(
     text: str,
@@ -50,7 +58,7 @@ def do_find_rest_directives(
     bool
         True if the docstring is a reST directive, False otherwise.
     """
-    _rest_iter = re.finditer(REST_DIRECTIVE_REGEX, text, flags=re.MULTILINE)
+    _rest_iter = _REST_DIRECTIVE_FINDITER(text)
     return [(_rest.start(0), _rest.end(0)) for _rest in _rest_iter]
 
 
@@ -67,5 +75,5 @@ def do_find_inline_rest_markup(text: str) -> list[tuple[int, int]]:
     bool
         True if the docstring is a reST directive, False otherwise.
     """
-    _rest_iter = re.finditer(REST_INLINE_REGEX, text, flags=re.MULTILINE)
+    _rest_iter = _REST_INLINE_FINDITER(text)
     return [(_rest.start(0), _rest.end(0)) for _rest in _rest_iter]
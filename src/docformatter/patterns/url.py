@@ -28,12 +28,17 @@
 
 # Standard Library Imports
 import contextlib
-import re
 from typing import List, Tuple
 
 # docformatter Package Imports
 from docformatter.constants import URL_REGEX, URL_SKIP_REGEX
 
+# docformatter Local Imports
+from .registry import get_compiled_pattern
+
+_URL_FINDITER = get_compiled_pattern(URL_REGEX).finditer
+_URL_SKIP_SEARCH = get_compiled_pattern(URL_SKIP_REGEX).search
+
 
 def do_find_links(text: str) -> List[Tuple[int, int]]:
     r"""Determine if docstring contains any links.
@@ -49,7 +54,7 @@ def do_find_links(text: str) -> List[Tuple[int, int]]:
         A list of tuples with each tuple containing the starting and ending
         position of each URL found in the description.
     """
-    _url_iter = re.finditer(URL_REGEX, text)
+    _url_iter = _URL_FINDITER(text)
     return [(_url.start(0), _url.end(0)) for _url in _url_iter]
 
 
@@ -75,7 +80,7 @@ def do_skip_link(text: str, index: Tuple[int, int]) -> bool:
         1. The URL scheme pattern such as 's3://' or 'file://' or 'dns:'.
         2. The beginning of a URL link that has been wrapped by the user.
     """
-    _do_skip = re.search(URL_SKIP_REGEX, text[index[0] : index[1]]) is not None
+    _do_skip = _URL_SKIP_SEARCH(text[index[0] : index[1]]) is not None
 
     with contextlib.suppress(IndexError):
         _do_skip = _do_skip or (text[index[0]] == "<" and text[index[1]] != ">")
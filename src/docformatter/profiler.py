@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+#
+#       docformatter.profiler.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's Profiler class."""
+
+# Standard Library Imports
+import contextlib
+import heapq
+import json
+import threading
+import time
+from typing import (
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    TextIO,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+FILE_STAGE = "format file"
+"""The stage timing each file from reading it to writing the result."""
+
+DOCSTRING_STAGE = "format docstring"
+"""The stage timing each docstring that isn't found in the memo."""
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class StageTiming(TypedDict):
+    """The calls and seconds of one stage."""
+
+    stage: str
+    calls: int
+    seconds: float
+
+
+class ProfileReport(TypedDict):
+    """The timings recorded by a Profiler."""
+
+    seconds: float
+    stages: List[StageTiming]
+    slowest_files: List[Dict[str, Union[str, float]]]
+    slowest_docstrings: List[Dict[str, Union[str, float]]]
+
+
+class Profiler:
+    """Record the time spent in each stage of formatting.
+
+    The time of a stage doesn't include the time of the stages timed inside it,
+    so the times of all the stages add up to the time spent formatting.  A
+    disabled Profiler records nothing and costs one method call per stage.
+
+    Each thread keeps its own stack of the stages being timed and its own file
+    name, and the timings are added up under a lock, so one instance can time
+    many threads formatting at once.
+    """
+
+    SLOWEST = 10
+    """Number of the slowest files and docstrings reported."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize a Profiler instance.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to record anything.
+        """
+        self.enabled = enabled
+
+        self.stages: Dict[str, List[float]] = {}
+        """The number of calls and seconds spent in each stage."""
+
+        self.slowest: Dict[str, List[Tuple[float, str]]] = {}
+        """The seconds and name of the slowest files and docstrings."""
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    @property
+    def filename(self) -> str:
+        """The file this thread is formatting, to report the slowest docstrings."""
+        return getattr(self._local, "filename", "")
+
+    @filename.setter
+    def filename(self, filename: str) -> None:
+        self._local.filename = filename
+
+    def stage(self, name: str, item: Union[str, None] = None) -> ContextManager:
+        """Time a stage of formatting.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        item : str
+            The file name for FILE_STAGE or the docstring for DOCSTRING_STAGE,
+            to find the slowest ones.
+
+        Returns
+        -------
+        context manager
+            A context manager timing the code run in it.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+
+        return self._do_time(name, item)
+
+    @contextlib.contextmanager
+    def _do_time(self, name: str, item: Union[str, None]) -> Iterator[None]:
+        """Time a stage of formatting when the Profiler is enabled."""
+        # The seconds spent in the stages timed inside each stage being timed
+        # by this thread.
+        _children = getattr(self._local, "children", None)
+        if _children is None:
+            _children = self._local.children = []
+
+        _children.append(0.0)
+        _start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _seconds = time.perf_counter() - _start
+            _exclusive = _seconds - _children.pop()
+            if _children:
+                _children[-1] += _seconds
+
+            if item is not None and name == DOCSTRING_STAGE:
+                _summary = item.lstrip("rRuU").strip("'\"").strip()
+                _summary = _summary.partition("\n")[0][:60]
+                item = f"{self.filename}: {_summary}"
+
+            with self._lock:
+                _stage = self.stages.setdefault(name, [0, 0.0])
+                _stage[0] += 1
+                _stage[1] += _exclusive
+                if item is not None:
+                    self._do_add_slowest(name, [(_seconds, item)])
+
+    def _do_add_slowest(self, name: str, timings: List[Tuple[float, str]]) -> None:
+        """Keep the slowest of the timings of a stage.
+
+        The caller holds the lock.
+        """
+        _slowest = self.slowest.setdefault(name, [])
+        for _timing in timings:
+            if len(_slowest) < self.SLOWEST:
+                heapq.heappush(_slowest, tuple(_timing))  # type: ignore
+            else:
+                heapq.heappushpop(_slowest, tuple(_timing))  # type: ignore
+
+    def do_clear(self) -> None:
+        """Forget everything recorded.
+
+        New dictionaries are created so a state returned by get_state() is
+        left as it was.
+        """
+        with self._lock:
+            self.stages = {}
+            self.slowest = {}
+
+    def do_update(self, state: Dict[str, Dict]) -> None:
+        """Merge the timings recorded by another Profiler instance.
+
+        Parameters
+        ----------
+        state : dict
+            The stages and slowest timings recorded by the other instance,
+            typically a worker process.
+        """
+        with self._lock:
+            for _name, (_calls, _seconds) in state["stages"].items():
+                _stage = self.stages.setdefault(_name, [0, 0.0])
+                _stage[0] += _calls
+                _stage[1] += _seconds
+
+            for _name, _timings in state["slowest"].items():
+                self._do_add_slowest(_name, _timings)
+
+    def get_state(self) -> Dict[str, Dict]:
+        """Return the timings recorded, to be merged by another instance."""
+        return {"stages": self.stages, "slowest": self.slowest}
+
+    def get_report(self) -> ProfileReport:
+        """Return the timings recorded.
+
+        Returns
+        -------
+        ProfileReport
+            The seconds since the Profiler was created, the calls and seconds of
+            each stage from the slowest, and the slowest files and docstrings.
+        """
+
+        def _get_slowest(name: str, key: str) -> List[Dict[str, Union[str, float]]]:
+            return [
+                {key: _item, "seconds": round(_seconds, 6)}
+                for _seconds, _item in sorted(self.slowest.get(name, []), reverse=True)
+            ]
+
+        return {
+            "seconds": round(time.perf_counter() - self._start, 6),
+            "stages": [
+                {"stage": _name, "calls": int(_calls), "seconds": round(_seconds, 6)}
+                for _name, (_calls, _seconds) in sorted(
+                    self.stages.items(), key=lambda _stage: -_stage[1][1]
+                )
+            ],
+            "slowest_files": _get_slowest(FILE_STAGE, "file"),
+            "slowest_docstrings": _get_slowest(DOCSTRING_STAGE, "docstring"),
+        }
+
+    def do_print_report(self, stream: TextIO, report_format: str = "table") -> None:
+        """Print the timings recorded.
+
+        Parameters
+        ----------
+        stream : TextIO
+            The stream to print the report to.
+        report_format : str
+            Either table or json.
+        """
+        _report = self.get_report()
+        if report_format == "json":
+            print(json.dumps(_report, indent=2), file=stream)
+            return
+
+        _total = sum(_stage["seconds"] for _stage in _report["stages"]) or 1.0
+        _lines = [
+            f"{'stage':<24} {'calls':>8} {'seconds':>10} {'percent':>8}",
+            *(
+                f"{_stage['stage']:<24} {_stage['calls']:>8} "
+                f"{_stage['seconds']:>10.3f} {_stage['seconds'] / _total:>8.1%}"
+                for _stage in _report["stages"]
+            ),
+            f"{'wall time':<24} {'':>8} {_report['seconds']:>10.3f}",
+        ]
+        for _title, _key, _slowest in (
+            ("slowest files", "file", _report["slowest_files"]),
+            ("slowest docstrings", "docstring", _report["slowest_docstrings"]),
+        ):
+            if _slowest:
+                _lines.extend(["", f"{_title}:"])
+                _lines.extend(
+                    f"{_timing['seconds']:>10.3f}  {_timing[_key]}"
+                    for _timing in _slowest
+                )
+
+        print("\n".join(_lines), file=stream)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+#
+#       docformatter.report.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module provides docformatter's Reporter class."""
+
+# Standard Library Imports
+import json
+import pathlib
+import urllib.parse
+from typing import Dict, List, Sequence, TextIO, Tuple, Union
+
+# docformatter Package Imports
+from docformatter import __pkginfo__
+
+REPORT_FORMATS = ("text", "json", "sarif", "github")
+"""The formats files can be reported in."""
+
+INFORMATION_URI = "https://github.com/PyCQA/docformatter"
+"""The home page of docformatter given in the SARIF log."""
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+"""The schema of the SARIF log written for --format sarif."""
+
+_MESSAGES = {
+    "format_required": "Docstring is not formatted.",
+    "formatted": "Docstring was formatted.",
+}
+
+
+def _get_github_escaped(text: str, is_property: bool = False) -> str:
+    """Escape text for a GitHub Actions workflow command."""
+    text = text.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+    if is_property:
+        text = text.replace(":", "%3A").replace(",", "%2C")
+
+    return text
+
+
+class Reporter:
+    """Write a machine-readable record of each file as it is formatted.
+
+    A Reporter without a stream keeps the records instead, so a worker process
+    can return them to be written by the Reporter of the main process.
+    """
+
+    def __init__(self, report_format: str, stream: Union[TextIO, None]) -> None:
+        """Initialize a Reporter instance.
+
+        Parameters
+        ----------
+        report_format : str
+            One of json, sarif, or github.
+        stream : TextIO
+            The stream to write the records to, or None to keep them.
+        """
+        self.report_format = report_format
+        self.stream = stream
+
+        self.records: List[Dict] = []
+        """The records kept when there is no stream."""
+
+        self._count = 0
+        self._errors: List[Dict] = []
+
+    def do_start(self) -> None:
+        """Write anything that comes before the first record."""
+        if self.report_format != "sarif" or self.stream is None:
+            return
+
+        _header = json.dumps(
+            {
+                "version": "2.1.0",
+                "$schema": SARIF_SCHEMA,
+                "runs": [
+                    {
+                        "tool": {
+                            "driver": {
+                                "name": "docformatter",
+                                "version": __pkginfo__.__version__,
+                                "informationUri": INFORMATION_URI,
+                                "rules": [
+                                    {
+                                        "id": "format",
+                                        "shortDescription": {
+                                            "text": "Docstrings are formatted with "
+                                            "the options in effect."
+                                        },
+                                    }
+                                ],
+                            }
+                        },
+                        "results": [],
+                    }
+                ],
+            }
+        )
+
+        # The results are written one at a time between the brackets.
+        self.stream.write(_header[: -len("]}]}")] + "\n")
+
+    def do_add_file(
+        self,
+        filename: str,
+        status: str,
+        changes: Sequence[Tuple[int, int]] = (),
+        diff: Union[str, None] = None,
+    ) -> None:
+        """Record the outcome of formatting a file.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file.
+        status : str
+            One of ok, format_required, or formatted.
+        changes : list
+            The first and last line of each change, indexed at 1.
+        diff : str
+            The unified diff of the changes, if diffs are shown.
+        """
+        _record: Dict = {
+            "path": filename,
+            "status": status,
+            "changes": [
+                {"start_line": _start, "end_line": _end} for _start, _end in changes
+            ],
+        }
+        if diff is not None:
+            _record["diff"] = diff
+
+        self.do_write_record(_record)
+
+    def do_add_error(self, filename: str, message: str) -> None:
+        """Record a file that couldn't be formatted.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file.
+        message : str
+            The description of the error.
+        """
+        self.do_write_record(
+            {"path": filename, "status": "error", "changes": [], "message": message}
+        )
+
+    def do_write_record(self, record: Dict) -> None:
+        """Write a record, or keep it if there is no stream.
+
+        Parameters
+        ----------
+        record : dict
+            The path, status, changes, and optionally the diff or error
+            message of a file.
+        """
+        if self.stream is None:
+            self.records.append(record)
+        elif self.report_format == "json":
+            self.stream.write(json.dumps(record) + "\n")
+        elif self.report_format == "github":
+            self.stream.write(self._get_github_record(record))
+        elif record["status"] == "error":
+            # SARIF notifications go after all the results.
+            self._errors.append(record)
+        else:
+            for _result in self._get_sarif_results(record):
+                self.stream.write(("," if self._count else "") + _result + "\n")
+                self._count += 1
+
+    def do_finish(self) -> None:
+        """Write anything that comes after the last record."""
+        if self.report_format != "sarif" or self.stream is None:
+            return
+
+        _invocation = {
+            "executionSuccessful": not self._errors,
+            "toolExecutionNotifications": [
+                {
+                    "level": "error",
+                    "message": {"text": _error["message"]},
+                    "locations": [self._get_sarif_location(_error["path"])],
+                }
+                for _error in self._errors
+            ],
+        }
+        self.stream.write(
+            f"],\n\"invocations\": [{json.dumps(_invocation)}]\n}}]}}\n"
+        )
+
+    @staticmethod
+    def _get_github_record(record: Dict) -> str:
+        """Return the workflow commands annotating the changes to a file."""
+        _file = _get_github_escaped(record["path"], True)
+        if record["status"] == "error":
+            return f"::error file={_file}::{_get_github_escaped(record['message'])}\n"
+
+        _message = _MESSAGES.get(record["status"], "")
+        return "".join(
+            f"::warning file={_file},line={_change['start_line']},"
+            f"endLine={_change['end_line']},title=docformatter::{_message}\n"
+            for _change in record["changes"]
+        )
+
+    @staticmethod
+    def _get_sarif_location(filename: str, change: Union[Dict, None] = None) -> Dict:
+        """Return the SARIF location of a file or a change to it."""
+        _location: Dict = {
+            "artifactLocation": {
+                "uri": urllib.parse.quote(pathlib.PurePath(filename).as_posix())
+            }
+        }
+        if change is not None:
+            _location["region"] = {
+                "startLine": change["start_line"],
+                "endLine": change["end_line"],
+            }
+
+        return {"physicalLocation": _location}
+
+    def _get_sarif_results(self, record: Dict) -> List[str]:
+        """Return the SARIF results for the changes to a file."""
+        return [
+            json.dumps(
+                {
+                    "ruleId": "format",
+                    "level": "warning" if record["status"] != "formatted" else "note",
+                    "message": {"text": _MESSAGES[record["status"]]},
+                    "locations": [self._get_sarif_location(record["path"], _change)],
+                }
+            )
+            for _change in record["changes"]
+        ]
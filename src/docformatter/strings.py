@@ -28,9 +28,8 @@
 
 # Standard Library Imports
 import contextlib
-import re
 import textwrap
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 # docformatter Package Imports
 import docformatter.patterns as _patterns
@@ -43,6 +42,10 @@ from docformatter.constants import (
     UCODE_QUOTE_TYPES,
 )
 
+_PARAGRAPH_FINDALL = _patterns.get_compiled_pattern(r"\n\n").findall
+_WHITESPACE_SPLIT = _patterns.get_compiled_pattern(r"(\s)").split
+_WHITESPACES_SPLIT = _patterns.get_compiled_pattern(r"(\s+)").split
+
 
 def description_to_list(
     description: str,
@@ -67,7 +70,7 @@ def description_to_list(
           A list containing each line of the description wrapped at wrap_length.
     """
     # This is a description containing only one paragraph.
-    if len(re.findall(r"\n\n", description)) <= 0:
+    if len(_PARAGRAPH_FINDALL(description)) <= 0:
         return textwrap.wrap(
             textwrap.dedent(description),
             width=wrap_length,
@@ -190,7 +193,9 @@ def do_normalize_line_endings(lines, newline):
     return "".join([do_normalize_line(line, newline) for line in lines])
 
 
-def do_normalize_summary(summary: str, noncap: Optional[List[str]] = None) -> str:
+def do_normalize_summary(
+    summary: str, noncap: Optional[Sequence[str]] = None
+) -> str:
     """Return normalized docstring summary.
 
     A normalized docstring summary will have the first word capitalized and
@@ -200,7 +205,7 @@ def do_normalize_summary(summary: str, noncap: Optional[List[str]] = None) -> st
     ----------
     summary : str
         The summary string.
-    noncap : list
+    noncap : sequence
         A user-provided list of words not to capitalize when they appear as
         the first word in the summary.
 
@@ -253,6 +258,33 @@ def do_reindent(text, indentation):
     )
 
 
+def do_splice_edits(text: str, edits: Iterable[Tuple[int, int, str]]) -> str:
+    """Return text with each span replaced by its replacement.
+
+    Parameters
+    ----------
+    text : str
+        The text to edit.
+    edits : iterable
+        The start offset, end offset, and replacement text of each edit, sorted
+        by start offset.  The spans must not overlap.
+
+    Returns
+    -------
+    text : str
+        The edited text.  The text between the edits is kept as it is.
+    """
+    _pieces: List[str] = []
+    _offset = 0
+    for _start, _end, _replacement in edits:
+        _pieces.append(text[_offset:_start])
+        _pieces.append(_replacement)
+        _offset = _end
+    _pieces.append(text[_offset:])
+
+    return "".join(_pieces)
+
+
 def do_split_description(
     text: str,
     indentation: str,
@@ -340,7 +372,7 @@ def do_split_first_sentence(text):
     previous_delimiter = ""
 
     while rest:
-        split = re.split(r"(\s)", rest, maxsplit=1)
+        split = _WHITESPACE_SPLIT(rest, maxsplit=1)
         word = split[0]
         if len(split) == 3:  # noqa PLR2004
             delimiter = split[1]
@@ -375,7 +407,7 @@ def do_split_summary(lines) -> List[str]:
 
     text = lines[0].strip()
 
-    tokens = re.split(r"(\s+)", text)  # Keep whitespace for accurate rejoining
+    tokens = _WHITESPACES_SPLIT(text)  # Keep whitespace for accurate rejoining
     sentence = []
     i = 0
 
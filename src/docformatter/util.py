@@ -27,15 +27,90 @@
 """This module provides docformatter utility functions."""
 
 # Standard Library Imports
+import bisect
 import os
 import re
 import sysconfig
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
 
 unicode = str
 
 _PYTHON_LIBS = set(sysconfig.get_paths().values())
 
+RANGE_FILE_REGEX = re.compile(r"^(?P<path>.+):(?P<first>\d+)(?:-(?P<last>\d+))?$")
+"""Regular expression matching a path:start-end line in a --range-file."""
+
+
+class LineRanges:
+    """A sorted set of line ranges answering overlap queries in O(log n) time.
+
+    Overlapping and adjacent ranges are merged when the set is built, so the
+    first and last rows are both sorted and a binary search finds the only range
+    that can overlap the rows of a docstring.
+    """
+
+    __slots__ = ("firsts", "lasts")
+
+    def __init__(self, line_ranges: Iterable[Tuple[int, int]]) -> None:
+        """Initialize a LineRanges instance.
+
+        Parameters
+        ----------
+        line_ranges : iterable
+            The first and last row of each line range, in any order.
+        """
+        self.firsts: List[int] = []
+        self.lasts: List[int] = []
+
+        for _first, _last in sorted(line_ranges):
+            if self.lasts and _first <= self.lasts[-1] + 1:
+                self.lasts[-1] = max(self.lasts[-1], _last)
+            else:
+                self.firsts.append(_first)
+                self.lasts.append(_last)
+
+    @classmethod
+    def from_range_argument(cls, line_range: Sequence[int]) -> "LineRanges":
+        """Return the line ranges given with one or more --range arguments.
+
+        Parameters
+        ----------
+        line_range : list
+            The first and last row of each range, one range after the other.
+
+        Returns
+        -------
+        LineRanges
+            The line ranges.
+        """
+        return cls(zip(line_range[0::2], line_range[1::2]))
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Return an iterator over the merged line ranges in order."""
+        return zip(self.firsts, self.lasts)
+
+    def __len__(self) -> int:
+        """Return the number of merged line ranges."""
+        return len(self.firsts)
+
+    def is_overlapping(self, start: int, end: int) -> bool:
+        """Determine if the rows under test touch any of the line ranges.
+
+        Parameters
+        ----------
+        start : int
+            The row number where the rows under test begin in the source file.
+        end : int
+            The row number where the rows under test end in the source file.
+
+        Returns
+        -------
+        bool
+            True if any row from start to end is in one of the line ranges.
+        """
+        _idx = bisect.bisect_left(self.lasts, start)
+        return _idx < len(self.firsts) and self.firsts[_idx] <= end
+
 
 def find_py_files(sources, recursive, exclude=None):
     """Find Python source files.
@@ -91,6 +166,136 @@ def find_py_files(sources, recursive, exclude=None):
             yield _name
 
 
+class DocstringSelection:
+    """Select the docstrings to format from the rows they span.
+
+    The selection is built once for each run from the --range and
+    --docstring-length arguments, and extended with any per-file line ranges,
+    so each docstring is checked with a few comparisons before any formatting
+    work is done.
+    """
+
+    __slots__ = ("length_range", "line_ranges")
+
+    def __init__(
+        self,
+        line_range: Union[Sequence[int], None] = None,
+        length_range: Union[Sequence[int], None] = None,
+        line_ranges: Union[LineRanges, None] = None,
+    ) -> None:
+        """Initialize a DocstringSelection instance.
+
+        Parameters
+        ----------
+        line_range : list
+            The first and last row of each --range, one range after the other.
+        length_range : list
+            The minimum and maximum number of rows passed to --docstring-length.
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in, such as the lines
+            changed in git.
+        """
+        self.length_range = None if length_range is None else tuple(length_range)
+        self.line_ranges = tuple(
+            _line_ranges
+            for _line_ranges in (
+                None
+                if line_range is None
+                else LineRanges.from_range_argument(line_range),
+                line_ranges,
+            )
+            if _line_ranges is not None
+        )
+
+    def with_line_ranges(self, line_ranges: LineRanges) -> "DocstringSelection":
+        """Return a copy of the selection that also requires the line ranges.
+
+        Parameters
+        ----------
+        line_ranges : LineRanges
+            The ranges of lines to format docstrings in, such as the lines
+            changed in git.
+
+        Returns
+        -------
+        DocstringSelection
+            The selection of docstrings that are also in the line ranges.
+        """
+        _selection = DocstringSelection(length_range=self.length_range)
+        _selection.line_ranges = (*self.line_ranges, line_ranges)
+        return _selection
+
+    def is_selected(self, start: int, end: int) -> bool:
+        """Determine if the docstring spanning the rows is to be formatted.
+
+        Parameters
+        ----------
+        start : int
+            The row number where the docstring begins in the source file.
+        end : int
+            The row number where the docstring ends in the source file.
+
+        Returns
+        -------
+        bool
+            True if the docstring has the selected length and touches every
+            set of line ranges.
+        """
+        return has_correct_length(self.length_range, start, end) and all(
+            is_in_ranges(_line_ranges, start, end) for _line_ranges in self.line_ranges
+        )
+
+
+def do_read_range_file(filename: str) -> Dict[str, LineRanges]:
+    """Read the line ranges to format in each file from a --range-file.
+
+    Each line of the range file is path:start-end or path:line.  Blank lines
+    and lines starting with # are ignored.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the range file.
+
+    Returns
+    -------
+    line_ranges : dict
+        The line ranges keyed by the absolute path of each file.
+
+    Raises
+    ------
+    ValueError
+        If a line of the range file is not a path and a range of rows.
+    """
+    _line_ranges: Dict[str, List[Tuple[int, int]]] = {}
+
+    with open(filename, encoding="utf-8") as range_file:
+        for _line_no, _line in enumerate(range_file, 1):
+            _line = _line.strip()
+            if not _line or _line.startswith("#"):
+                continue
+
+            _match = RANGE_FILE_REGEX.match(_line)
+            if _match is None:
+                raise ValueError(
+                    f"{filename}:{_line_no}: expected path:start-end, got {_line!r}"
+                )
+
+            _first = int(_match.group("first"))
+            _last = int(_match.group("last") or _first)
+            if not 0 < _first <= _last:
+                raise ValueError(
+                    f"{filename}:{_line_no}: line numbers must be positive and "
+                    f"in order, got {_line!r}"
+                )
+
+            _line_ranges.setdefault(
+                os.path.abspath(_match.group("path")), []
+            ).append((_first, _last))
+
+    return {_path: LineRanges(_ranges) for _path, _ranges in _line_ranges.items()}
+
+
 def has_correct_length(length_range, start, end):
     """Determine if the line under test is within the desired docstring length.
 
@@ -120,10 +325,38 @@ def has_correct_length(length_range, start, end):
     return min_length <= docstring_length <= max_length
 
 
+def is_in_ranges(line_ranges, start, end):
+    """Determine if the line under test touches any of the line ranges.
+
+    This function is used with the --range arguments, the lines changed in git
+    with the --since and --staged arguments, and the lines given in a
+    --range-file.
+
+    Parameters
+    ----------
+    line_ranges: LineRanges | list
+        The first and last row of each line range.
+    start: int
+        The row number where the line under test begins in the source file.
+    end: int
+        The row number where the line under tests ends in the source file.
+
+    Returns
+    -------
+    in_ranges : bool
+        True if in any of the ranges or line ranges is None, else False
+    """
+    if line_ranges is None:
+        return True
+    if not isinstance(line_ranges, LineRanges):
+        line_ranges = LineRanges(line_ranges)
+    return line_ranges.is_overlapping(start, end)
+
+
 def is_in_range(line_range, start, end):
-    """Determine if ??? is within the desired range.
+    """Determine if the line under test touches the desired range.
 
-    This function is used with the --range start_row end_row argument.
+    This function is used with a single --range start_row end_row argument.
 
     Parameters
     ----------
@@ -141,9 +374,7 @@ def is_in_range(line_range, start, end):
     """
     if line_range is None:
         return True
-    return any(
-        line_range[0] <= line_no <= line_range[1] for line_no in range(start, end + 1)
-    )
+    return LineRanges.from_range_argument(line_range).is_overlapping(start, end)
 
 
 def prefer_field_over_url(
@@ -168,6 +168,18 @@ def test_args(args):
         "--exclude",
         nargs="*",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+    )
     parser.add_argument(
         "-n",
         "--non-cap",
@@ -241,10 +253,25 @@ def test_args(args):
         "--range",
         metavar="line",
         dest="line_range",
+        action="extend",
         default=None,
         type=int,
         nargs=2,
     )
+    parser.add_argument(
+        "--range-file",
+        dest="range_file",
+        default=None,
+    )
+    parser.add_argument(
+        "--since",
+        default=None,
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "--docstring-length",
         metavar="length",
@@ -258,6 +285,41 @@ def test_args(args):
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "--rewrite-engine",
+        dest="rewrite_engine",
+        default="tokens",
+    )
+    parser.add_argument(
+        "--diff-mode",
+        dest="diff_mode",
+        default="full",
+    )
+    parser.add_argument(
+        "--format",
+        dest="report_format",
+        default="text",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--profile-format",
+        dest="profile_format",
+        default="table",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "--config",
     )
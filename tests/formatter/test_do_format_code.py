@@ -157,3 +157,65 @@ def test_do_format_code(test_key, test_args, args):
 
     result = uut._do_format_code(source)
     assert result == expected, f"\nFailed {test_key}\nExpected {expected}\nGot {result}"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "test_key",
+    [
+        _key
+        for _key, _strings in TEST_STRINGS.items()
+        # Rebuilding the tokens changes the whitespace of lines with tabs, adds
+        # a backslash to sources without a final newline, and moves the text
+        # after the closing quotes of preserve_line_ending to its own line.
+        if _strings["source"].endswith("\n")
+        and "\t" not in _strings["source"]
+        and _key != "preserve_line_ending"
+    ],
+)
+@pytest.mark.parametrize("args", [NO_ARGS, ["--black", ""]])
+def test_rewrite_engines_match(test_key, test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    source = TEST_STRINGS[test_key]["source"]
+    expected = uut._do_format_code(source)
+
+    uut.rewrite_engine = "spans"
+
+    assert uut._do_format_code(source) == expected, f"\nFailed {test_key}"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "test_key, args",
+    [
+        ("tabbed_indentation", NO_ARGS),
+        ("mixed_indentation", NO_ARGS),
+        ("escaped_newlines", NO_ARGS),
+        ("code_comments", NO_ARGS),
+        ("inline_comment", NO_ARGS),
+        ("method_empty_lines", NO_ARGS),
+        ("strip_blank_lines", ["--black", ""]),
+        ("range_hit", ["--range", "1", "2", ""]),
+        ("length_ignore", ["--docstring-length", "1", "1", ""]),
+        ("issue_51", NO_ARGS),
+    ],
+)
+def test_do_format_code_spans(test_key, test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    uut.rewrite_engine = "spans"
+
+    source = TEST_STRINGS[test_key]["source"]
+    expected = TEST_STRINGS[test_key]["expected"]
+
+    result = uut._do_format_code(source)
+    assert result == expected, f"\nFailed {test_key}\nExpected {expected}\nGot {result}"
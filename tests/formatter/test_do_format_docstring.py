@@ -30,6 +30,7 @@
 
 # Standard Library Imports
 import contextlib
+import dataclasses
 import itertools
 import random
 import sys
@@ -222,7 +223,7 @@ def test_do_format_docstring_random_with_wrap(
         range(min_line_length, 100), range(20)
     ):
         indentation = " " * num_indents
-        uut.args.wrap_summaries = max_length
+        uut.options = dataclasses.replace(uut.options, wrap_summaries=max_length)
         formatted_text = indentation + uut._do_format_docstring(
             indentation=indentation,
             docstring=generate_random_docstring(max_word_length=min_line_length // 2),
@@ -211,13 +211,38 @@ def test_do_remove_preceding_blank_lines(test_key, block):
 
     tokens = list(tokenize.generate_tokens(StringIO(source, newline="").readline))
 
-    result = _format._do_remove_preceding_blank_lines(tokens, block)
+    result = _format._do_remove_preceding_blank_lines(
+        tokens, _format._get_block_index(block)
+    )
     for _idx in range(len(result)):
         assert (
             result[_idx].string == expected[_idx]
         ), f"\nFailed {test_key}\nExpected {expected[_idx]}\nGot {result[_idx].string}"
 
 
+@pytest.mark.unit
+def test_do_remove_preceding_blank_lines_shared_blank_lines():
+    source = 'x = 1\n\n\n"""Doc one."""\n\n"""Doc two."""\n'
+
+    tokens = list(tokenize.generate_tokens(StringIO(source, newline="").readline))
+
+    result = _format._do_remove_preceding_blank_lines(
+        tokens,
+        _format._get_block_index([(1, 6, "attribute"), (1, 9, "attribute")]),
+    )
+    assert [_token.string for _token in result] == [
+        "x",
+        "=",
+        "1",
+        "\n",
+        '"""Doc one."""',
+        "\n",
+        '"""Doc two."""',
+        "\n",
+        "",
+    ]
+
+
 @pytest.mark.integration
 @pytest.mark.order(5)
 @pytest.mark.parametrize(
@@ -308,3 +333,21 @@ def test_do_update_token_indices(test_key):
             f"\nFailed {test_key} end index\n"
             f"Expected {expected[1]}\nGot {result[idx].end}"
         )
+
+
+@pytest.mark.unit
+def test_get_line_offsets():
+    assert _format._get_line_offsets("a\r\nbc\rd\n\x0ce") == [0, 3, 6, 8, 10]
+
+
+@pytest.mark.unit
+def test_rewritten_tokens():
+    tokens = list(range(10))
+    uut = _format._RewrittenTokens(tokens)
+    uut.do_add_replacement(2, ["a", "b", "c"], 4)
+    uut.do_add_replacement(6, ["d"], 9)
+
+    assert list(uut) == [0, 1, "a", "b", "c", 4, 5, "d", 9]
+    assert uut.get_position(4) == (0, 2)
+    assert uut.get_position(5) == (-1, 4)
+    assert uut.get_position(8) == (-1, 9)
@@ -28,7 +28,9 @@
 """Module for testing various Formatter class methods."""
 
 # Standard Library Imports
+import concurrent.futures
 import contextlib
+import dataclasses
 import sys
 import tokenize
 from io import BytesIO
@@ -46,7 +48,8 @@ with contextlib.suppress(ImportError):
 import pytest
 
 # docformatter Package Imports
-from docformatter.format import Formatter
+import docformatter.format as _format
+from docformatter.format import FormatOutcome, Formatter
 
 with open("tests/_data/string_files/format_methods.toml", "rb") as f:
     TEST_STRINGS = tomllib.load(f)
@@ -72,9 +75,10 @@ def test_do_add_blank_lines(args):
         sys.stdin,
         sys.stdout,
     )
-    uut._do_add_blank_lines(2, 2, 2)
+    new_tokens = []
+    uut._do_add_blank_lines(new_tokens, 2, 2, 2)
 
-    assert uut.new_tokens == [
+    assert new_tokens == [
         TokenInfo(type=4, string="\n", start=(2, 0), end=(2, 1), line="\n"),
         TokenInfo(type=4, string="\n", start=(3, 0), end=(3, 1), line="\n"),
     ]
@@ -119,10 +123,11 @@ def test_do_add_unformatted_docstring(test_key, args):
         ),
     ]
 
-    uut._do_add_unformatted_docstring(token, "function")
+    new_tokens = []
+    uut._do_add_unformatted_docstring(new_tokens, token, "function")
     assert (
-        uut.new_tokens == expected
-    ), f"\nFailed {test_key}\nExpected {expected}\nGot {uut.new_tokens}"
+        new_tokens == expected
+    ), f"\nFailed {test_key}\nExpected {expected}\nGot {new_tokens}"
 
 
 @pytest.mark.integration
@@ -173,10 +178,11 @@ def test_do_add_formatted_docstring(test_key, test_args, args):
         tokenize.TokenInfo(type=4, string="\n", start=(7, 0), end=(7, 1), line="\n"),
     ]
 
-    uut._do_add_formatted_docstring(token, next_token, "function", 1)
+    new_tokens = []
+    uut._do_add_formatted_docstring(new_tokens, token, next_token, "function", 1)
     assert (
-        uut.new_tokens == expected
-    ), f"\nFailed {test_key}\nExpected {expected}\nGot {uut.new_tokens}"
+        new_tokens == expected
+    ), f"\nFailed {test_key}\nExpected {expected}\nGot {new_tokens}"
 
 
 @pytest.mark.integration
@@ -290,7 +296,274 @@ def test_do_rewrite_docstring_blocks(test_key, test_args, args):
             )
         )
 
-    uut._do_rewrite_docstring_blocks(tokens)
+    new_tokens = uut._do_rewrite_docstring_blocks(tokens)
     assert (
-        uut.new_tokens == expected
-    ), f"\nFailed {test_key}\nExpected {expected}\nGot {uut.new_tokens}"
+        new_tokens == expected
+    ), f"\nFailed {test_key}\nExpected {expected}\nGot {new_tokens}"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_do_format_docstring_memoized(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    docstring = '"""   return the name   """'
+    expected = uut._do_format_docstring("    ", docstring)
+
+    assert uut._do_format_docstring_memoized("    ", docstring, uut.options) == expected
+    assert uut._do_format_docstring_memoized("    ", docstring, uut.options) == expected
+    assert (
+        uut._do_format_docstring_memoized("", docstring, uut.options)
+        == '"""Return the name."""'
+    )
+    assert uut.memo_stats == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [["--tab-width", "4", ""]])
+def test_do_format_docstring_tab_compensation(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    docstring = '"""' + "word " * 14 + '"""'
+    expected = '"""Word' + " word" * 12 + '\n\tword."""'
+
+    assert uut._do_format_docstring("\t", docstring) == expected
+    assert uut._do_format_docstring("\t", docstring) == expected
+    assert uut.options.wrap_summaries == 79
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_do_format_docstring_memoized_evicts_least_recently_used(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    uut.MAX_MEMO_ENTRIES = 2
+
+    uut._do_format_docstring_memoized("", '"""One."""', uut.options)
+    uut._do_format_docstring_memoized("", '"""Two."""', uut.options)
+    uut._do_format_docstring_memoized("", '"""One."""', uut.options)
+    uut._do_format_docstring_memoized("", '"""Three."""', uut.options)
+
+    assert [key[2] for key in uut.memo] == ['"""One."""', '"""Three."""']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_format_source(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    source = 'def foo():\n    """   return the name   """\n'
+
+    outcome = uut.format_source(source)
+    assert outcome.source == source
+    assert outcome.formatted == 'def foo():\n    """Return the name."""\n'
+    assert outcome.changed
+
+    outcome = uut.format_source(outcome.formatted)
+    assert not outcome.changed
+    assert uut.memo_stats == {"misses": 2}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "source, formatted, expected",
+    [
+        ("x = 1\n", "x = 1\n", []),
+        ('"""a"""\n\n\nx = 1\n', '"""A."""\n\nx = 1\n', [(1, 2)]),
+        ('def foo():\n    """a"""\n', 'def foo():\n    """A."""\n', [(2, 2)]),
+        ('"""a"""\n', '"""a"""\n\n', [(1, 1)]),
+    ],
+)
+def test_get_changed_lines(source, formatted, expected):
+    assert FormatOutcome(source, formatted).get_changed_lines() == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [["--rewrite-engine", "spans", ""]])
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("x = 1\n", []),
+        (
+            'def foo():\n\n    """a"""\n    x = 1\n\n\n'
+            'def bar():\n    """b"""\n',
+            [(1, 3, 1, 2), (7, 8, 6, 7)],
+        ),
+        ('def foo():\n    """a"""', [(1, 2, 1, 2)]),
+    ],
+)
+def test_get_changed_regions(test_args, args, source, expected):
+    uut = Formatter(test_args, sys.stderr, sys.stdin, sys.stdout)
+
+    outcome = uut.format_source(source)
+    assert outcome.get_changed_regions() == expected
+    assert dataclasses.replace(outcome, edits=None).get_changed_regions() is None
+    assert (
+        dataclasses.replace(outcome, formatted="# changed\n" + outcome.formatted)
+    ).get_changed_regions() is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_format_source_with_options(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    source = 'def foo():\n    """   return the name   """\n'
+    options = dataclasses.replace(uut.options, pre_summary_space=True)
+
+    assert uut.format_source(source).formatted == (
+        'def foo():\n    """Return the name."""\n'
+    )
+    assert uut.format_source(source, options).formatted == (
+        'def foo():\n    """ Return the name."""\n'
+    )
+    assert uut.format_source(source).formatted == (
+        'def foo():\n    """Return the name."""\n'
+    )
+    assert uut.memo_stats == {"hits": 1, "misses": 2}
+    assert not uut.options.pre_summary_space
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_format_source_from_threads(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    uut.MAX_MEMO_ENTRIES = 8
+    sources = [
+        f'def foo_{i}():\n    """   return name {i % 20}   """\n' for i in range(200)
+    ]
+    expected = [
+        f'def foo_{i}():\n    """Return name {i % 20}."""\n' for i in range(200)
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(uut._do_format_code, sources))
+
+    assert results == expected
+    assert uut.memo_stats["hits"] + uut.memo_stats["misses"] == 200
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_format_source_with_line_ranges(test_args, args, monkeypatch):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    _calls = []
+    _get_newlines_by_type = _format._get_newlines_by_type
+
+    def _counting_get_newlines_by_type(tokens, index):
+        _calls.append(tokens[index].start[0])
+        return _get_newlines_by_type(tokens, index)
+
+    monkeypatch.setattr(
+        _format, "_get_newlines_by_type", _counting_get_newlines_by_type
+    )
+    source = "\n\n".join(
+        f'def foo_{i}():\n    """   return name {i}   """\n' for i in range(5)
+    )
+    options = dataclasses.replace(uut.options, line_range=(1, 2, 17, 18))
+
+    outcome = uut.format_source(source, options, line_ranges=[(9, 18)])
+
+    assert outcome.formatted == source.replace(
+        '"""   return name 4   """', '"""Return name 4."""'
+    )
+    assert _calls == [18]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_rewrite_skips_newlines_for_unformatted_blocks(test_args, args, monkeypatch):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    _calls = []
+    monkeypatch.setattr(
+        _format,
+        "_get_newlines_by_type",
+        lambda tokens, index: _calls.append(index) or 0,
+    )
+    source = (
+        'x = 1\n\n\ndef foo():\n    """   return\n\n    the name   """\n\n\n'
+        'class Bar:\n    """   the\n    name\n    """\n'
+    )
+    options = dataclasses.replace(uut.options, length_range=(1, 2))
+
+    assert not uut.format_source(source, options).changed
+    assert _calls == []
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_rewrite_engines_match_on_module(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    source = '"""module docs"""\nimport os\n\n' + "".join(
+        f'class Foo{i}:\n\n    """   class {i} docs\n\n    more docs\n    """\n'
+        f'    x = {i}\n    """attribute docs"""\n    @property\n'
+        f'    def foo(self, a):\n\n        """\n        foo docs\n        """\n'
+        f"        return a\n\n"
+        for i in range(3)
+    )
+    expected = uut.format_source(source).formatted
+
+    uut.rewrite_engine = "spans"
+
+    assert uut.format_source(source).formatted == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("args", [[""]])
+def test_span_engine_keeps_code(test_args, args):
+    uut = Formatter(
+        test_args,
+        sys.stderr,
+        sys.stdin,
+        sys.stdout,
+    )
+    uut.rewrite_engine = "spans"
+    source = (
+        'def foo():\n    """   foo docs   """   \n'
+        "    x = (1,\t2) + \\\n        (3,)\n"
+        "    return x\n"
+    )
+
+    assert uut.format_source(source).formatted == source.replace(
+        '"""   foo docs   """   ', '"""Foo docs."""'
+    )
@@ -28,7 +28,9 @@
 """Module for testing the list pattern detection functions."""
 
 # Standard Library Imports
+import ast
 import contextlib
+import glob
 import sys
 
 with contextlib.suppress(ImportError):
@@ -43,7 +45,25 @@ with contextlib.suppress(ImportError):
 import pytest
 
 # docformatter Package Imports
-from docformatter.patterns import is_type_of_list
+from docformatter.patterns import (
+    get_list_type,
+    is_alembic_header,
+    is_bullet_list,
+    is_enumerated_list,
+    is_epytext_field_list,
+    is_field_list,
+    is_google_field_list,
+    is_heuristic_list,
+    is_inline_math,
+    is_literal_block,
+    is_numpy_field_list,
+    is_numpy_section_header,
+    is_option_list,
+    is_rest_section_header,
+    is_sphinx_field_list,
+    is_type_of_list,
+    is_user_defined_field_list,
+)
 
 with open("tests/_data/string_files/list_patterns.toml", "rb") as f:
     TEST_STRINGS = tomllib.load(f)
@@ -85,3 +105,82 @@ def test_is_type_of_list(test_key):
 
     result = is_type_of_list(text, strict, style)
     assert result == expected, f"\nFailed {test_key}\nExpected {expected}\nGot {result}"
+
+
+def _get_docstring_corpus():
+    """Return every test data string and docstring in the repository."""
+    _corpus = []
+    for _data_file in sorted(glob.glob("tests/_data/string_files/*.toml")):
+        with open(_data_file, "rb") as f:
+            for _value in tomllib.load(f).values():
+                for _text in _value.values():
+                    if isinstance(_text, str):
+                        _corpus.append(_text)
+                        _corpus.extend(_text.split("\n\n"))
+
+    for _source_file in sorted(glob.glob("**/*.py", recursive=True)):
+        with open(_source_file, encoding="utf-8") as f:
+            _tree = ast.parse(f.read())
+        for _node in ast.walk(_tree):
+            with contextlib.suppress(TypeError):
+                _docstring = ast.get_docstring(_node, clean=False)
+                if _docstring:
+                    _corpus.append(_docstring)
+
+    return _corpus
+
+
+def _get_list_type_by_predicates(text, strict, style):
+    """Return the list kind found by trying each predicate in turn."""
+    split_lines = text.rstrip().splitlines()
+
+    if is_heuristic_list(text, strict):
+        return "heuristic"
+
+    if is_field_list(text, style):
+        return None
+
+    if len(split_lines) < 2:
+        windows = ["\n".join(split_lines)] if split_lines else []
+    else:
+        windows = [
+            "\n".join(split_lines[i : i + 2]) for i in range(len(split_lines) - 1)
+        ]
+    for window in windows:
+        if is_rest_section_header(window):
+            return "rest_section"
+        if is_numpy_section_header(window):
+            return "numpy_section"
+
+    for line in split_lines:
+        for kind, predicate in (
+            ("bullet", is_bullet_list),
+            ("enumerated", is_enumerated_list),
+            ("option", is_option_list),
+            ("epytext", is_epytext_field_list),
+            ("sphinx", is_sphinx_field_list),
+            ("numpy", is_numpy_field_list),
+            ("google", is_google_field_list),
+            ("user_defined", is_user_defined_field_list),
+            ("literal", is_literal_block),
+            ("inline_math", is_inline_math),
+            ("alembic", is_alembic_header),
+        ):
+            if predicate(line):
+                return kind
+
+    return None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("style", ["sphinx", "epytext", "numpy", "google"])
+@pytest.mark.parametrize("strict", [True, False])
+def test_get_list_type_matches_predicates(style, strict):
+    """Classify every docstring the same as the individual predicates."""
+    for text in _get_docstring_corpus():
+        expected = _get_list_type_by_predicates(text, strict, style)
+
+        result = get_list_type(text, strict, style)
+        assert (
+            result == expected
+        ), f"\nFailed {text!r}\nExpected {expected}\nGot {result}"
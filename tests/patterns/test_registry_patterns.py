@@ -0,0 +1,64 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.patterns.test_registry_patterns.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+"""Module for testing the compiled regular expression registry."""
+
+# Standard Library Imports
+import re
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter.constants import BULLET_REGEX, REST_DIRECTIVE_REGEX
+from docformatter import patterns
+from docformatter.patterns import get_compiled_pattern
+
+
+@pytest.mark.unit
+def test_get_compiled_pattern():
+    """Compile each regular expression once."""
+    uut = get_compiled_pattern(BULLET_REGEX)
+
+    assert uut.pattern == BULLET_REGEX
+    assert uut is get_compiled_pattern(BULLET_REGEX)
+
+
+@pytest.mark.unit
+def test_get_compiled_pattern_with_flags():
+    """Keep a separate pattern for each set of flags."""
+    uut = get_compiled_pattern(REST_DIRECTIVE_REGEX, re.MULTILINE)
+
+    assert uut.flags & re.MULTILINE
+    assert uut is not get_compiled_pattern(REST_DIRECTIVE_REGEX)
+
+
+@pytest.mark.unit
+def test_registry_exports():
+    """Export only get_compiled_pattern() from the registry module."""
+    assert "get_compiled_pattern" in vars(patterns)
+    assert "Dict" not in vars(patterns)
+    assert "Pattern" not in vars(patterns)
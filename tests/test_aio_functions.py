@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+#
+#       tests.test_aio_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing docformatter's asyncio API."""
+
+# Standard Library Imports
+import asyncio
+import concurrent.futures
+import threading
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+import docformatter.aio as _aio
+from docformatter.aio import AsyncFormatter, format_sources
+from docformatter.configuration import FormatOptions
+
+SOURCE = 'def foo():\n    """   hello world   """\n'
+EXPECTED = 'def foo():\n    """Hello world."""\n'
+
+
+class TestAsyncFormatter:
+    """Class for testing the AsyncFormatter class."""
+
+    @pytest.mark.integration
+    def test_format_sources(self):
+        """Format every buffer, keeping the type of each."""
+        result = asyncio.run(
+            format_sources(
+                [
+                    ("a.py", 1, SOURCE),
+                    ("b.py", 1, SOURCE.replace("hello", "héllo").encode()),
+                ],
+                FormatOptions(),
+            )
+        )
+
+        assert result == [EXPECTED, EXPECTED.replace("Hello", "Héllo").encode()]
+
+    @pytest.mark.integration
+    def test_format_source_encoding(self):
+        """Decode and encode bytes with the encoding given."""
+        uut = AsyncFormatter(FormatOptions())
+
+        assert asyncio.run(
+            uut.format_source("a.py", 1, SOURCE.encode("utf-16"), "utf-16")
+        ) == EXPECTED.encode("utf-16")
+
+    @pytest.mark.integration
+    def test_coalesce_same_version(self, monkeypatch):
+        """Format a buffer version once however many times it is requested."""
+        calls = []
+        _do_format_buffer = _aio._do_format_buffer
+
+        def _counting_format_buffer(*args):
+            calls.append(args[0])
+            return _do_format_buffer(*args)
+
+        monkeypatch.setattr(_aio, "_do_format_buffer", _counting_format_buffer)
+
+        result = asyncio.run(
+            format_sources([("a.py", 1, SOURCE), ("a.py", 1, SOURCE)], FormatOptions())
+        )
+
+        assert result == [EXPECTED, EXPECTED]
+        assert calls == [SOURCE]
+
+    @pytest.mark.integration
+    def test_cancel_old_version(self, monkeypatch):
+        """Cancel the request for a buffer when a newer version is requested."""
+        _started = threading.Event()
+        _release = threading.Event()
+        _do_format_buffer = _aio._do_format_buffer
+
+        def _blocking_format_buffer(*args):
+            if args[0] == SOURCE:
+                _started.set()
+                _release.wait(5)
+            return _do_format_buffer(*args)
+
+        monkeypatch.setattr(_aio, "_do_format_buffer", _blocking_format_buffer)
+
+        async def _edit_while_formatting():
+            uut = AsyncFormatter(FormatOptions())
+            _old = asyncio.ensure_future(uut.format_source("a.py", 1, SOURCE))
+            await asyncio.get_running_loop().run_in_executor(None, _started.wait, 5)
+
+            _new = await uut.format_source("a.py", 2, '"""   new docs   """\n')
+            _release.set()
+
+            with pytest.raises(asyncio.CancelledError):
+                await _old
+
+            return _new, uut.running
+
+        assert asyncio.run(_edit_while_formatting()) == ('"""New docs."""\n', {})
+
+    @pytest.mark.integration
+    def test_format_sources_superseded(self):
+        """Return None for a buffer replaced by a later entry."""
+        result = asyncio.run(
+            format_sources(
+                [("a.py", 1, SOURCE), ("a.py", 2, '"""   new docs   """\n')],
+                FormatOptions(),
+            )
+        )
+
+        assert result == [None, '"""New docs."""\n']
+
+    @pytest.mark.integration
+    def test_process_pool_executor(self):
+        """Format in worker processes with the options given."""
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            result = asyncio.run(
+                format_sources(
+                    [("a.py", 1, SOURCE), ("b.py", 1, SOURCE)],
+                    FormatOptions(pre_summary_space=True),
+                    executor,
+                )
+            )
+
+        assert result == [EXPECTED.replace('"""H', '""" H')] * 2
@@ -0,0 +1,168 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.test_cache_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing the result cache functions."""
+
+# Standard Library Imports
+import argparse
+import os
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter import Cache, __pkginfo__
+
+
+def _get_args(**kwargs):
+    _args = {
+        "files": ["a.py"],
+        "check": False,
+        "in_place": False,
+        "wrap_summaries": 79,
+        "wrap_descriptions": 72,
+    }
+    _args.update(kwargs)
+    return argparse.Namespace(**_args)
+
+
+class TestCache:
+    """Class for testing the Cache class."""
+
+    @pytest.mark.unit
+    def test_fingerprint_ignores_non_formatting_options(self):
+        """Return the same fingerprint when only file selection options change."""
+        assert Cache.get_fingerprint(_get_args()) == Cache.get_fingerprint(
+            _get_args(files=["b.py"], check=True, in_place=True)
+        )
+
+    @pytest.mark.unit
+    def test_fingerprint_uses_formatting_options(self):
+        """Return a new fingerprint when a formatting option changes."""
+        assert Cache.get_fingerprint(_get_args()) != Cache.get_fingerprint(
+            _get_args(wrap_summaries=88)
+        )
+
+    @pytest.mark.unit
+    def test_fingerprint_uses_version(self, monkeypatch):
+        """Return a new fingerprint when the docformatter version changes."""
+        _fingerprint = Cache.get_fingerprint(_get_args())
+        monkeypatch.setattr(__pkginfo__, "__version__", "0.0.0")
+
+        assert Cache.get_fingerprint(_get_args()) != _fingerprint
+
+    @pytest.mark.integration
+    def test_is_clean(self, temporary_directory):
+        """Report files marked as clean once the cache is written and read."""
+        uut = Cache(temporary_directory, _get_args())
+        assert not uut.is_clean("a.py", "digest")
+
+        uut.do_mark_clean("a.py", "digest")
+        uut.do_write()
+
+        uut = Cache(temporary_directory, _get_args())
+        assert uut.is_clean("a.py", "digest")
+        assert not uut.is_clean("a.py", "changed")
+        assert not uut.is_clean("b.py", "digest")
+
+    @pytest.mark.integration
+    def test_other_version_is_ignored(self, temporary_directory, monkeypatch):
+        """Ignore entries written by another docformatter version."""
+        uut = Cache(temporary_directory, _get_args())
+        uut.do_mark_clean("a.py", "digest")
+        uut.do_write()
+
+        monkeypatch.setattr(__pkginfo__, "__version__", "0.0.0")
+        monkeypatch.setattr(
+            Cache, "get_fingerprint", classmethod(lambda cls, args: uut.fingerprint)
+        )
+        uut = Cache(temporary_directory, _get_args())
+
+        assert not uut.is_clean("a.py", "digest")
+
+    @pytest.mark.integration
+    def test_evict_entries(self, temporary_directory, monkeypatch):
+        """Keep only the most recently used entries."""
+        monkeypatch.setattr(Cache, "MAX_ENTRIES", 2)
+
+        uut = Cache(temporary_directory, _get_args())
+        for _idx, _name in enumerate(["a.py", "b.py", "c.py"]):
+            uut.do_mark_clean(_name, "digest")
+            uut.updates[os.path.abspath(_name)][1] = _idx
+        uut.do_write()
+
+        uut = Cache(temporary_directory, _get_args())
+        assert not uut.is_clean("a.py", "digest")
+        assert uut.is_clean("b.py", "digest")
+        assert uut.is_clean("c.py", "digest")
+
+    @pytest.mark.integration
+    def test_evict_files(self, temporary_directory, monkeypatch):
+        """Keep only the most recently written cache files."""
+        monkeypatch.setattr(Cache, "MAX_FILES", 2)
+
+        for _length in [70, 71, 72]:
+            uut = Cache(temporary_directory, _get_args(wrap_summaries=_length))
+            uut.do_mark_clean("a.py", "digest")
+            uut.do_write()
+            os.utime(uut.filename, (_length, _length))
+
+        assert len(os.listdir(temporary_directory)) == 2
+        assert os.path.isfile(uut.filename)
+
+    @pytest.mark.integration
+    def test_failed_write_removes_temporary_file(
+        self, temporary_directory, monkeypatch
+    ):
+        """Remove the temporary file when the cache file can't be replaced."""
+
+        def _do_fail(*args):
+            raise OSError("replace failed")
+
+        uut = Cache(temporary_directory, _get_args())
+        uut.do_mark_clean("a.py", "digest")
+        monkeypatch.setattr(os, "replace", _do_fail)
+        uut.do_write()
+
+        assert os.listdir(temporary_directory) == []
+
+    @pytest.mark.integration
+    def test_interrupted_write_removes_temporary_file(
+        self, temporary_directory, monkeypatch
+    ):
+        """Remove the temporary file and re-raise when writing is interrupted."""
+
+        def _do_interrupt(*args):
+            raise KeyboardInterrupt
+
+        uut = Cache(temporary_directory, _get_args())
+        uut.do_mark_clean("a.py", "digest")
+        monkeypatch.setattr("docformatter.cache.json.dump", _do_interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            uut.do_write()
+
+        assert os.listdir(temporary_directory) == []
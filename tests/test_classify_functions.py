@@ -29,9 +29,10 @@
 
 # Standard Library Imports
 import contextlib
+import glob
 import sys
 import tokenize
-from io import BytesIO
+from io import BytesIO, StringIO
 
 with contextlib.suppress(ImportError):
     if sys.version_info >= (3, 11):
@@ -46,12 +47,14 @@ import pytest
 
 # docformatter Package Imports
 from docformatter.classify import (
+    TokenStream,
     do_find_docstring_blocks,
     is_attribute_docstring,
     is_class_docstring,
     is_closing_quotes,
     is_code_line,
     is_definition_line,
+    is_docstring_at_end_of_file,
     is_f_string,
     is_function_or_method_docstring,
     is_inline_comment,
@@ -66,6 +69,159 @@ with open("tests/_data/string_files/classify_functions.toml", "rb") as f:
     TEST_STRINGS = tomllib.load(f)
 
 
+def _get_corpus():
+    """Return every test data string and Python source file in the repository."""
+    _corpus = {}
+    for _data_file in sorted(glob.glob("tests/_data/string_files/*.toml")):
+        with open(_data_file, "rb") as f:
+            for _key, _value in tomllib.load(f).items():
+                for _field, _text in _value.items():
+                    if isinstance(_text, str):
+                        _corpus[f"{_data_file}:{_key}:{_field}"] = _text
+
+    for _source_file in sorted(glob.glob("**/*.py", recursive=True)):
+        with open(_source_file, encoding="utf-8") as f:
+            _corpus[_source_file] = f.read()
+
+    return _corpus
+
+
+def _is_attribute_docstring_by_scanning(tokens, index):
+    """Scan forward from the first token for an assignment."""
+    if index < 2:
+        return False
+
+    return any(
+        tok.type == tokenize.OP and tok.string == "=" and '"""' not in tok.line
+        for tok in tokens[0:index]
+    )
+
+
+def _is_class_docstring_by_scanning(tokens, index):
+    """Walk backward to the most recent class, def, async, or assignment."""
+    for i in range(index - 1, -1, -1):
+        tok = tokens[i]
+        if tok.type == tokenize.NAME and tok.string == "class":
+            return True
+        if tok.type == tokenize.NAME and tok.string in ("def", "async"):
+            return False
+        if tok.type == tokenize.OP and tok.string == "=":
+            return False
+
+    return False
+
+
+def _is_function_or_method_docstring_by_scanning(tokens, index):
+    """Walk backward to the most recent def, async, or class."""
+    for i in range(index - 1, -1, -1):
+        tok = tokens[i]
+        if tok.type == tokenize.NAME and tok.string in ("def", "async"):
+            return True
+        if tok.type == tokenize.NAME and tok.string == "class":
+            return False
+
+    return False
+
+
+def _is_module_docstring_by_scanning(tokens, index):
+    """Scan forward from the first token for a code token."""
+    return all(
+        tokens[k].type
+        in (tokenize.ENCODING, tokenize.COMMENT, tokenize.NEWLINE, tokenize.NL)
+        for k in range(index)
+    )
+
+
+def _is_docstring_at_end_of_file_by_scanning(tokens, index):
+    """Scan forward to the end of the file for a code token."""
+    return all(
+        tokens[i].type
+        in (tokenize.NL, tokenize.NEWLINE, tokenize.DEDENT, tokenize.ENDMARKER)
+        for i in range(index + 1, len(tokens))
+    )
+
+
+def _do_find_anchor_index(tokens, docstring_index, target):
+    """Walk backward from a docstring to find the matching anchor."""
+    i = docstring_index - 1
+    saw_decorator = False
+
+    while i >= 0:
+        tok = tokens[i]
+
+        if tok.type == tokenize.OP and tok.string == "@":
+            saw_decorator = True
+
+        if target == "class" and tok.type == tokenize.NAME and tok.string == "class":
+            return i
+
+        if target == "def" and tok.type == tokenize.NAME and tok.string == "def":
+            if saw_decorator:
+                while i > 0 and tokens[i - 1].type != tokenize.NEWLINE:
+                    i -= 1
+            return i
+
+        if target == "attribute" and tok.type == tokenize.NAME:
+            return i
+
+        i -= 1
+
+    return None
+
+
+def _do_find_docstring_blocks_by_scanning(tokens):
+    """Identify docstring blocks by scanning backward from each string token.
+
+    This is the original quadratic implementation of do_find_docstring_blocks()
+    and is the reference the single pass implementation is checked against.
+    """
+    docstring_blocks = []
+
+    for i, token in enumerate(tokens):
+        if (
+            token.type != tokenize.STRING
+            or not token.string.startswith(
+                (
+                    '"""',
+                    'r"""',
+                    'R"""',
+                    'u"""',
+                    'U"""',
+                    "'''",
+                    "r'''",
+                    "R'''",
+                    "u'''",
+                    "U'''",
+                )
+            )
+            or " = " in token.line
+        ):
+            continue
+
+        if is_module_docstring(tokens, i):
+            docstring_blocks.append((0, i, "module"))
+            continue
+
+        for _classifier, _target, _type in (
+            (is_attribute_docstring, "attribute", "attribute"),
+            (is_class_docstring, "class", "class"),
+            (is_function_or_method_docstring, "def", "function"),
+        ):
+            if _classifier(tokens, i):
+                anchor_idx = _do_find_anchor_index(tokens, i, target=_target)
+                if anchor_idx is not None:
+                    docstring_blocks.append((anchor_idx, i, _type))
+                break
+
+    i = 1
+    while i < len(docstring_blocks):
+        if docstring_blocks[i][0] == docstring_blocks[i - 1][0]:
+            docstring_blocks.pop(i)
+        i += 1
+
+    return docstring_blocks
+
+
 def get_tokens(source: str) -> list[tokenize.TokenInfo]:
     return list(tokenize.tokenize(BytesIO(source.encode()).readline))
 
@@ -183,3 +339,84 @@ def test_find_docstring_blocks(test_key, expected):
 
     result = do_find_docstring_blocks(tokens)
     assert result == expected, f"Failed {test_key}\nExpected {expected}\nGot {result}"
+
+
+@pytest.mark.unit
+def test_token_stream_matches_scanning():
+    """Classify every string token the same as scanning the token list."""
+    _num_checked = 0
+    for _name, _source in _get_corpus().items():
+        try:
+            tokens = TokenStream(
+                tokenize.generate_tokens(StringIO(_source, newline="").readline)
+            )
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            continue
+
+        for i, token in enumerate(tokens):
+            if token.type != tokenize.STRING:
+                continue
+
+            for _classifier, _scanner in (
+                (is_attribute_docstring, _is_attribute_docstring_by_scanning),
+                (is_class_docstring, _is_class_docstring_by_scanning),
+                (
+                    is_function_or_method_docstring,
+                    _is_function_or_method_docstring_by_scanning,
+                ),
+                (is_module_docstring, _is_module_docstring_by_scanning),
+                (
+                    is_docstring_at_end_of_file,
+                    _is_docstring_at_end_of_file_by_scanning,
+                ),
+            ):
+                assert _classifier(tokens, i) == _scanner(
+                    tokens, i
+                ), f"Failed {_name} {_classifier.__name__} at token {i}"
+            _num_checked += 1
+
+    assert _num_checked > 0
+
+
+@pytest.mark.unit
+def test_token_stream_is_a_list():
+    """Index, slice, and compare a TokenStream the same as a list of tokens."""
+    tokens = get_tokens('"""Module."""\nx = 1\n')
+    uut = TokenStream(tokens)
+
+    assert uut == tokens
+    assert uut[1:3] == tokens[1:3]
+    assert is_module_docstring(uut, 1)
+    assert not is_docstring_at_end_of_file(uut, 1)
+    assert uut.first_code_index == 1
+    assert uut.last_significant_index == 5
+
+
+@pytest.mark.unit
+def test_plain_list_is_classified_after_change():
+    """Classify a plain list of tokens as it is when it is passed."""
+    tokens = get_tokens('"""Module."""\nclass Foo:\n    """Class."""\n')
+    assert is_class_docstring(tokens, 6)
+
+    tokens[3:5] = get_tokens("x = 1\n")[:2]
+    assert not is_class_docstring(tokens, 6)
+
+
+@pytest.mark.unit
+def test_find_docstring_blocks_matches_scanning():
+    """Find the same blocks as the backward scanning classifiers."""
+    _num_checked = 0
+    for _name, _source in _get_corpus().items():
+        try:
+            tokens = list(
+                tokenize.generate_tokens(StringIO(_source, newline="").readline)
+            )
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            continue
+
+        expected = _do_find_docstring_blocks_by_scanning(tokens)
+        result = do_find_docstring_blocks(tokens)
+        assert result == expected, f"Failed {_name}\nExpected {expected}\nGot {result}"
+        _num_checked += 1
+
+    assert _num_checked > 0
@@ -25,13 +25,17 @@
 # ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Module for testing docformatter's Configurater class."""
+"""Module for testing docformatter's Configurater and FormatOptions classes."""
+
+# Standard Library Imports
+import argparse
+import dataclasses
 
 # Third Party Imports
 import pytest
 
 # docformatter Package Imports
-from docformatter.configuration import Configurater
+from docformatter.configuration import Configurater, FormatOptions
 
 WRAP_72 = 72
 WRAP_80 = 80
@@ -284,6 +288,73 @@ class TestConfigurater:
 
         assert uut.args.line_range == [1, 3]
 
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_only_format_in_line_ranges(self, capsys):
+        """Only format docstrings in any of the line ranges."""
+        argb = [
+            "/path/to/docformatter",
+            "-c",
+            "--range",
+            "1",
+            "3",
+            "--range",
+            "10",
+            "12",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+
+        assert uut.args.line_range == [1, 3, 10, 12]
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_second_line_range_out_of_order(self, capsys):
+        """Raise parser error if first value of any range > than second."""
+        argb = [
+            "/path/to/docformatter",
+            "-c",
+            "--range",
+            "1",
+            "3",
+            "--range",
+            "12",
+            "10",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        with pytest.raises(SystemExit):
+            uut.do_parse_arguments()
+
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "First value of --range should be less than or equal" in err
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_range_file_with_since(self, capsys):
+        """Raise parser error if a range file is used with git changes."""
+        argb = [
+            "/path/to/docformatter",
+            "-c",
+            "--range-file",
+            "ranges.txt",
+            "--since",
+            "HEAD",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        with pytest.raises(SystemExit):
+            uut.do_parse_arguments()
+
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "--range-file cannot be used with --since or --staged" in err
+
     @pytest.mark.integration
     @pytest.mark.order(1)
     def test_low_line_range_is_zero(self, capsys):
@@ -391,6 +462,116 @@ class TestConfigurater:
             "to the second" in err
         )
 
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_jobs(self):
+        """Read the number of parallel processes to use."""
+        argb = [
+            "/path/to/docformatter",
+            "--jobs",
+            "4",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+
+        assert uut.args.jobs == 4
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_rewrite_engine(self):
+        """Read the rewrite engine, which defaults to rebuilding the tokens."""
+        uut = Configurater(["/path/to/docformatter", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.rewrite_engine == "tokens"
+
+        uut = Configurater(["/path/to/docformatter", "--rewrite-engine", "spans", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.rewrite_engine == "spans"
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_diff_mode(self):
+        """Read the diff mode, which defaults to matching every line."""
+        uut = Configurater(["/path/to/docformatter", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.diff_mode == "full"
+
+        uut = Configurater(["/path/to/docformatter", "--diff-mode", "docstrings", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.diff_mode == "docstrings"
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_report_format(self):
+        """Read the report format, which defaults to text."""
+        uut = Configurater(["/path/to/docformatter", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.report_format == "text"
+
+        uut = Configurater(["/path/to/docformatter", "--format", "sarif", ""])
+        uut.do_parse_arguments()
+
+        assert uut.args.report_format == "sarif"
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_profile(self):
+        """Read the profile options, which default to no report."""
+        uut = Configurater(["/path/to/docformatter", ""])
+        uut.do_parse_arguments()
+
+        assert not uut.args.profile
+        assert uut.args.profile_format == "table"
+
+        uut = Configurater(
+            ["/path/to/docformatter", "--profile", "--profile-format", "json", ""]
+        )
+        uut.do_parse_arguments()
+
+        assert uut.args.profile
+        assert uut.args.profile_format == "json"
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_verbose(self):
+        """Count the number of times verbose output is requested."""
+        argb = [
+            "/path/to/docformatter",
+            "-vv",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+
+        assert uut.args.verbose == 2
+
+    @pytest.mark.integration
+    @pytest.mark.order(1)
+    def test_negative_jobs(self, capsys):
+        """Raise parser error if the number of jobs is negative."""
+        argb = [
+            "/path/to/docformatter",
+            "--jobs",
+            "-1",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        with pytest.raises(SystemExit):
+            uut.do_parse_arguments()
+
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "--jobs must be zero or a positive number" in err
+
     @pytest.mark.integration
     @pytest.mark.order(1)
     @pytest.mark.parametrize(
@@ -460,6 +641,77 @@ wrap-summaries = 80
             "wrap-summaries": "80",
         }
 
+    @pytest.mark.integration
+    @pytest.mark.order(2)
+    @pytest.mark.parametrize(
+        "config",
+        [
+            """\
+[tool.docformatter]
+range = [1, 3]
+"""
+        ],
+    )
+    @pytest.mark.parametrize(
+        "arguments, line_range",
+        [
+            ([], [1, 3]),
+            (["--range", "10", "12"], [10, 12]),
+            (["--range", "10", "12", "--range", "20", "22"], [10, 12, 20, 22]),
+        ],
+    )
+    def test_range_from_pyproject_toml(
+        self,
+        temporary_pyproject_toml,
+        config,
+        arguments,
+        line_range,
+    ):
+        """Replace the ranges in pyproject.toml with those on the command line."""
+        argb = [
+            "/path/to/docformatter",
+            "-c",
+            "--config",
+            "/tmp/pyproject.toml",
+            *arguments,
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+
+        assert uut.args.line_range == line_range
+
+    @pytest.mark.integration
+    @pytest.mark.order(2)
+    @pytest.mark.parametrize(
+        "config",
+        [
+            """\
+[docformatter]
+range = 1 3
+"""
+        ],
+    )
+    def test_range_from_setup_cfg(
+        self,
+        temporary_setup_cfg,
+        config,
+    ):
+        """Read the line numbers of a range from setup.cfg."""
+        argb = [
+            "/path/to/docformatter",
+            "-c",
+            "--config",
+            "/tmp/setup.cfg",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+
+        assert uut.args.line_range == [1, 3]
+
     @pytest.mark.integration
     @pytest.mark.order(2)
     @pytest.mark.parametrize(
@@ -699,3 +951,53 @@ non-cap = ["qBittorrent", "iPad", "iOS", "eBay"]
             "diff": "true",
             "non-cap": '["qBittorrent", "iPad", "iOS", "eBay"]',
         }
+
+
+class TestFormatOptions:
+    """Class for testing the FormatOptions class."""
+
+    @pytest.mark.integration
+    def test_from_args(self):
+        """Derive the formatting options from the parsed arguments."""
+        argb = [
+            "/path/to/docformatter",
+            "--black",
+            "--range",
+            "1",
+            "3",
+            "--non-cap",
+            "iPad",
+            "eBay",
+            "--in-place",
+            "",
+        ]
+
+        uut = Configurater(argb)
+        uut.do_parse_arguments()
+        options = FormatOptions.from_args(uut.args)
+
+        assert options.black
+        assert options.line_range == (1, 3)
+        assert options.non_cap == ("iPad", "eBay")
+        assert options.wrap_summaries == WRAP_88
+        assert options.length_range is None
+        assert not hasattr(options, "in_place")
+
+    @pytest.mark.unit
+    def test_from_args_defaults(self):
+        """Use the default for any formatting option not in the arguments."""
+        options = FormatOptions.from_args(argparse.Namespace(wrap_summaries=WRAP_80))
+
+        assert options == FormatOptions(wrap_summaries=WRAP_80)
+        assert options.wrap_descriptions == WRAP_72
+
+    @pytest.mark.unit
+    def test_frozen_and_hashable(self):
+        """Refuse changes and hash equal options equally."""
+        options = FormatOptions(non_cap=("iPad",))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            options.wrap_summaries = WRAP_88  # type: ignore
+
+        assert hash(options) == hash(FormatOptions(non_cap=("iPad",)))
+        assert {options: 1}[FormatOptions(non_cap=("iPad",))] == 1
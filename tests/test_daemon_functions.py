@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+#
+#       tests.test_daemon_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing docformatter's daemon and client."""
+
+# Standard Library Imports
+import io
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import threading
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter import __main__ as main
+from docformatter.daemon import Daemon, get_forwarded_argv, get_socket_path
+
+CONTENTS = '''\
+def foo():
+    """
+    Hello world
+    """
+'''
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture(scope="function")
+def socket_path():
+    """Yield the path to a socket in a new temporary directory."""
+    # Socket paths are limited to about 100 characters, so the directory is
+    # created in the system temporary directory.
+    _directory = tempfile.mkdtemp(prefix="docformatter-")
+    try:
+        yield os.path.join(_directory, "docformatter.sock")
+    finally:
+        shutil.rmtree(_directory)
+
+
+@pytest.fixture(scope="function")
+def daemon(socket_path):
+    """Start a daemon answering requests in a thread and yield it."""
+    _daemon = Daemon(socket_path)
+    _daemon.do_start()
+    _thread = threading.Thread(target=_daemon.server.serve_forever)
+    _thread.start()
+    try:
+        yield _daemon
+    finally:
+        _daemon.server.shutdown()
+        _thread.join()
+        _daemon.do_stop()
+
+
+def _run_client(socket_path, argv, standard_in=None):
+    """Run docformatter --client and return the exit code, stdout, and stderr."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    ret_code = main._main(
+        argv=["my_fake_program", "--client", "--socket", socket_path, *argv],
+        standard_out=stdout,
+        standard_error=stderr,
+        standard_in=standard_in,
+    )
+
+    return ret_code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestArguments:
+    """Class for testing the daemon and client argument functions."""
+
+    @pytest.mark.unit
+    def test_get_socket_path(self):
+        """Return the path given with --socket."""
+        assert get_socket_path(["prog", "--client", "--socket", "/tmp/s"]) == "/tmp/s"
+
+    @pytest.mark.unit
+    def test_get_socket_path_from_environment(self, monkeypatch):
+        """Return the path in DOCFORMATTER_SOCKET when --socket isn't given."""
+        monkeypatch.setenv("DOCFORMATTER_SOCKET", "/tmp/env.sock")
+
+        assert get_socket_path(["prog", "--daemon"]) == "/tmp/env.sock"
+
+    @pytest.mark.unit
+    def test_get_socket_path_in_runtime_directory(self, monkeypatch):
+        """Return a path in XDG_RUNTIME_DIR when it is set."""
+        monkeypatch.delenv("DOCFORMATTER_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", tempfile.gettempdir())
+
+        assert get_socket_path(["prog", "--daemon"]) == os.path.join(
+            tempfile.gettempdir(), "docformatter.sock"
+        )
+
+    @pytest.mark.unit
+    def test_get_socket_path_in_user_directory(self, monkeypatch):
+        """Return a path in a directory for the user without XDG_RUNTIME_DIR."""
+        monkeypatch.delenv("DOCFORMATTER_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        assert get_socket_path(["prog", "--daemon"]) == os.path.join(
+            tempfile.gettempdir(), f"docformatter-{os.getuid()}", "docformatter.sock"
+        )
+
+    @pytest.mark.unit
+    def test_get_forwarded_argv(self):
+        """Remove the daemon and client arguments."""
+        assert get_forwarded_argv(
+            ["prog", "--client", "--socket", "/tmp/s", "--check", "a.py"]
+        ) == ["prog", "--check", "a.py"]
+
+
+class TestDaemon:
+    """Class for testing the Daemon class and the client."""
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_client_matches_local_run(self, daemon, temporary_file, contents):
+        """Produce the same output and exit code as formatting locally."""
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        expected_code = main._main(
+            argv=["my_fake_program", "--check", "--diff", temporary_file],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert _run_client(
+            daemon.socket_path, ["--check", "--diff", temporary_file]
+        ) == (expected_code, stdout.getvalue(), stderr.getvalue())
+
+    @pytest.mark.system
+    def test_client_standard_in(self, daemon):
+        """Format standard input sent by the client."""
+        assert _run_client(daemon.socket_path, ["-"], io.StringIO(CONTENTS)) == (
+            0,
+            'def foo():\n    """Hello world."""\n',
+            "",
+        )
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_warm_caches(self, daemon, temporary_file, contents):
+        """Reuse the parsed configuration and formatted docstrings."""
+        _run_client(daemon.socket_path, ["--check", temporary_file])
+        _configurator = next(iter(daemon.configurations.values()))[1]
+
+        assert _run_client(daemon.socket_path, ["-v", "--check", temporary_file]) == (
+            3,
+            "",
+            f"{temporary_file}\nencodings detected by: ascii 1\n"
+            "docstrings memoized: 1 hits, 0 misses\n",
+        )
+        assert _run_client(daemon.socket_path, ["--check", temporary_file])[0] == 3
+        assert next(iter(daemon.configurations.values()))[1] is _configurator
+
+    @pytest.mark.system
+    def test_argument_error(self, daemon):
+        """Return the argument error instead of stopping the daemon."""
+        ret_code, stdout, stderr = _run_client(
+            daemon.socket_path, ["--range", "0", "1", "x.py"]
+        )
+
+        assert ret_code == 2
+        assert "--range must be positive numbers" in stderr
+        assert _run_client(daemon.socket_path, ["-", "x.py"], io.StringIO())[0] == 2
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_client_without_daemon(self, socket_path, temporary_file, contents):
+        """Format in the client process when no daemon is running."""
+        assert _run_client(socket_path, ["--check", temporary_file]) == (
+            3,
+            "",
+            f"{temporary_file}\n",
+        )
+
+    @pytest.mark.integration
+    def test_daemon_already_running(self, daemon):
+        """Refuse to replace the socket of a running daemon."""
+        stderr = io.StringIO()
+
+        assert Daemon(daemon.socket_path).do_serve(stderr) == 1
+        assert "already listening" in stderr.getvalue()
+        assert os.path.exists(daemon.socket_path)
+
+    @pytest.mark.integration
+    def test_stale_socket(self, socket_path):
+        """Replace a socket left behind by a daemon that is no longer running."""
+        _stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        _stale.bind(socket_path)
+        _stale.close()
+
+        uut = Daemon(socket_path)
+        uut.do_start()
+        try:
+            assert uut.server is not None
+        finally:
+            uut.do_stop()
+
+        assert not os.path.exists(socket_path)
+
+    @pytest.mark.integration
+    def test_private_socket(self, socket_path):
+        """Create the socket and its directory for the user alone."""
+        _socket_path = os.path.join(os.path.dirname(socket_path), "new", "d.sock")
+        uut = Daemon(_socket_path)
+        uut.do_start()
+        try:
+            assert stat.S_IMODE(os.stat(_socket_path).st_mode) & 0o077 == 0
+            assert stat.S_IMODE(os.stat(os.path.dirname(_socket_path)).st_mode) == (
+                0o700
+            )
+        finally:
+            uut.do_stop()
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_client_refuses_shared_directory(self, daemon, temporary_file, contents):
+        """Format in the client process when others can replace the socket."""
+        os.chmod(os.path.dirname(daemon.socket_path), 0o777)
+
+        _code, _stdout, _stderr = _run_client(
+            daemon.socket_path, ["--check", temporary_file]
+        )
+
+        assert (_code, _stdout) == (3, "")
+        assert "can be changed by other users" in _stderr
+        assert _stderr.endswith(f"{temporary_file}\n")
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_client_refuses_socket_of_other_user(
+        self, daemon, temporary_file, contents, monkeypatch
+    ):
+        """Format in the client process when the socket belongs to another user."""
+        _stat = os.stat
+
+        def _get_stat(path, *args, **kwargs):
+            _result = _stat(path, *args, **kwargs)
+            if path == daemon.socket_path:
+                _result = os.stat_result(
+                    (*_result[:4], _result.st_uid + 1, *_result[5:10])
+                )
+            return _result
+
+        monkeypatch.setattr(os, "stat", _get_stat)
+        _code, _stdout, _stderr = _run_client(
+            daemon.socket_path, ["--check", temporary_file]
+        )
+        monkeypatch.undo()
+
+        assert (_code, _stdout) == (3, "")
+        assert "belongs to another user" in _stderr
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("reply", [b"", b'{"code": 0, "stdout": "de'])
+    def test_client_without_reply(self, socket_path, reply):
+        """Format in the client process when the daemon's reply is incomplete."""
+        _server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        _server.bind(socket_path)
+        _server.listen(1)
+
+        def _do_reply():
+            _connection = _server.accept()[0]
+            with _connection:
+                _connection.makefile("rb").read()
+                _connection.sendall(reply)
+
+        _thread = threading.Thread(target=_do_reply)
+        _thread.start()
+        try:
+            _code, _stdout, _stderr = _run_client(
+                socket_path, ["-"], io.StringIO(CONTENTS)
+            )
+        finally:
+            _thread.join()
+            _server.close()
+
+        assert not _code
+        assert _stdout == 'def foo():\n    """Hello world."""\n'
+        assert _stderr.startswith("docformatter: not using the daemon: ")
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("contents", [CONTENTS])
+    def test_error_reply(self, daemon, temporary_file, contents, monkeypatch):
+        """Answer an unexpected error instead of leaving the client waiting."""
+
+        def _do_format(*args):
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        monkeypatch.setattr(daemon, "_do_format", _do_format)
+        _code, _stdout, _stderr = _run_client(
+            daemon.socket_path, ["--check", temporary_file]
+        )
+        monkeypatch.undo()
+
+        assert (_code, _stdout) == (1, "")
+        assert _stderr.startswith("docformatter daemon: UnicodeDecodeError: ")
+        assert _run_client(daemon.socket_path, ["--check", temporary_file]) == (
+            3,
+            "",
+            f"{temporary_file}\n",
+        )
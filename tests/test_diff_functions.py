@@ -0,0 +1,155 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.test_diff_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing the unified diff functions."""
+
+# Standard Library Imports
+import difflib
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter.diff import _find_longest_match, _LineIndex, get_unified_diff
+
+BEFORE = [f"line {_idx}" for _idx in range(30)]
+
+
+def _get_after():
+    _after = list(BEFORE)
+    _after[2:4] = ["changed 2", "line 3", "inserted"]
+    del _after[20]
+    return _after
+
+
+class TestGetUnifiedDiff:
+    """Class for testing get_unified_diff()."""
+
+    @pytest.mark.unit
+    def test_full_diff(self):
+        """Return the diff difflib finds when no regions are given."""
+        _after = _get_after()
+
+        assert list(get_unified_diff(BEFORE, _after, ("a", "b"))) == list(
+            difflib.unified_diff(BEFORE, _after, "a", "b", lineterm="")
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("context", [0, 1, 3, 10])
+    def test_region_diff(self, context):
+        """Return the same hunks as difflib when matching only the regions."""
+        _after = _get_after()
+
+        _diff = get_unified_diff(
+            BEFORE, _after, ("a", "b"), [(2, 4, 2, 5), (19, 20, 20, 20)], context
+        )
+
+        assert list(_diff) == list(
+            difflib.unified_diff(BEFORE, _after, "a", "b", n=context, lineterm="")
+        )
+
+    @pytest.mark.unit
+    def test_region_diff_at_the_ends(self):
+        """Return hunks for changes to the first and last lines."""
+        _after = ["new first", *BEFORE[1:], "appended"]
+
+        _diff = get_unified_diff(
+            BEFORE, _after, ("a", "b"), [(0, 1, 0, 1), (30, 30, 30, 31)]
+        )
+
+        assert list(_diff) == list(
+            difflib.unified_diff(BEFORE, _after, "a", "b", lineterm="")
+        )
+
+    @pytest.mark.unit
+    def test_region_diff_with_repeated_lines(self):
+        """Return the lines difflib matches when a region's lines repeat."""
+        _before = ["a", "b", "", "", "c", "d", "", "", "e"]
+        _after = ["a", "b", "", "c", "d", "", "e"]
+
+        _diff = get_unified_diff(
+            _before, _after, ("a", "b"), [(2, 3, 2, 2), (6, 7, 5, 5)], 1
+        )
+
+        assert list(_diff) == list(
+            difflib.unified_diff(_before, _after, "a", "b", n=1, lineterm="")
+        )
+
+    @pytest.mark.unit
+    def test_region_diff_with_popular_lines(self):
+        """Return the same hunks as difflib when most lines are blank."""
+        _before, _after, _regions = [], [], []
+        for _idx in range(100):
+            _i, _j = len(_before), len(_after)
+            _regions.append((_i + 1, _i + 3, _j + 1, _j + 2))
+            _before.extend([f"def f{_idx}():", '    """ Docstring. """', "", ""])
+            _after.extend([f"def f{_idx}():", '    """Docstring."""', ""])
+
+        assert list(get_unified_diff(_before, _after, ("a", "b"), _regions)) == list(
+            difflib.unified_diff(_before, _after, "a", "b", lineterm="")
+        )
+
+    @pytest.mark.unit
+    def test_region_diff_with_tie_break(self):
+        """Return difflib's diff when a blank line can be matched either way."""
+        _before = ["def f():", '    """A', "    b", "", "    c", '    """', "", ""]
+        _before.extend(["x = 1", '"""', "d", '"""', "", "", "y = 2"])
+        _after = ["def f():", '    """A', "    B", "", "    c", '    """', ""]
+        _after.extend(["x = 1", '"""D', "", "E", '"""', "", "y = 2"])
+
+        _diff = get_unified_diff(
+            _before, _after, ("a", "b"), [(1, 8, 1, 7), (9, 14, 8, 13)]
+        )
+
+        assert list(_diff) == list(
+            difflib.unified_diff(_before, _after, "a", "b", lineterm="")
+        )
+
+    @pytest.mark.unit
+    def test_no_changes(self):
+        """Return nothing when the regions have no changes."""
+        assert list(get_unified_diff(BEFORE, BEFORE, ("a", "b"), [(4, 6, 4, 6)])) == []
+
+
+class TestFindLongestMatch:
+    """Class for testing _find_longest_match()."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "alo, ahi, blo, bhi",
+        [(0, 12, 0, 10), (2, 9, 1, 7), (4, 12, 0, 5), (0, 3, 6, 10)],
+    )
+    def test_find_longest_match(self, alo, ahi, blo, bhi):
+        """Return the match difflib finds between the same lines."""
+        _before = ["x", "", "a", "b", "c", "", "d", "a", "b", "c", "d", ""]
+        _after = ["", "a", "b", "", "c", "d", "a", "b", "c", ""]
+        _index = _LineIndex(_before, _after)
+        _matcher = difflib.SequenceMatcher(None, _before, _after)
+
+        assert _find_longest_match(_index, alo, ahi, blo, bhi) == tuple(
+            _matcher.find_longest_match(alo, ahi, blo, bhi)
+        )
@@ -29,6 +29,7 @@
 
 # Standard Library Imports
 import io
+import json
 import os
 
 # Third Party Imports
@@ -74,6 +75,55 @@ class TestMain:
             output_file.getvalue().split("\n")[2:]
         )
 
+    @pytest.mark.system
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            '''\
+def foo():
+
+    """
+    Hello world
+    """
+    return 1
+
+
+def bar():
+    """Hello world."""
+'''
+        ],
+    )
+    def test_diff_docstrings_mode(self, temporary_file, contents):
+        """Produce the same diff when only the edited lines are matched."""
+        output_file = io.StringIO()
+        main._main(
+            argv=[
+                "my_fake_program",
+                "--rewrite-engine",
+                "spans",
+                "--diff-mode",
+                "docstrings",
+                temporary_file,
+            ],
+            standard_out=output_file,
+            standard_error=None,
+            standard_in=None,
+        )
+
+        assert output_file.getvalue().split("\n")[2:] == [
+            "@@ -1,8 +1,5 @@",
+            " def foo():",
+            "-",
+            '-    """',
+            "-    Hello world",
+            '-    """',
+            '+    """Hello world."""',
+            "     return 1",
+            " ",
+            " ",
+            "",
+        ]
+
     @pytest.mark.system
     def test_diff_with_nonexistent_file(self):
         """Should return error message when file doesn't exist."""
@@ -233,6 +283,256 @@ Print my path and return error code
             assert "Print my path" in stdout.getvalue()
         assert stderr.getvalue().strip() == temporary_file
 
+    @pytest.mark.system
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_check_mode_with_jobs(self, temporary_directory, jobs):
+        """Report files needing formatting in sorted order regardless of --jobs."""
+        _filenames = []
+        for _name in ["c.py", "a.py", "b.py", "d.py"]:
+            _filename = os.path.join(temporary_directory, _name)
+            with open(_filename, "w") as f:
+                if _name == "d.py":
+                    f.write('def foo():\n    """Hello world."""\n')
+                else:
+                    f.write('def foo():\n    """\n    Hello world\n    """\n')
+            _filenames.append(_filename)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=["my_fake_program", "--check", "--jobs", jobs, *_filenames],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 3  # FormatResult.format_required
+        assert stdout.getvalue() == ""
+        assert stderr.getvalue().splitlines() == [
+            os.path.join(temporary_directory, _name)
+            for _name in ["a.py", "b.py", "c.py"]
+        ]
+
+    @pytest.mark.system
+    def test_check_mode_with_jobs_and_error(self, temporary_directory):
+        """Report an error in one file and keep the results of the others."""
+        _filenames = []
+        for _name, _contents in [
+            ("a.py", b'def foo():\n    """\n    Hello world\n    """\n'),
+            ("b.py", b'\xff\xfe\x00x = "\x80"\n'),
+            ("c.py", b'def foo():\n    """\n    Hello world\n    """\n'),
+        ]:
+            _filename = os.path.join(temporary_directory, _name)
+            with open(_filename, "wb") as f:
+                f.write(_contents)
+            _filenames.append(_filename)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=["my_fake_program", "--check", "--jobs", "2", *_filenames],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 1  # FormatResult.error
+        _errors = stderr.getvalue().splitlines()
+        assert [_errors[0], _errors[2]] == [_filenames[0], _filenames[2]]
+        assert "can't decode" in _errors[1]
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_check_mode_with_verbose(self, temporary_directory, jobs):
+        """Report how the encoding of each file was detected."""
+        _filenames = []
+        for _name, _contents in [
+            ("a.py", b'def foo():\n    """Hello world."""\n'),
+            ("b.py", b'# -*- coding: latin-1 -*-\nx = "\xe9"\n'),
+            ("c.py", 'def foo():\n    """H\u00e9llo world."""\n'.encode("utf-8")),
+        ]:
+            _filename = os.path.join(temporary_directory, _name)
+            with open(_filename, "wb") as f:
+                f.write(_contents)
+            _filenames.append(_filename)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=["my_fake_program", "--check", "-v", "--jobs", jobs, *_filenames],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 0
+        assert stderr.getvalue() == (
+            "encodings detected by: ascii 1, cookie 1, utf-8 1\n"
+            "docstrings memoized: 0 hits, 2 misses\n"
+        )
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_check_mode_with_profile(self, temporary_directory, jobs):
+        """Report the time spent in each stage as JSON after all the files."""
+        _filenames = []
+        for _name in ["a.py", "b.py"]:
+            _filename = os.path.join(temporary_directory, _name)
+            with open(_filename, "w") as f:
+                f.write(f'def foo():\n    """Hello {_name}."""\n')
+            _filenames.append(_filename)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=[
+                "my_fake_program",
+                "--check",
+                "--profile",
+                "--profile-format",
+                "json",
+                "--jobs",
+                jobs,
+                *_filenames,
+            ],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 0
+        _report = json.loads(stderr.getvalue())
+        _calls = {_stage["stage"]: _stage["calls"] for _stage in _report["stages"]}
+        assert _calls["format file"] == 2
+        assert _calls["tokenize"] == 2
+        assert _calls["format docstring"] == 2
+        assert sorted(_timing["file"] for _timing in _report["slowest_files"]) == (
+            _filenames
+        )
+
+    @pytest.mark.system
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_check_mode_with_json_format(self, temporary_directory, jobs):
+        """Write a line of JSON for each file in sorted order."""
+        _filenames = []
+        for _name, _contents in [
+            ("a.py", 'def foo():\n    """Hello world."""\n'),
+            ("b.py", 'def foo():\n    """hello world"""\n\n\n\n    x = 1\n'),
+        ]:
+            _filename = os.path.join(temporary_directory, _name)
+            with open(_filename, "w") as f:
+                f.write(_contents)
+            _filenames.append(_filename)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=[
+                "my_fake_program",
+                "--check",
+                "--format",
+                "json",
+                "--jobs",
+                jobs,
+                *_filenames,
+            ],
+            standard_out=stdout,
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 3  # FormatResult.format_required
+        assert stderr.getvalue() == ""
+        assert [json.loads(_line) for _line in stdout.getvalue().splitlines()] == [
+            {"path": _filenames[0], "status": "ok", "changes": []},
+            {
+                "path": _filenames[1],
+                "status": "format_required",
+                "changes": [{"start_line": 2, "end_line": 5}],
+            },
+        ]
+
+    @pytest.mark.system
+    @pytest.mark.parametrize(
+        "contents",
+        ['def foo():\n    """Hello world."""\n'],
+    )
+    def test_check_mode_with_cache(
+        self, temporary_file, temporary_directory, contents
+    ):
+        """Only skip files whose contents were already found to be clean."""
+        args = [
+            "my_fake_program",
+            "--check",
+            "--cache-dir",
+            temporary_directory,
+            temporary_file,
+        ]
+
+        for _ in range(2):
+            stderr = io.StringIO()
+            ret_code = main._main(
+                argv=args,
+                standard_out=io.StringIO(),
+                standard_error=stderr,
+                standard_in=None,
+            )
+
+            assert ret_code == 0  # FormatResult.ok
+            assert stderr.getvalue() == ""
+            assert len(os.listdir(temporary_directory)) == 1
+
+        with open(temporary_file, "w") as f:
+            f.write('def foo():\n    """\n    Hello world\n    """\n')
+
+        stderr = io.StringIO()
+        ret_code = main._main(
+            argv=args,
+            standard_out=io.StringIO(),
+            standard_error=stderr,
+            standard_in=None,
+        )
+
+        assert ret_code == 3  # FormatResult.format_required
+        assert stderr.getvalue().strip() == temporary_file
+
+    @pytest.mark.system
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            'def a():\n    """ hello a """\n\n\ndef b():\n    """ hello b """\n\n\n'
+            'def c():\n    """ hello c """\n'
+        ],
+    )
+    def test_in_place_with_line_ranges(
+        self, temporary_file, temporary_directory, contents
+    ):
+        """Format the docstrings in every range, from --range or a range file."""
+        _expected = contents.replace('""" hello a """', '"""Hello a."""').replace(
+            '""" hello c """', '"""Hello c."""'
+        )
+        _range_file = os.path.join(temporary_directory, "ranges.txt")
+        with open(_range_file, "w") as f:
+            f.write(f"{temporary_file}:2\n{temporary_file}:9-10\nother.py:1-99\n")
+
+        for _arguments in (
+            ["--range", "1", "2", "--range", "9", "10"],
+            ["--range-file", _range_file],
+        ):
+            with open(temporary_file, "w") as f:
+                f.write(contents)
+
+            ret_code = main._main(
+                argv=["my_fake_program", "--in-place", *_arguments, temporary_file],
+                standard_out=io.StringIO(),
+                standard_error=io.StringIO(),
+                standard_in=None,
+            )
+
+            assert ret_code == 3  # FormatResult.format_required
+            with open(temporary_file) as f:
+                assert f.read() == _expected
+
     def test_help_output(self):
         """Ensure help message is printed when passed --help."""
         stdout = io.StringIO()
@@ -691,6 +991,82 @@ def foo():
             assert "cannot be used" in run_docformatter.communicate()[1].decode()
 
 
+    @pytest.mark.system
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            '''\
+def foo():
+    """
+    Hello foo
+    """
+
+
+def bar():
+    """
+    Hello bar
+    """
+'''
+        ],
+    )
+    @pytest.mark.parametrize("arguments", [["--range", "7", "10"]])
+    def test_end_to_end_range_keeps_blank_lines(
+        self,
+        run_docformatter,
+        temporary_file,
+        arguments,
+        contents,
+    ):
+        """Keep the blank lines after a docstring outside the range."""
+        assert '''\
+@@ -5,6 +5,4 @@
+ 
+ 
+ def bar():
+-    """
+-    Hello bar
+-    """
++    """Hello bar."""
+''' == "\n".join(
+            run_docformatter.communicate()[0].decode().replace("\r", "").split("\n")[2:]
+        )
+
+    @pytest.mark.system
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            '''\
+def foo():
+    """
+    Hello foo
+    """
+
+
+def bar():
+    """Hello bar"""
+'''
+        ],
+    )
+    @pytest.mark.parametrize("arguments", [["--docstring-length", "1", "1"]])
+    def test_end_to_end_docstring_length_keeps_blank_lines(
+        self,
+        run_docformatter,
+        temporary_file,
+        arguments,
+        contents,
+    ):
+        """Keep the blank lines after a docstring with a length outside the range."""
+        assert '''\
+@@ -5,4 +5,4 @@
+ 
+ 
+ def bar():
+-    """Hello bar"""
++    """Hello bar."""
+''' == "\n".join(
+            run_docformatter.communicate()[0].decode().replace("\r", "").split("\n")[2:]
+        )
+
 class TestEndToEndPyproject:
     """Class to test docformatter using pyproject.toml for options."""
 
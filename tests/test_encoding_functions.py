@@ -147,3 +147,94 @@ class TestDoDetectEncoding:
         uut.do_detect_encoding(temporary_file)
 
         assert uut.encoding == uut.DEFAULT_ENCODING
+
+
+class TestDoDetectEncodingFromBytes:
+    """Class for testing the do_detect_encoding_from_bytes() function."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            (b"# -*- coding: utf-8 -*-\n", "utf_8"),
+            (b"# Wow!  docformatter is super-cool.\n", "ascii"),
+            (b"\xff\xfe\xfd\xfc\x00\x00\x00\x00", Encoder.DEFAULT_ENCODING),
+        ],
+    )
+    def test_do_detect_encoding_from_bytes(self, source, expected):
+        """Detect the encoding of raw contents without reading a file."""
+        uut = Encoder()
+        uut.do_detect_encoding_from_bytes(source)
+
+        assert expected == uut.encoding
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "source, expected, method",
+        [
+            (b"\xef\xbb\xbfx = 1\n", "utf_8", "bom"),
+            (b"# -*- coding: latin-1 -*-\nx = '\xe9'\n", "latin_1", "cookie"),
+            (
+                b"#!/usr/bin/env python\n# coding=cp1252\nx = '\x93'\n",
+                "cp1252",
+                "cookie",
+            ),
+            (b"x = 1\n# coding: latin-1\nx = '\xe9'\n", "latin_1", "detector"),
+            (b"# coding: blah\n", "ascii", "detector"),
+            ("x = '\u00e9'\n".encode("utf-8"), "utf_8", "utf-8"),
+            (b"x = 1\n", "ascii", "ascii"),
+            ("x = 1\n".encode("utf-16"), Encoder.DEFAULT_ENCODING, "default"),
+        ],
+    )
+    def test_do_detect_encoding_method(self, source, expected, method):
+        """Only run the statistical detector when the fast paths fail."""
+        uut = Encoder()
+        uut.do_detect_encoding_from_bytes(source)
+
+        assert expected == uut.encoding
+        assert {method: 1} == uut.detections
+
+
+class TestGetEncoding:
+    """Class for testing the get_encoding() function."""
+
+    @pytest.mark.unit
+    def test_get_encoding(self):
+        """Return the encoding without changing the encoding attribute."""
+        uut = Encoder()
+        uut.encoding = "ascii"
+
+        assert "latin_1" == uut.get_encoding(b"# -*- coding: latin-1 -*-\n")
+        assert "ascii" == uut.encoding
+        assert {"cookie": 1} == uut.detections
+
+
+class TestDoDecode:
+    """Class for testing the do_decode() function."""
+
+    @pytest.mark.unit
+    def test_do_decode_preserves_line_endings(self):
+        """Return the decoded contents with the original line endings."""
+        uut = Encoder()
+        uut.encoding = "utf_8"
+
+        assert "x = 1\r\ny = 'é'\r\n" == uut.do_decode(
+            "x = 1\r\ny = 'é'\r\n".encode("utf-8")
+        )
+
+    @pytest.mark.unit
+    def test_do_decode_with_wrong_encoding(self):
+        """Raise UnicodeDecodeError when the contents don't match the encoding."""
+        uut = Encoder()
+        uut.encoding = "ascii"
+
+        with pytest.raises(UnicodeDecodeError):
+            uut.do_decode("y = 'é'\n".encode("utf-8"))
+
+    @pytest.mark.unit
+    def test_do_decode_with_encoding(self):
+        """Decode with the encoding given instead of the detected one."""
+        uut = Encoder()
+        uut.encoding = "ascii"
+
+        assert "y = 'é'\n" == uut.do_decode("y = 'é'\n".encode("utf-8"), "utf_8")
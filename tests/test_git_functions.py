@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+#
+#       tests.test_git_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing docformatter's git functions."""
+
+# Standard Library Imports
+import io
+import os
+import shutil
+import subprocess
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter import __main__ as main
+from docformatter.git import do_parse_diff, get_changed_lines
+
+DIFF = """\
+diff --git src/a.py src/a.py
+index 1111111..2222222 100644
+--- src/a.py
++++ src/a.py
+@@ -3 +3 @@ def foo():
+-    \"\"\"old\"\"\"
++    \"\"\"new\"\"\"
+@@ -10,2 +10,0 @@ def bar():
+-    pass
+-    pass
+@@ -20,0 +19,3 @@ def baz():
++    one
++    two
++    three
+diff --git b.py b.py
+new file mode 100644
+--- /dev/null
++++ b.py
+@@ -0,0 +1,2 @@
++x = 1
++y = 2
+"""
+
+UNFORMATTED = '''\
+def foo():
+    """
+    Hello foo
+    """
+
+
+def bar():
+    """
+    Hello bar
+    """
+'''
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+
+@pytest.fixture(scope="function")
+def git_repository(tmp_path, monkeypatch):
+    """Yield a git repository with a committed file as the current directory."""
+    monkeypatch.chdir(tmp_path)
+    for _arguments in (
+        ["init", "-q"],
+        ["config", "user.name", "docformatter"],
+        ["config", "user.email", "docformatter@example.com"],
+    ):
+        subprocess.run(["git", *_arguments], check=True)
+
+    with open("module.py", "w") as f:
+        f.write(UNFORMATTED)
+    subprocess.run(["git", "add", "module.py"], check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], check=True)
+
+    yield tmp_path
+
+
+def _run_docformatter(argv):
+    """Run docformatter and return the exit code, stdout, and stderr."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    ret_code = main._main(
+        argv=["my_fake_program", *argv],
+        standard_out=stdout,
+        standard_error=stderr,
+        standard_in=None,
+    )
+
+    return ret_code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestParseDiff:
+    """Class for testing the do_parse_diff() function."""
+
+    @pytest.mark.unit
+    def test_parse_diff(self):
+        """Return the added and modified lines of each file."""
+        assert do_parse_diff(DIFF) == {
+            "src/a.py": [(3, 3), (10, 11), (19, 21)],
+            "b.py": [(1, 2)],
+        }
+
+    @pytest.mark.unit
+    def test_parse_diff_deletion_at_start(self):
+        """Cover the first line when lines are removed from the start."""
+        assert do_parse_diff("+++ a.py\n@@ -1,2 +0,0 @@\n") == {"a.py": [(1, 1)]}
+
+    @pytest.mark.unit
+    def test_parse_diff_added_line_like_header(self):
+        """Keep the hunks of a file with an added line starting with '++ '."""
+        assert do_parse_diff(
+            "diff --git a.py a.py\n--- a.py\n+++ a.py\n@@ -1,0 +2 @@\n+++ x\n"
+            "@@ -5 +6 @@\n--- y\n+z\n"
+        ) == {"a.py": [(2, 2), (6, 6)]}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "header, path",
+        [
+            ('"a\\"b.py"', 'a"b.py'),
+            ('"a\\\\b.py"', "a\\b.py"),
+            ('"a\\tb.py"', "a\tb.py"),
+            ('"\\303\\251.py"', "\u00e9.py"),
+            ("a b.py\t", "a b.py"),
+        ],
+    )
+    def test_parse_diff_quoted_path(self, header, path):
+        """Remove the quotes and escape sequences git puts in unusual paths."""
+        assert do_parse_diff(f"+++ {header}\n@@ -1 +1 @@\n") == {path: [(1, 1)]}
+
+
+class TestGitMode:
+    """Class for testing --since and --staged."""
+
+    @pytest.mark.system
+    def test_get_changed_lines(self, git_repository):
+        """Return the changed lines keyed by absolute path."""
+        with open("module.py", "a") as f:
+            f.write("x = 1\n")
+
+        assert get_changed_lines(["."]) == {
+            os.path.join(os.path.realpath(git_repository), "module.py"): [(11, 11)]
+        }
+
+    @pytest.mark.system
+    def test_get_changed_lines_unusual_paths(self, git_repository):
+        """Return the paths of changed files with quotes, spaces, and accents."""
+        _filenames = ['q"uote.py', "sp ace.py", "\u00e9t\u00e9.py"]
+        for _filename in _filenames:
+            with open(_filename, "w") as f:
+                f.write("x = 1\n")
+        subprocess.run(["git", "add", *_filenames], check=True)
+
+        assert sorted(get_changed_lines(["."], "HEAD")) == sorted(
+            os.path.join(os.path.realpath(git_repository), _filename)
+            for _filename in _filenames
+        )
+
+    @pytest.mark.unit
+    def test_option_as_reference(self):
+        """Refuse a reference git would take as an option."""
+        with pytest.raises(ValueError):
+            get_changed_lines(["."], "--output=/tmp/docformatter.out")
+
+    @pytest.mark.system
+    def test_not_a_repository(self, tmp_path, monkeypatch):
+        """Raise OSError outside a git repository."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+        with pytest.raises(OSError):
+            get_changed_lines(["."])
+
+    @pytest.mark.system
+    def test_since_formats_changed_docstrings(self, git_repository):
+        """Format only the docstrings on lines changed since the reference."""
+        with open("module.py") as f:
+            _source = f.read()
+        with open("module.py", "w") as f:
+            f.write(_source.replace("Hello bar", "Hello baz"))
+
+        assert _run_docformatter(["--in-place", "--since", "HEAD", "module.py"]) == (
+            3,
+            "",
+            "",
+        )
+        with open("module.py") as f:
+            assert f.read() == _source.replace(
+                '    """\n    Hello bar\n    """', '    """Hello baz."""'
+            )
+
+    @pytest.mark.system
+    def test_staged_ignores_unstaged_changes(self, git_repository):
+        """Format nothing when the changes are not staged."""
+        with open("module.py") as f:
+            _source = f.read()
+        with open("module.py", "w") as f:
+            f.write(_source.replace("Hello foo", "Hello fob"))
+
+        assert _run_docformatter(["--check", "--staged", "."]) == (0, "", "")
+
+        subprocess.run(["git", "add", "module.py"], check=True)
+
+        assert _run_docformatter(["--check", "--staged", "-r", "."]) == (
+            3,
+            "",
+            "module.py\n",
+        )
+
+    @pytest.mark.system
+    def test_since_unknown_reference(self, git_repository):
+        """Report the git error for a reference that doesn't exist."""
+        ret_code, stdout, stderr = _run_docformatter(
+            ["--check", "--since", "no-such-ref", "module.py"]
+        )
+
+        assert ret_code == 1
+        assert stderr.startswith("git diff failed: ")
+
+    @pytest.mark.system
+    def test_since_option_as_reference(self, git_repository):
+        """Report a reference that looks like an option without running git."""
+        ret_code, stdout, stderr = _run_docformatter(
+            ["--check", "--since=--output=out.txt", "module.py"]
+        )
+
+        assert ret_code == 1
+        assert stderr == "invalid git reference: --output=out.txt\n"
+        assert not os.path.exists("out.txt")
@@ -0,0 +1,163 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.test_profiler_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing the Profiler class."""
+
+# Standard Library Imports
+import concurrent.futures
+import io
+import json
+import threading
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter import Profiler
+from docformatter.profiler import DOCSTRING_STAGE, FILE_STAGE
+
+
+class TestProfiler:
+    """Class for testing the Profiler class."""
+
+    @pytest.mark.unit
+    def test_disabled(self):
+        """Record nothing when the Profiler is disabled."""
+        uut = Profiler()
+        with uut.stage(FILE_STAGE, "a.py"), uut.stage("tokenize"):
+            pass
+
+        assert uut.stages == {}
+        assert uut.slowest == {}
+
+    @pytest.mark.unit
+    def test_exclusive_times(self, monkeypatch):
+        """Leave the time of the stages inside a stage out of its time."""
+        _clock = iter([0.0, 0.0, 1.0, 3.0, 4.0])
+        monkeypatch.setattr("time.perf_counter", lambda: next(_clock))
+
+        uut = Profiler(True)
+        with uut.stage(FILE_STAGE, "a.py"):
+            with uut.stage("tokenize"):
+                pass
+
+        assert uut.stages == {FILE_STAGE: [1, 2.0], "tokenize": [1, 2.0]}
+        assert uut.slowest == {FILE_STAGE: [(4.0, "a.py")]}
+
+    @pytest.mark.unit
+    def test_slowest_docstrings(self, monkeypatch):
+        """Keep only the slowest docstrings, named by file and summary."""
+        monkeypatch.setattr(Profiler, "SLOWEST", 2)
+        _clock = iter([0.0, 0.0, 3.0, 0.0, 1.0, 0.0, 2.0, 6.0])
+        monkeypatch.setattr("time.perf_counter", lambda: next(_clock))
+
+        uut = Profiler(True)
+        uut.filename = "a.py"
+        for _docstring in ['"""Three."""', "'''One.'''", 'r"""\n    Two.\n    """']:
+            with uut.stage(DOCSTRING_STAGE, _docstring):
+                pass
+
+        _report = uut.get_report()
+        assert _report["slowest_docstrings"] == [
+            {"docstring": "a.py: Three.", "seconds": 3.0},
+            {"docstring": "a.py: Two.", "seconds": 2.0},
+        ]
+        assert _report["stages"] == [
+            {"stage": DOCSTRING_STAGE, "calls": 3, "seconds": 6.0}
+        ]
+
+    @pytest.mark.unit
+    def test_threads(self):
+        """Keep the stages being timed and the file of each thread apart."""
+        uut = Profiler(True)
+        _barrier = threading.Barrier(4)
+
+        def _do_format(filename):
+            uut.filename = filename
+            with uut.stage(FILE_STAGE, filename):
+                _barrier.wait()
+                with uut.stage(DOCSTRING_STAGE, '"""Docstring."""'):
+                    _barrier.wait()
+            return uut.filename
+
+        _filenames = [f"{_idx}.py" for _idx in range(4)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(_do_format, _filenames)) == _filenames
+
+        assert uut.stages[FILE_STAGE][0] == 4
+        assert uut.stages[DOCSTRING_STAGE][0] == 4
+        assert all(_seconds >= 0 for _calls, _seconds in uut.stages.values())
+        assert sorted(_item for _seconds, _item in uut.slowest[DOCSTRING_STAGE]) == [
+            f"{_filename}: Docstring." for _filename in _filenames
+        ]
+
+    @pytest.mark.unit
+    def test_update(self):
+        """Merge the state of a worker's Profiler and leave it after clearing."""
+        uut = Profiler(True)
+        uut.stages["tokenize"] = [1, 1.0]
+
+        _worker = Profiler(True)
+        _worker.stages["tokenize"] = [2, 0.5]
+        _worker.slowest[FILE_STAGE] = [(0.5, "b.py")]
+        _state = _worker.get_state()
+        _worker.do_clear()
+
+        uut.do_update(_state)
+
+        assert _worker.stages == {}
+        assert uut.stages == {"tokenize": [3, 1.5]}
+        assert uut.slowest == {FILE_STAGE: [(0.5, "b.py")]}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("report_format", ["table", "json"])
+    def test_print_report(self, report_format):
+        """Print the stages and the slowest files as a table or as JSON."""
+        uut = Profiler(True)
+        uut.stages = {"tokenize": [2, 0.25], FILE_STAGE: [2, 0.75]}
+        uut.slowest = {FILE_STAGE: [(0.5, "b.py"), (0.25, "a.py")]}
+
+        _stream = io.StringIO()
+        uut.do_print_report(_stream, report_format)
+
+        if report_format == "json":
+            _report = json.loads(_stream.getvalue())
+            assert [_stage["stage"] for _stage in _report["stages"]] == [
+                FILE_STAGE,
+                "tokenize",
+            ]
+            assert _report["slowest_docstrings"] == []
+        else:
+            _lines = _stream.getvalue().splitlines()
+            assert _lines[1].split() == ["format", "file", "2", "0.750", "75.0%"]
+            assert _lines[2].split() == ["tokenize", "2", "0.250", "25.0%"]
+            assert _lines[3].startswith("wall time")
+            assert _lines[5:] == [
+                "slowest files:",
+                "     0.500  b.py",
+                "     0.250  a.py",
+            ]
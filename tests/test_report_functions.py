@@ -0,0 +1,154 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.test_report_functions.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing the Reporter class."""
+
+# Standard Library Imports
+import io
+import json
+
+# Third Party Imports
+import pytest
+
+# docformatter Package Imports
+from docformatter import Reporter
+
+
+def _get_output(report_format, jobs=1):
+    _stream = io.StringIO()
+    uut = Reporter(report_format, _stream)
+
+    # A worker process keeps the records for the main process to write.
+    _worker = Reporter(report_format, None) if jobs > 1 else uut
+
+    uut.do_start()
+    _worker.do_add_file("a.py", "ok")
+    _worker.do_add_file("b,c.py", "format_required", [(2, 4), (9, 9)], "diff\n")
+    _worker.do_add_file("d e.py", "formatted", [(1, 1)])
+    _worker.do_add_error("f.py", "No such file")
+    for _record in _worker.records:
+        uut.do_write_record(_record)
+    uut.do_finish()
+
+    return _stream.getvalue()
+
+
+class TestReporter:
+    """Class for testing the Reporter class."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_json(self, jobs):
+        """Write one line of JSON for each file."""
+        _output = _get_output("json", jobs)
+
+        assert [json.loads(_line) for _line in _output.splitlines()] == [
+            {"path": "a.py", "status": "ok", "changes": []},
+            {
+                "path": "b,c.py",
+                "status": "format_required",
+                "changes": [
+                    {"start_line": 2, "end_line": 4},
+                    {"start_line": 9, "end_line": 9},
+                ],
+                "diff": "diff\n",
+            },
+            {
+                "path": "d e.py",
+                "status": "formatted",
+                "changes": [{"start_line": 1, "end_line": 1}],
+            },
+            {
+                "path": "f.py",
+                "status": "error",
+                "changes": [],
+                "message": "No such file",
+            },
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_sarif(self, jobs):
+        """Write a SARIF log with a result for each change."""
+        _log = json.loads(_get_output("sarif", jobs))
+        _run = _log["runs"][0]
+
+        assert _log["version"] == "2.1.0"
+        assert _run["tool"]["driver"]["name"] == "docformatter"
+        assert [
+            (
+                _result["level"],
+                _result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"],
+                _result["locations"][0]["physicalLocation"]["region"],
+            )
+            for _result in _run["results"]
+        ] == [
+            ("warning", "b%2Cc.py", {"startLine": 2, "endLine": 4}),
+            ("warning", "b%2Cc.py", {"startLine": 9, "endLine": 9}),
+            ("note", "d%20e.py", {"startLine": 1, "endLine": 1}),
+        ]
+        assert not _run["invocations"][0]["executionSuccessful"]
+        assert [
+            _notification["message"]["text"]
+            for _notification in _run["invocations"][0]["toolExecutionNotifications"]
+        ] == ["No such file"]
+
+    @pytest.mark.unit
+    def test_sarif_without_results(self):
+        """Write a valid SARIF log when no file needs formatting."""
+        _stream = io.StringIO()
+        uut = Reporter("sarif", _stream)
+        uut.do_start()
+        uut.do_add_file("a.py", "ok")
+        uut.do_finish()
+
+        _run = json.loads(_stream.getvalue())["runs"][0]
+        assert _run["results"] == []
+        assert _run["invocations"][0]["executionSuccessful"]
+
+    @pytest.mark.unit
+    def test_sarif_without_stream(self):
+        """Keep the SARIF results when there is no stream to write them to."""
+        uut = Reporter("sarif", None)
+        uut.do_start()
+        uut.do_add_file("a.py", "formatted", [(1, 1)])
+        uut.do_finish()
+
+        assert [_record["status"] for _record in uut.records] == ["formatted"]
+
+    @pytest.mark.unit
+    def test_github(self):
+        """Write an annotation for each change and each error."""
+        assert _get_output("github").splitlines() == [
+            "::warning file=b%2Cc.py,line=2,endLine=4,title=docformatter::"
+            "Docstring is not formatted.",
+            "::warning file=b%2Cc.py,line=9,endLine=9,title=docformatter::"
+            "Docstring is not formatted.",
+            "::warning file=d e.py,line=1,endLine=1,title=docformatter::"
+            "Docstring was formatted.",
+            "::error file=f.py::No such file",
+        ]
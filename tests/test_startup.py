@@ -0,0 +1,109 @@
+# pylint: skip-file
+# type: ignore
+#
+#       tests.test_startup.py is part of the docformatter project
+#
+# Copyright (C) 2012-2023 Steven Myint
+# Copyright (C) 2023-2025 Doyle "weibullguy" Rowland
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Module for testing the docformatter start up time."""
+
+# Standard Library Imports
+import os
+import subprocess
+import sys
+
+# Third Party Imports
+import pytest
+
+DEFERRED_MODULES = (
+    "asyncio",
+    "charset_normalizer",
+    "concurrent.futures",
+    "difflib",
+    "hashlib",
+    "socketserver",
+    "tempfile",
+    "tomli",
+    "tomllib",
+)
+"""Modules that must not be imported until they are needed."""
+
+DEFERRED_MODULES_PREFIXES = tuple(f"{name}." for name in DEFERRED_MODULES)
+
+STARTUP_BUDGET = int(os.environ.get("DOCFORMATTER_STARTUP_BUDGET", "100000"))
+"""Maximum microseconds allowed to import docformatter.__main__."""
+
+
+def _get_import_times():
+    """Return the cumulative import time of each module, in microseconds.
+
+    site is disabled so .pth files of unrelated packages can't add to the
+    imports.
+    """
+    environ = os.environ.copy()
+    environ["PYTHONPATH"] = os.pathsep.join(sys.path)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-S",
+            "-X",
+            "importtime",
+            "-c",
+            "import docformatter.__main__",
+        ],
+        capture_output=True,
+        env=environ,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+@pytest.mark.system
+def test_heavy_modules_are_deferred():
+    """Don't import modules only needed for some files or options."""
+    import_times = _get_import_times()
+
+    assert "docformatter.__main__" in import_times
+    assert [
+        name
+        for name in import_times
+        if name in DEFERRED_MODULES or name.startswith(DEFERRED_MODULES_PREFIXES)
+    ] == []
+
+
+@pytest.mark.system
+def test_startup_budget():
+    """Import docformatter.__main__ within the start up budget."""
+    # Take the best of a few runs so a busy machine doesn't fail the test.
+    startup_time = min(_get_import_times()["docformatter.__main__"] for _ in range(3))
+
+    assert startup_time <= STARTUP_BUDGET
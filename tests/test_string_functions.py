@@ -51,6 +51,7 @@ from docformatter.strings import (
     do_normalize_line_endings,
     do_normalize_summary,
     do_reindent,
+    do_splice_edits,
     do_split_description,
     do_split_first_sentence,
     do_split_summary,
@@ -86,6 +87,15 @@ def test_do_reindent(test_key, indentation):
     )
 
 
+@pytest.mark.unit
+def test_do_splice_edits():
+    """Replace, insert, and delete spans of text in one pass."""
+    assert (
+        do_splice_edits("abcdef", [(0, 1, "A"), (2, 2, "-"), (3, 5, "")]) == "Ab-cf"
+    )
+    assert do_splice_edits("abc", []) == "abc"
+
+
 @pytest.mark.unit
 def test_do_find_shortest_indentation():
     """Test the do_find_shorted_indentation function."""
@@ -30,6 +30,7 @@
 
 # Standard Library Imports
 import contextlib
+import os
 import sys
 
 with contextlib.suppress(ImportError):
@@ -44,7 +45,15 @@ with contextlib.suppress(ImportError):
 import pytest
 
 # docformatter Package Imports
-from docformatter.util import find_py_files, has_correct_length, is_in_range
+from docformatter.util import (
+    DocstringSelection,
+    LineRanges,
+    do_read_range_file,
+    find_py_files,
+    has_correct_length,
+    is_in_range,
+    is_in_ranges,
+)
 
 with open("tests/_data/string_files/utility_functions.toml", "rb") as f:
     TEST_STRINGS = tomllib.load(f)
@@ -102,6 +111,124 @@ def test_is_in_range(test_key):
     assert result == expected, f"\nFailed {test_key}\nExpected {expected}\nGot {result}"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "test_key",
+    [
+        "is_in_ranges_none",
+        "is_in_ranges_second_in_range",
+        "is_in_ranges_out_of_range",
+    ],
+)
+def test_is_in_ranges(test_key):
+    """Test is_in_ranges() function."""
+    line_ranges = TEST_STRINGS[test_key]["line_ranges"]
+    start = TEST_STRINGS[test_key]["start"]
+    end = TEST_STRINGS[test_key]["end"]
+    expected = TEST_STRINGS[test_key]["expected"]
+
+    if line_ranges == "None":
+        line_ranges = None
+
+    result = is_in_ranges(line_ranges, start, end)
+    assert result == expected, f"\nFailed {test_key}\nExpected {expected}\nGot {result}"
+
+
+@pytest.mark.unit
+def test_line_ranges_merged():
+    """Sort line ranges and merge the overlapping and adjacent ones."""
+    assert list(LineRanges([(20, 30), (1, 2), (3, 5), (25, 40), (8, 8)])) == [
+        (1, 5),
+        (8, 8),
+        (20, 40),
+    ]
+    assert list(LineRanges.from_range_argument([10, 12, 1, 3])) == [(1, 3), (10, 12)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (1, 4, False),
+        (4, 5, True),
+        (6, 9, False),
+        (7, 30, True),
+        (12, 19, True),
+        (21, 25, False),
+        (30, 99, True),
+        (101, 102, False),
+    ],
+)
+def test_line_ranges_is_overlapping(start, end, expected):
+    """Return True only when the rows touch one of the line ranges."""
+    uut = LineRanges([(5, 5), (10, 20), (26, 100)])
+
+    assert uut.is_overlapping(start, end) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (1, 1, False),
+        (1, 2, True),
+        (4, 6, False),
+        (9, 10, True),
+        (9, 12, False),
+        (20, 21, False),
+    ],
+)
+def test_docstring_selection(start, end, expected):
+    """Select docstrings of the right length touching every set of ranges."""
+    uut = DocstringSelection([1, 2, 10, 20], [2, 3], LineRanges([(1, 9)]))
+
+    assert uut.is_selected(start, end) == expected
+
+
+@pytest.mark.unit
+def test_docstring_selection_all():
+    """Select every docstring when nothing restricts the selection."""
+    assert DocstringSelection().is_selected(1, 1000)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("start, end, expected", [(1, 2, True), (10, 11, False)])
+def test_docstring_selection_with_line_ranges(start, end, expected):
+    """Select the same docstrings as a selection built with the line ranges."""
+    _selection = DocstringSelection([1, 2, 10, 20], [2, 3])
+    uut = _selection.with_line_ranges(LineRanges([(1, 9)]))
+
+    assert uut.is_selected(start, end) == expected
+    assert _selection.is_selected(10, 11)
+
+
+@pytest.mark.unit
+def test_do_read_range_file(tmp_path):
+    """Read the line ranges of each file keyed by absolute path."""
+    _range_file = tmp_path / "ranges.txt"
+    _range_file.write_text(
+        "# Ranges to format\nsrc/a.py:10-20\n\nsrc/a.py:3\nC:/b.py:7-9\n"
+    )
+
+    result = do_read_range_file(str(_range_file))
+
+    assert {_path: list(_ranges) for _path, _ranges in result.items()} == {
+        os.path.abspath("src/a.py"): [(3, 3), (10, 20)],
+        os.path.abspath("C:/b.py"): [(7, 9)],
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("line", ["src/a.py", "src/a.py:0-2", "src/a.py:9-3"])
+def test_do_read_range_file_invalid(tmp_path, line):
+    """Raise ValueError naming the line that isn't a path and range."""
+    _range_file = tmp_path / "ranges.txt"
+    _range_file.write_text(f"src/a.py:1\n{line}\n")
+
+    with pytest.raises(ValueError, match=f"ranges.txt:2: .*{line}"):
+        do_read_range_file(str(_range_file))
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "test_key, recursive",